@@ -1,3 +1,7 @@
+import json
+import logging
+import os
+
 import allure
 import pytest
 from selenium import webdriver
@@ -6,6 +10,46 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 
+from src.main.backend.helper.orangehrm_api_helper import OrangeHrmApiHelper
+from src.main.frontend.helper.action_log import ActionLog
+from src.main.frontend.helper.adaptive_wait_policy import AdaptiveWaitPolicy
+from src.main.frontend.helper.artifact_store import ArtifactStore
+from src.main.frontend.helper.config_helper import ConfigHelper
+from src.main.frontend.helper.command_recorder import CommandRecorder, CommandReport
+from src.main.frontend.helper.data_seeder import DataSeeder
+from src.main.frontend.helper.deadline import Deadline
+from src.main.frontend.helper.dom_snapshot import InteractionCounter
+from src.main.frontend.helper.driver_service_manager import DriverServiceManager
+from src.main.frontend.helper.fake_orangehrm import FakeOrangeHrm
+from src.main.frontend.helper.fixture_server import FixtureServer
+from src.main.frontend.helper.hub_scheduler import HubScheduler
+from src.main.frontend.helper.network_blocker import NetworkBlocker, NetworkBlockReport
+from src.main.frontend.helper.performance_collector import PerformanceCollector
+from src.main.frontend.helper.profile_template import ProfileTemplate
+from src.main.frontend.helper.remote_options import RemoteOptions
+from src.main.frontend.helper.session_prefetcher import SessionPrefetcher
+from src.main.frontend.helper.step_tracer import StepTracer
+from src.main.frontend.helper.worker_helper import WorkerHelper
+from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import LocatorStats
+from src.main.frontend.pages.login_page import LoginPage
+
+SNAPSHOTS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "src", "tests", "frontend", "snapshots"
+)
+LOCAL_DRIVERS = {
+    "chrome": webdriver.Chrome,
+    "firefox": webdriver.Firefox,
+    "edge": webdriver.Edge,
+}
+BUDGET_MARKERS = {
+    "webdriver_budget": ("command_recorder", "WebDriver budget exceeded"),
+    "page_performance": (
+        "performance_collector",
+        "Page performance thresholds exceeded",
+    ),
+}
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -28,6 +72,16 @@ def pytest_addoption(parser):
         default="http://localhost:4444/wd/hub",
         help="URL to the Selenoid executor",
     )
+    parser.addoption(
+        "--hubs",
+        default=None,
+        help="JSON file with several Selenoid hubs and their capacity, used instead of --selenium_url",
+    )
+    parser.addoption(
+        "--hub_report",
+        default="reports/hub_scheduler.json",
+        help="Path of the JSON report with queue wait and utilization per hub",
+    )
     parser.addoption(
         "--vnc",
         action="store_true",
@@ -48,110 +102,586 @@ def pytest_addoption(parser):
         default=None,
         help="Browser version to use in tests",
     )
+    parser.addoption(
+        "--webdriver_report",
+        default="reports/webdriver_commands.json",
+        help="Path of the JSON report with WebDriver command counts and timings",
+    )
+    parser.addoption(
+        "--block_assets",
+        default="",
+        help="Comma-separated asset categories to block in chrome/edge: "
+        + ", ".join(NetworkBlocker.URL_PATTERNS),
+    )
+    parser.addoption(
+        "--block_urls",
+        default="",
+        help="Comma-separated extra URL patterns to block in chrome/edge, e.g. *.png,*cdn.example.com*",
+    )
+    parser.addoption(
+        "--network_report",
+        default="reports/blocked_requests.json",
+        help="Path of the JSON report with requests blocked by --block_assets/--block_urls",
+    )
+    parser.addoption(
+        "--estimate_blocked_bytes",
+        action="store_true",
+        help="Estimate the bytes saved by blocking with one HEAD request per blocked URL "
+        "when --network_report is written; contacts the blocked hosts",
+    )
+    parser.addoption(
+        "--local_app",
+        action="store_true",
+        help="Serve the saved OrangeHRM snapshots locally and use them instead of --base_url",
+    )
+    parser.addoption(
+        "--artifacts_dir",
+        default="artifacts",
+        help="Directory of the content-addressed store for failure screenshots and page sources",
+    )
+    parser.addoption(
+        "--artifact_max_size",
+        type=int,
+        default=10_000_000,
+        help="Failure artifacts larger than this many bytes are not stored",
+    )
+    parser.addoption(
+        "--artifacts_max_total",
+        type=int,
+        default=500_000_000,
+        help="Stop storing failure artifacts once this many bytes were written in a run",
+    )
+    parser.addoption(
+        "--trace_steps",
+        type=int,
+        default=50,
+        help="Number of last page-object steps to keep and store when a test fails, 0 disables tracing",
+    )
+    parser.addoption(
+        "--trace_dom",
+        action="store_true",
+        help="Add the URL and a snippet of the element's HTML to every traced step",
+    )
+    parser.addoption(
+        "--prespawn",
+        type=int,
+        default=0,
+        help="Number of browser sessions to create in the background ahead of the tests using them",
+    )
+    parser.addoption(
+        "--locator_report",
+        default="reports/locator_stats.json",
+        help="Path of the JSON report with resolution time and failures per page-object locator",
+    )
+    parser.addoption(
+        "--test_deadline",
+        type=float,
+        default=0,
+        help="Time budget in seconds of each UI test that all page-object waits draw down from, "
+        "0 disables; the deadline marker overrides it per test",
+    )
+    parser.addoption(
+        "--adaptive_waits",
+        action="store_true",
+        help="Learn wait timeouts and poll intervals per locator from the waits of previous runs",
+    )
+    parser.addoption(
+        "--wait_history",
+        default=".wait_history.json",
+        help="JSON file with the observed time to ready per locator used by --adaptive_waits",
+    )
+    parser.addoption(
+        "--wait_report",
+        default="reports/adaptive_waits.json",
+        help="Path of the JSON report with the timeouts and polling used by --adaptive_waits",
+    )
+    parser.addoption(
+        "--driver_per_session",
+        action="store_true",
+        help="Start a new chromedriver/geckodriver/msedgedriver for every local session "
+        "instead of sharing one running service per worker",
+    )
+    parser.addoption(
+        "--action_log",
+        default="",
+        help="JSON lines file every page-object action is written to in the background, "
+        "e.g. reports/page_actions.jsonl; off unless given",
+    )
+    parser.addoption(
+        "--action_log_level",
+        default="INFO",
+        choices=("INFO", "WARNING"),
+        help="Lowest level of actions written to --action_log; WARNING keeps failed actions only",
+    )
+    parser.addoption(
+        "--warm_profile",
+        action="store_true",
+        help="Start local sessions from a copy of a browser profile whose cache already holds "
+        "the application's static assets, built once per run",
+    )
+    parser.addoption(
+        "--profile_dir",
+        default=".profile_cache",
+        help="Directory the --warm_profile templates and their per-session copies are kept in",
+    )
+    parser.addoption(
+        "--perf_metrics",
+        action="store_true",
+        help="Capture page performance metrics after navigations and key page-object actions",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Caps the number of xdist workers by the Selenoid capacity for remote runs."""
+    if not getattr(config.option, "numprocesses", None) or not config.option.remote:
+        return
+    capacity = remote_capacity(config)
+    if capacity:
+        config.option.maxprocesses = min(
+            capacity, config.option.maxprocesses or capacity
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """With -n auto, remote runs use as many workers as Selenoid has slots."""
+    if config.option.remote:
+        return remote_capacity(config)
+    return os.cpu_count()
+
+
+def remote_capacity(config):
+    """Returns how many sessions of the selected browser the configured hubs can run at once."""
+    if config.option.hubs:
+        return HubScheduler.from_file(config.option.hubs).capacity(
+            config.getoption("--browser"), config.getoption("--bv")
+        )
+    return WorkerHelper.selenoid_capacity(config.option.selenium_url)
+
+
+def pytest_configure(config):
+    config.command_report = CommandReport(
+        WorkerHelper.worker_path(config.getoption("--webdriver_report"))
+    )
+    try:
+        config.blocked_url_patterns = NetworkBlocker.resolve_patterns(
+            config.getoption("--block_assets"), config.getoption("--block_urls")
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    config.network_report = NetworkBlockReport(
+        WorkerHelper.worker_path(config.getoption("--network_report")),
+        config.getoption("--estimate_blocked_bytes"),
+    )
+    artifacts_dir = config.getoption("--artifacts_dir")
+    config.artifact_store = ArtifactStore(
+        artifacts_dir,
+        WorkerHelper.worker_path(os.path.join(artifacts_dir, "index.json")),
+        config.getoption("--artifact_max_size"),
+        config.getoption("--artifacts_max_total"),
+    )
+    config.fixture_server = None
+    if config.getoption("--local_app"):
+        config.fixture_server = FixtureServer(
+            ConfigHelper.get_key("ADMIN_LOGIN"),
+            ConfigHelper.get_key("ADMIN_PASSWORD"),
+            SNAPSHOTS_DIR,
+        ).start()
+        config.option.base_url = config.fixture_server.base_url
+    config.driver_services = None
+    if not config.getoption("--remote") and not config.getoption(
+        "--driver_per_session"
+    ):
+        config.driver_services = DriverServiceManager()
+    config.profile_template = None
+    if config.getoption("--warm_profile") and not config.getoption("--remote"):
+        profile_dir = config.getoption("--profile_dir")
+        if not hasattr(config, "workerinput"):
+            ProfileTemplate.reset(profile_dir)
+        config.profile_template = ProfileTemplate(
+            profile_dir,
+            [config.option.base_url.rstrip("/") + LoginPage.PAGE_PATH],
+            lambda browser_name, path: warm_up_session(config, browser_name, path),
+            lambda driver: stop_session(config, driver),
+        )
+    hubs = config.getoption("--hubs")
+    config.hub_scheduler = HubScheduler.from_file(hubs) if hubs else None
+    if config.getoption("--action_log"):
+        ActionLog.start(
+            WorkerHelper.worker_path(config.getoption("--action_log")),
+            logging.getLevelName(config.getoption("--action_log_level")),
+        )
+    config.wait_policies = {}
+
+
+def pytest_sessionfinish(session):
+    session.config.command_report.write()
+    session.config.network_report.write()
+    session.config.artifact_store.close()
+    ActionLog.stop()
+    LocatorStats.write(
+        WorkerHelper.worker_path(session.config.getoption("--locator_report"))
+    )
+    if session.config.fixture_server:
+        session.config.fixture_server.stop()
+    if session.config.driver_services:
+        session.config.driver_services.stop()
+    for wait_policy in session.config.wait_policies.values():
+        wait_policy.save()
+    AdaptiveWaitPolicy.write_report(
+        WorkerHelper.worker_path(session.config.getoption("--wait_report")),
+        session.config.wait_policies.values(),
+    )
+    if session.config.hub_scheduler:
+        session.config.hub_scheduler.write_report(
+            WorkerHelper.worker_path(session.config.getoption("--hub_report"))
+        )
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item):
     outcome = yield
     rep = outcome.get_result()
+    if rep.when == "call" and rep.passed:
+        check_budgets(item, rep)
     if rep.outcome != "passed":
         item.status = "failed"
     else:
         item.status = "passed"
 
 
-@pytest.fixture
-def browser(request):
-    browser_name = request.config.getoption("--browser")
-    base_url = request.config.getoption("--base_url")
-    remote = request.config.getoption("--remote")
-    selenium_url = request.config.getoption("--selenium_url")
-    vnc = request.config.getoption("--vnc")
-    version = request.config.getoption("--bv")
-    logs = request.config.getoption("--logs")
-    video = request.config.getoption("--video")
+def check_budgets(item, rep):
+    """Fails a passed test if it exceeded a budget declared by one of BUDGET_MARKERS."""
+    browser = item.funcargs.get("browser")
+    violations = []
+    for marker_name, (attribute, title) in BUDGET_MARKERS.items():
+        marker = item.get_closest_marker(marker_name)
+        checker = getattr(browser, attribute, None)
+        if marker is None or checker is None:
+            continue
+        try:
+            exceeded = checker.check_budget(**marker.kwargs)
+        except (TypeError, ValueError) as e:
+            exceeded = [f"invalid {marker_name} marker: {e}"]
+        if exceeded:
+            violations.append(f"{title}: " + "; ".join(exceeded))
+    if violations:
+        rep.outcome = "failed"
+        rep.longrepr = "\n".join(violations)
+
+
+def deadline_for(item):
+    """Returns the Deadline of a test from its deadline marker or --test_deadline, or None."""
+    marker = item.get_closest_marker("deadline")
+    seconds = marker.args[0] if marker else item.config.getoption("--test_deadline")
+    return Deadline(seconds) if seconds else None
+
+
+def start_session(config, browser_name, test_name):
+    """
+    Creates a browser session from the command line options.
+    Remote sessions started through the hub scheduler remember their hub in driver.hub.
+    """
+    remote = config.getoption("--remote")
+    selenium_url = config.getoption("--selenium_url")
+    vnc = config.getoption("--vnc")
+    version = config.getoption("--bv")
+    logs = config.getoption("--logs")
+    video = config.getoption("--video")
 
     driver = None
     options = None
+    hub = None
+    profile_dir = None
+    hub_scheduler = config.hub_scheduler
+    block_requests = bool(config.blocked_url_patterns) and NetworkBlocker.is_supported(
+        browser_name
+    )
 
     if remote:
-        if browser_name == "chrome":
-            options = ChromeOptions()
-        elif browser_name == "firefox":
-            options = FirefoxOptions()
-        elif browser_name == "edge":
-            options = EdgeOptions()
+        options = RemoteOptions.create(
+            browser_name, version, test_name, vnc, video, logs
+        )
+        if block_requests:
+            NetworkBlocker.enable_performance_log(options, browser_name)
+        if hub_scheduler:
+            driver, hub = hub_scheduler.acquire(browser_name, version, options)
         else:
-            raise ValueError(
-                f"Unsupported browser for remote execution: {browser_name}"
+            driver = RemoteWebDriver(command_executor=selenium_url, options=options)
+    else:
+        options = local_options(browser_name)
+        if block_requests:
+            NetworkBlocker.enable_performance_log(options, browser_name)
+        if config.profile_template:
+            profile_dir = config.profile_template.clone(browser_name)
+            ProfileTemplate.apply(options, browser_name, profile_dir)
+        driver = local_driver(config, browser_name, options)
+
+    driver.browser_name = browser_name
+    driver.hub = hub
+    driver.profile_dir = profile_dir
+    return driver
+
+
+def local_options(browser_name):
+    """Returns the options of a local headless browser."""
+    if browser_name == "chrome":
+        options = ChromeOptions()
+        options.add_argument("--no-sandbox")
+        options.add_argument("--headless")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--edge-skip-compat-layer-relaunch")
+        options.add_argument("--disable-gpu")
+    elif browser_name == "firefox":
+        options = FirefoxOptions()
+        options.add_argument("--no-sandbox")
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--headless")
+    elif browser_name == "edge":
+        options = EdgeOptions()
+        options.add_argument("--no-sandbox")
+        options.add_argument("--edge-skip-compat-layer-relaunch")
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--headless")
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+    return options
+
+
+def local_driver(config, browser_name, options):
+    """Opens a local session on the shared driver service, or with its own driver process."""
+    if config.driver_services:
+        return config.driver_services.create_session(browser_name, options)
+    return LOCAL_DRIVERS[browser_name](options=options)
+
+
+def warm_up_session(config, browser_name, profile_dir):
+    """
+    Starts the session that fills the cache of a profile template.
+    It is stopped with stop_session, which frees its driver service but keeps the profile.
+    """
+    options = local_options(browser_name)
+    ProfileTemplate.apply(options, browser_name, profile_dir)
+    driver = local_driver(config, browser_name, options)
+    driver.browser_name = browser_name
+    driver.hub = None
+    driver.profile_dir = None
+    return driver
+
+
+def stop_session(config, driver):
+    """
+    Quits a browser session and frees its hub slot, driver service and profile copy.
+    They are freed even if quit() fails, e.g. because the browser already crashed.
+    """
+    try:
+        driver.quit()
+    finally:
+        if config.driver_services:
+            config.driver_services.release(driver)
+        if driver.profile_dir:
+            ProfileTemplate.discard(driver.profile_dir)
+        if driver.hub:
+            config.hub_scheduler.finish(
+                driver, driver.hub, driver.browser_name, config.getoption("--bv")
             )
 
-        caps = {
-            "browserName": browser_name,
-            "browserVersion": version,
-            "selenoid:options": {
-                "enableVNC": vnc,
-                "name": request.node.name,
-                "screenResolution": "1280x2000",
-                "enableVideo": video,
-                "enableLog": logs,
-                "timeZone": "Europe/Moscow",
-                "env": ["LANG=ru_RU.UTF-8", "LANGUAGE=ru:en", "LC_ALL=ru_RU.UTF-8"],
-            },
-            "acceptInsecureCerts": True,
-        }
-
-        capabilities = options.to_capabilities()
-        capabilities.update(caps)
-        for k, v in caps.items():
-            options.set_capability(k, v)
-        driver = RemoteWebDriver(command_executor=selenium_url, options=options)
+
+def wait_policy_for(config, browser_name):
+    """
+    Returns the adaptive wait policy of the browser with --adaptive_waits, or None.
+    Local and remote runs and every remote browser version learn their own timings.
+    """
+    if not config.getoption("--adaptive_waits"):
+        return None
+    if config.getoption("--remote"):
+        environment = f"{browser_name}-remote-{config.getoption('--bv') or 'latest'}"
     else:
-        if browser_name == "chrome":
-            options = ChromeOptions()
-            options.add_argument("--no-sandbox")
-            options.add_argument("--headless")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--edge-skip-compat-layer-relaunch")
-            options.add_argument("--disable-gpu")
-            driver = webdriver.Chrome(options=options)
-
-        elif browser_name == "firefox":
-            options = FirefoxOptions()
-            options.add_argument("--no-sandbox")
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--headless")
-            driver = webdriver.Firefox(options=options)
-
-        elif browser_name == "edge":
-            options = EdgeOptions()
-            options.add_argument("--no-sandbox")
-            options.add_argument("--edge-skip-compat-layer-relaunch")
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--headless")
-            driver = webdriver.Edge(options=options)
-        else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
+        environment = f"{browser_name}-local"
+    if environment not in config.wait_policies:
+        config.wait_policies[environment] = AdaptiveWaitPolicy(
+            config.getoption("--wait_history"), environment
+        )
+    return config.wait_policies[environment]
+
+
+def browser_name_for(item):
+    """Returns the browser a test runs in: its `browser` parametrization or --browser."""
+    callspec = getattr(item, "callspec", None)
+    if callspec and "browser" in callspec.params:
+        return callspec.params["browser"]
+    return item.config.getoption("--browser")
+
+
+def session_key(config, browser_name):
+    """
+    Returns the options start_session() creates a session of a browser from, so that a
+    pre-spawned session is only handed to a test that would have started the same one.
+    """
+    return (
+        browser_name,
+        config.getoption("--bv"),
+        config.getoption("--remote"),
+        bool(config.blocked_url_patterns) and NetworkBlocker.is_supported(browser_name),
+        bool(config.profile_template),
+    )
+
+
+def upcoming_sessions(item):
+    """Returns (session key, test name) for the tests using the browser fixture after item."""
+    items = item.session.items
+    index = items.index(item)
+    return [
+        (session_key(item.config, browser_name_for(next_item)), next_item.name)
+        for next_item in items[index + 1 :]
+        if "browser" in next_item.fixturenames
+    ]
+
+
+@pytest.fixture(scope="session")
+def session_prefetcher(request):
+    """
+    Pre-spawns browser sessions for upcoming tests when --prespawn is greater than 0.
+    It is off in xdist workers: they get their tests one by one from the controller, so
+    the tests after the current one in the collection mostly run in other workers.
+    """
+    depth = request.config.getoption("--prespawn")
+    if depth and WorkerHelper.get_worker_id():
+        logging.getLogger(__name__).warning(
+            "--prespawn is ignored when the tests are distributed with -n"
+        )
+        depth = 0
+    if not depth:
+        yield None
+        return
+    prefetcher = SessionPrefetcher(
+        lambda key, test_name: start_session(request.config, key[0], test_name),
+        lambda driver: stop_session(request.config, driver),
+        depth,
+    )
+    yield prefetcher
+    prefetcher.close()
+
+
+@pytest.fixture
+def browser(request, session_prefetcher):
+    browser_name = getattr(request, "param", None) or request.config.getoption(
+        "--browser"
+    )
+    base_url = request.config.getoption("--base_url")
+
+    if session_prefetcher:
+        driver = session_prefetcher.acquire(
+            session_key(request.config, browser_name), request.node.name
+        )
+        session_prefetcher.prefetch(upcoming_sessions(request.node))
+    else:
+        driver = start_session(request.config, browser_name, request.node.name)
+
+    blocked_url_patterns = request.config.blocked_url_patterns
+    block_requests = bool(blocked_url_patterns) and NetworkBlocker.is_supported(
+        browser_name
+    )
 
     driver.base_url = base_url
+    driver.command_recorder = CommandRecorder(driver).install()
+    InteractionCounter(
+        driver,
+        BasePage.READ_ONLY_SCRIPTS | {PerformanceCollector.JS_COLLECT_METRICS},
+    ).install()
+    driver.wait_policy = wait_policy_for(request.config, browser_name)
+    driver.deadline = deadline_for(request.node)
+    if request.config.getoption("--perf_metrics") or request.node.get_closest_marker(
+        "page_performance"
+    ):
+        driver.performance_collector = PerformanceCollector(driver)
+    trace_steps = request.config.getoption("--trace_steps")
+    if trace_steps:
+        driver.step_tracer = StepTracer(
+            driver, trace_steps, request.config.getoption("--trace_dom")
+        )
+    network_blocker = None
+    if block_requests:
+        network_blocker = NetworkBlocker(
+            driver, browser_name, blocked_url_patterns
+        ).install()
     yield driver
 
-    if request.node.status == "failed":
+    if network_blocker:
+        network = network_blocker.collect()
+        request.config.network_report.add(request.node.nodeid, network)
         allure.attach(
-            name="failure_screenshot",
-            body=driver.get_screenshot_as_png(),
-            attachment_type=allure.attachment_type.PNG,
+            name="blocked_requests",
+            body=json.dumps(network, indent=2),
+            attachment_type=allure.attachment_type.JSON,
         )
-        allure.attach(
-            name="page_source",
-            body=driver.page_source,
-            attachment_type=allure.attachment_type.HTML,
+
+    summary = driver.command_recorder.summary(request.node.nodeid)
+    request.config.command_report.add(summary)
+    allure.attach(
+        name="webdriver_commands",
+        body=json.dumps(summary, indent=2),
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    if request.node.status == "failed":
+        artifact_store = request.config.artifact_store
+        artifact_store.save(
+            request.node.nodeid,
+            "failure_screenshot",
+            driver.get_screenshot_as_png(),
+            "png",
+        )
+        artifact_store.save(
+            request.node.nodeid, "page_source", driver.page_source, "html"
         )
+        if trace_steps:
+            artifact_store.save(
+                request.node.nodeid,
+                "step_trace",
+                driver.step_tracer.to_json(request.node.nodeid),
+                "json",
+            )
+
+    if session_prefetcher:
+        session_prefetcher.release(driver)
+    else:
+        stop_session(request.config, driver)
+
+
+@pytest.fixture(scope="session")
+def snapshots_dir():
+    """Directory with the saved OrangeHRM HTML snapshots and their routes."""
+    return SNAPSHOTS_DIR
 
-    driver.quit()
+
+@pytest.fixture
+def fake_browser(request, snapshots_dir):
+    """In-memory WebDriver serving saved OrangeHRM snapshots for offline page-object tests."""
+    driver = FakeOrangeHrm.create_driver(
+        request.config.getoption("--base_url"),
+        ConfigHelper.get_key("ADMIN_LOGIN"),
+        ConfigHelper.get_key("ADMIN_PASSWORD"),
+        snapshots_dir,
+    )
+    driver.deadline = deadline_for(request.node)
+    return driver
+
+
+@pytest.fixture
+def data_seeder(browser):
+    """
+    Seeds employees, candidates and users through the OrangeHRM API with the session of the
+    browser, which has to be logged in before the first record is created.
+    Everything seeded is deleted after the test.
+    """
+    seeder = DataSeeder(OrangeHrmApiHelper(browser.base_url), browser)
+    yield seeder
+    seeder.cleanup()
@@ -0,0 +1,105 @@
+import json
+import urllib.parse
+from typing import List
+
+from src.main.backend.helper.req_res_api_helper import BaseApiHelper
+from src.main.backend.model.orangehrm.orangehrm_model import (
+    CandidateRequestBody,
+    EmployeeRequestBody,
+    SystemUserRequestBody,
+)
+
+
+class OrangeHrmApiHelper(BaseApiHelper):
+    """Helper class for the OrangeHRM API v2 used by the web application itself."""
+
+    API_PATH = "/web/index.php/api/v2"
+
+    def __init__(self, base_url: str):
+        """
+        :param base_url: Any URL of the OrangeHRM instance, e.g. the login page used as --base_url.
+        """
+        super().__init__()
+        parsed = urllib.parse.urlparse(base_url)
+        self.BASE_URL = f"{parsed.scheme}://{parsed.netloc}{self.API_PATH}"
+
+    def use_browser_session(self, browser) -> None:
+        """
+        Reuses the session of a browser logged in to OrangeHRM by copying its cookies.
+
+        :param browser: WebDriver whose current page belongs to the OrangeHRM instance
+        """
+        for cookie in browser.get_cookies():
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def create_employee(self, body: EmployeeRequestBody):
+        """
+        Create an employee.
+
+        :param body: Employee data
+        :return: Response object from POST /pim/employees
+        """
+        return self.request("POST", "pim/employees", data=body.to_json())
+
+    def get_employee(self, emp_number: int):
+        """
+        Retrieve an employee by number.
+
+        :param emp_number: Employee number returned when the employee was created
+        :return: Response object from GET /pim/employees/{emp_number}
+        """
+        return self.request("GET", f"pim/employees/{emp_number}")
+
+    def delete_employees(self, emp_numbers: List[int]):
+        """
+        Delete several employees at once.
+
+        :param emp_numbers: Employee numbers to delete
+        :return: Response object from DELETE /pim/employees
+        """
+        return self.request(
+            "DELETE", "pim/employees", data=json.dumps({"ids": emp_numbers})
+        )
+
+    def create_candidate(self, body: CandidateRequestBody):
+        """
+        Create a recruitment candidate.
+
+        :param body: Candidate data
+        :return: Response object from POST /recruitment/candidates
+        """
+        return self.request("POST", "recruitment/candidates", data=body.to_json())
+
+    def delete_candidates(self, candidate_ids: List[int]):
+        """
+        Delete several candidates at once.
+
+        :param candidate_ids: Candidate ids to delete
+        :return: Response object from DELETE /recruitment/candidates
+        """
+        return self.request(
+            "DELETE", "recruitment/candidates", data=json.dumps({"ids": candidate_ids})
+        )
+
+    def create_user(self, body: SystemUserRequestBody):
+        """
+        Create a system user for an employee.
+
+        :param body: User data
+        :return: Response object from POST /admin/users
+        """
+        return self.request("POST", "admin/users", data=body.to_json())
+
+    def delete_users(self, user_ids: List[int]):
+        """
+        Delete several system users at once.
+
+        :param user_ids: User ids to delete
+        :return: Response object from DELETE /admin/users
+        """
+        return self.request("DELETE", "admin/users", data=json.dumps({"ids": user_ids}))
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+
+class OrangeHrmRequestBody(BaseModel):
+    """Base model for OrangeHRM API v2 request bodies, serialized with camelCase keys."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    def to_json(self) -> str:
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+
+
+class EmployeeRequestBody(OrangeHrmRequestBody):
+    """Request model for creating an employee."""
+
+    first_name: str
+    last_name: str
+    middle_name: Optional[str] = None
+    employee_id: Optional[str] = None
+
+
+class CandidateRequestBody(OrangeHrmRequestBody):
+    """Request model for creating a recruitment candidate."""
+
+    first_name: str
+    last_name: str
+    email: str
+    middle_name: Optional[str] = None
+    date_of_application: Optional[str] = None
+    consent_to_keep_data: bool = False
+    vacancy_id: Optional[int] = None
+
+
+class SystemUserRequestBody(OrangeHrmRequestBody):
+    """Request model for creating a system user for an employee."""
+
+    username: str
+    password: str
+    emp_number: int
+    user_role_id: int = 2
+    status: bool = True
@@ -0,0 +1,155 @@
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats a log record as one JSON object per line with the structured fields of an action."""
+
+    FIELDS = ("test", "action", "locator", "duration_ms", "outcome", "result")
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in self.FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that puts records on the queue as they are, so that the message is
+    only built with its %-arguments on the listener thread, when it is written.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class ActionLog:
+    """
+    Writes page-object actions as JSON lines with the test id, action, locator name, duration
+    and outcome. The test thread only checks the level and puts the record on a queue;
+    formatting and file I/O happen on a background thread of a QueueListener. Nothing is
+    recorded until start() is called.
+    """
+
+    logger = logging.getLogger("page_actions")
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _handler: Optional[logging.Handler] = None
+
+    @staticmethod
+    def start(path: str, level: int = logging.INFO) -> None:
+        """
+        Starts writing actions at or above the level to a JSON lines file.
+
+        :param path: File the actions are appended to.
+        :param level: Level of ok actions is INFO, failed actions are logged as WARNING.
+        """
+        ActionLog.stop()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        file_handler = logging.FileHandler(path, encoding="utf-8")
+        file_handler.setFormatter(JsonLinesFormatter())
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        ActionLog._handler = LazyQueueHandler(records)
+        ActionLog._listener = logging.handlers.QueueListener(records, file_handler)
+        ActionLog._listener.start()
+        ActionLog.logger.propagate = False
+        ActionLog.logger.addHandler(ActionLog._handler)
+        ActionLog.logger.setLevel(level)
+
+    @staticmethod
+    def stop() -> None:
+        """Writes the queued actions and closes the file."""
+        if ActionLog._listener is None:
+            return
+        ActionLog.logger.removeHandler(ActionLog._handler)
+        ActionLog._listener.stop()
+        for handler in ActionLog._listener.handlers:
+            handler.close()
+        ActionLog._listener = None
+        ActionLog._handler = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Checks whether any action, at least a failed one, would be written."""
+        return ActionLog._listener is not None and ActionLog.logger.isEnabledFor(
+            logging.WARNING
+        )
+
+    @staticmethod
+    def record(
+        action: str,
+        locator: Optional[str],
+        started: float,
+        outcome: str,
+        result: Any = None,
+    ) -> None:
+        """
+        Logs a finished action; nothing is built unless its level is enabled.
+
+        :param started: time.perf_counter() when the action started.
+        """
+        level = logging.INFO if outcome == "ok" else logging.WARNING
+        if ActionLog._listener is None or not ActionLog.logger.isEnabledFor(level):
+            return
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        locator = getattr(locator, "name", None) or locator
+        ActionLog.logger.log(
+            level,
+            "%s %s: %s in %s ms",
+            action,
+            locator,
+            outcome,
+            duration_ms,
+            extra={
+                "test": os.getenv("PYTEST_CURRENT_TEST"),
+                "action": action,
+                "locator": locator,
+                "duration_ms": duration_ms,
+                "outcome": outcome,
+                "result": result,
+            },
+        )
+
+    @staticmethod
+    def summarize(path: str) -> List[Dict[str, Any]]:
+        """
+        Aggregates the durations of an action log per action and locator, slowest total first.
+        """
+        durations: Dict[tuple, List[float]] = {}
+        failures: Dict[tuple, int] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if "action" not in entry:
+                    continue
+                key = (entry["action"], entry.get("locator"))
+                durations.setdefault(key, []).append(entry["duration_ms"])
+                failures[key] = failures.get(key, 0) + (entry["outcome"] != "ok")
+        rows = [
+            {
+                "action": action,
+                "locator": locator,
+                "calls": len(samples),
+                "failures": failures[(action, locator)],
+                "total_ms": round(sum(samples), 1),
+                "p50_ms": round(statistics.median(samples), 1),
+                "max_ms": max(samples),
+            }
+            for (action, locator), samples in durations.items()
+        ]
+        return sorted(rows, key=lambda row: -row["total_ms"])
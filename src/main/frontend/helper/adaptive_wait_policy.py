@@ -0,0 +1,226 @@
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+
+class AdaptiveWait(WebDriverWait):
+    """
+    A WebDriverWait that polls at the given sequence of intervals instead of a fixed frequency,
+    never sleeping past its timeout.
+    """
+
+    def __init__(self, driver: WebDriver, timeout: float, intervals: List[float]):
+        super().__init__(driver, timeout, poll_frequency=intervals[-1])
+        self.intervals = intervals
+
+    def _sleeps(self) -> Iterator[float]:
+        yield from self.intervals
+        while True:
+            yield self.intervals[-1]
+
+    def until(self, method: Callable, message: str = "") -> Any:
+        screen = None
+        stacktrace = None
+        end_time = time.monotonic() + self._timeout
+        sleeps = self._sleeps()
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(next(sleeps), remaining))
+        raise TimeoutException(message, screen, stacktrace)
+
+
+class AdaptiveWaitPolicy:
+    """
+    Learns how long each locator takes to become ready from the waits of previous runs,
+    kept in a small JSON history file with one section per environment (browser, local or
+    remote). Locators with enough samples get a timeout at a high percentile of their
+    observed times plus a margin, and poll intervals that start tight and grow
+    exponentially, so fast elements are picked up quickly and slow ones don't flake.
+    Only successful waits are observed, so a learned timeout never goes below the caller's
+    timeout: it can only give slow locators more time.
+    Locators without enough history use the caller's timeout and the default polling.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        history_path: str,
+        environment: str = "default",
+        percentile: float = 0.95,
+        margin_factor: float = 1.5,
+        margin_seconds: float = 1.0,
+        max_timeout: float = 30.0,
+        min_samples: int = 5,
+        max_samples: int = 200,
+        first_poll: float = 0.05,
+        max_poll: float = 0.5,
+    ):
+        """
+        :param history_path: JSON file with the observed times per locator, shared across runs.
+        :param environment: Section of the history file, e.g. chrome-local, so that times
+            observed in one browser or on one hub are not used for another.
+        :param percentile: Percentile of the observed times the timeout is based on.
+        :param margin_factor: The percentile is multiplied by this factor...
+        :param margin_seconds: ...and this many seconds are added.
+        :param max_timeout: Upper bound of learned timeouts in seconds.
+        :param min_samples: Number of observations needed before a locator's timeout is learned.
+        :param max_samples: Number of most recent observations kept per locator.
+        :param first_poll: Shortest poll interval in seconds.
+        :param max_poll: Longest poll interval in seconds.
+        """
+        self.history_path = history_path
+        self.environment = environment
+        self.percentile = percentile
+        self.margin_factor = margin_factor
+        self.margin_seconds = margin_seconds
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.first_poll = first_poll
+        self.max_poll = max_poll
+        self.history = self._section(self._load())
+        self.observed: Dict[str, List[float]] = {}
+        self.timeouts: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, List[float]]]:
+        try:
+            with open(self.history_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _section(
+        self, history: Dict[str, Dict[str, List[float]]]
+    ) -> Dict[str, List[float]]:
+        section = history.get(self.environment)
+        return section if isinstance(section, dict) else {}
+
+    @staticmethod
+    def key(locator: str) -> str:
+        return getattr(locator, "name", None) or str(locator)
+
+    def samples(self, locator: str) -> List[float]:
+        key = self.key(locator)
+        return self.history.get(key, []) + self.observed.get(key, [])
+
+    def _quantile(self, samples: List[float], quantile: float) -> float:
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+    def timeout_for(self, locator: str, default: float) -> float:
+        """
+        Returns the learned timeout for the locator, or the default without enough history.
+        The learned timeout is never shorter than the default.
+        """
+        samples = self.samples(locator)
+        if len(samples) < self.min_samples:
+            return default
+        learned = (
+            self._quantile(samples, self.percentile) * self.margin_factor
+            + self.margin_seconds
+        )
+        timeout = round(max(default, min(self.max_timeout, learned)), 2)
+        self.timeouts[self.key(locator)] = timeout
+        return timeout
+
+    def poll_intervals(self, locator: str) -> List[float]:
+        """
+        Returns the poll intervals for the locator: starting at a fraction of its typical
+        time to ready and doubling up to max_poll.
+        """
+        samples = self.samples(locator)
+        if len(samples) < self.min_samples:
+            return [self.max_poll]
+        first = min(self.max_poll, max(self.first_poll, statistics.median(samples) / 4))
+        intervals = [first]
+        while intervals[-1] < self.max_poll:
+            intervals.append(min(self.max_poll, intervals[-1] * 2))
+        return intervals
+
+    def wait(
+        self,
+        driver: WebDriver,
+        locator: Optional[str],
+        timeout: float,
+        poll: Optional[float] = None,
+    ) -> WebDriverWait:
+        """
+        Returns a wait for the locator polling at the learned intervals, or every `poll` seconds.
+        """
+        if poll is not None or locator is None:
+            return WebDriverWait(driver, timeout, poll_frequency=poll or self.max_poll)
+        return AdaptiveWait(driver, timeout, self.poll_intervals(locator))
+
+    def record(self, locator: str, seconds: float) -> None:
+        """Records how long the locator took to become ready."""
+        with self._lock:
+            self.observed.setdefault(self.key(locator), []).append(round(seconds, 3))
+
+    def save(self) -> None:
+        """
+        Merges this run's observations into the history file, keeping the most recent
+        max_samples per locator. The file is re-read first so that parallel workers
+        don't overwrite each other's samples.
+        """
+        if not self.observed:
+            return
+        history = self._load()
+        section = history[self.environment] = self._section(history)
+        for key, samples in self.observed.items():
+            section[key] = (section.get(key, []) + samples)[-self.max_samples :]
+        os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+        temp_path = f"{self.history_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(history, f)
+        os.replace(temp_path, self.history_path)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Returns the observed times and the timeout and polling used per locator in this run."""
+        rows = []
+        for key, observed in self.observed.items():
+            samples = self.samples(key)
+            rows.append(
+                {
+                    "environment": self.environment,
+                    "locator": key,
+                    "waits": len(observed),
+                    "history_samples": len(samples),
+                    "p50_s": round(statistics.median(samples), 3),
+                    "p95_s": round(self._quantile(samples, 0.95), 3),
+                    "max_observed_s": max(observed),
+                    "timeout_s": self.timeouts.get(key),
+                    "poll_intervals_s": self.poll_intervals(key),
+                }
+            )
+        return sorted(rows, key=lambda row: -row["p95_s"])
+
+    @staticmethod
+    def write_report(
+        path: Optional[str], policies: Iterable["AdaptiveWaitPolicy"]
+    ) -> None:
+        """Writes the reports of the policies of all environments used in the run."""
+        rows = [row for policy in policies for row in policy.report()]
+        if not path or not rows:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=2)
@@ -0,0 +1,135 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import allure
+
+
+class ArtifactStore:
+    """
+    Content-addressed store for failure artifacts such as screenshots and page sources.
+    Artifacts are hashed when captured and a reference to their file in the store is
+    attached to allure once per artifact; HTML minification, compression and writing
+    happen on a background thread.
+    Identical artifacts, e.g. the same page source across retries and parametrizations,
+    are stored once under <root>/<sha[:2]>/<sha>.<ext>.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    HTML_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+    HTML_WHITESPACE = re.compile(r">\s+<")
+    EXTENSIONS = {"png": "png", "html": "html.gz", "json": "json.gz"}
+
+    def __init__(
+        self,
+        root: str,
+        index_path: str,
+        max_artifact_bytes: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+    ):
+        """
+        :param root: Directory of the store, shared by all workers.
+        :param index_path: Path of the JSON index with the artifacts of this run.
+        :param max_artifact_bytes: Artifacts larger than this (before compression) are not stored.
+        :param max_total_bytes: Once this many bytes were written in this run, new artifacts are not stored.
+        """
+        self.root = root
+        self.index_path = index_path
+        self.max_artifact_bytes = max_artifact_bytes
+        self.max_total_bytes = max_total_bytes
+        self.index: Dict[str, List[Dict[str, Any]]] = {}
+        self.total_bytes = 0
+        self._known: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="artifact-store"
+        )
+
+    @staticmethod
+    def minify_html(html: str) -> str:
+        """Strips comments and the whitespace between tags."""
+        html = ArtifactStore.HTML_COMMENT.sub("", html)
+        return ArtifactStore.HTML_WHITESPACE.sub("><", html).strip()
+
+    def path_for(self, sha: str, kind: str) -> str:
+        return os.path.join(self.root, sha[:2], f"{sha}.{self.EXTENSIONS[kind]}")
+
+    def save(self, test: str, name: str, data: Any, kind: str) -> Dict[str, Any]:
+        """
+        Queues an artifact for writing and attaches its location to allure.
+        :param test: Node id of the test the artifact belongs to.
+        :param name: Name of the artifact, e.g. failure_screenshot.
+        :param data: Bytes for png, text for html and json.
+        :param kind: One of EXTENSIONS.
+        :return: The index entry of the artifact.
+        """
+        raw = data.encode() if isinstance(data, str) else data
+        sha = hashlib.sha256(raw).hexdigest()
+        path = self.path_for(sha, kind)
+        entry = {"name": name, "sha256": sha, "path": path, "size": len(raw)}
+        queued = False
+
+        with self._lock:
+            if sha in self._known:
+                entry["deduplicated"] = True
+            elif self.max_artifact_bytes and len(raw) > self.max_artifact_bytes:
+                entry["skipped"] = f"larger than {self.max_artifact_bytes} bytes"
+            elif self.max_total_bytes and self.total_bytes >= self.max_total_bytes:
+                entry["skipped"] = (
+                    f"store limit of {self.max_total_bytes} bytes reached"
+                )
+            else:
+                self._known[sha] = self._executor.submit(self._write, path, raw, kind)
+                queued = True
+            self.index.setdefault(test, []).append(entry)
+
+        # Duplicates and skipped artifacts are listed in the index only
+        if queued:
+            allure.attach(
+                name=name, body=path, attachment_type=allure.attachment_type.URI_LIST
+            )
+        elif "skipped" in entry:
+            self.logger.warning(
+                f"Artifact {name} of {test} not stored: {entry['skipped']}"
+            )
+        return entry
+
+    def _write(self, path: str, raw: bytes, kind: str) -> int:
+        if os.path.exists(path):
+            return 0
+        if kind == "html":
+            raw = self.minify_html(raw.decode(errors="replace")).encode()
+        if kind != "png":
+            raw = gzip.compress(raw, compresslevel=6)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Workers share the store, so write to a temporary file and rename atomically
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(raw)
+        os.replace(temporary, path)
+        with self._lock:
+            self.total_bytes += len(raw)
+        return len(raw)
+
+    def close(self) -> None:
+        """Waits for pending writes and writes the index of this run."""
+        self._executor.shutdown(wait=True)
+        for sha, future in self._known.items():
+            if future.exception():
+                self.logger.warning(
+                    f"Failed to store artifact {sha}: {future.exception()}"
+                )
+        if not self.index:
+            return
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        with open(self.index_path, "w") as f:
+            json.dump(
+                {"stored_bytes": self.total_bytes, "tests": self.index}, f, indent=2
+            )
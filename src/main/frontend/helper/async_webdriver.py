@@ -0,0 +1,245 @@
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import aiohttp
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+
+class AsyncWebElement:
+    """An element of an AsyncWebDriver session, referenced by its W3C element id."""
+
+    def __init__(self, driver: "AsyncWebDriver", element_id: str):
+        self.driver = driver
+        self.id = element_id
+
+    def _path(self, command: str = "") -> str:
+        return f"/element/{self.id}{command}"
+
+    async def click(self) -> None:
+        await self.driver.execute("POST", self._path("/click"), {})
+
+    async def clear(self) -> None:
+        await self.driver.execute("POST", self._path("/clear"), {})
+
+    async def send_keys(self, text: str) -> None:
+        await self.driver.execute("POST", self._path("/value"), {"text": text})
+
+    async def text(self) -> str:
+        return await self.driver.execute("GET", self._path("/text"))
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return await self.driver.execute("GET", self._path(f"/attribute/{name}"))
+
+    async def find_elements(self, by: str, value: str) -> List["AsyncWebElement"]:
+        return await self.driver.execute(
+            "POST", self._path("/elements"), {"using": by, "value": value}
+        )
+
+    def __repr__(self) -> str:
+        return f"<AsyncWebElement {self.id}>"
+
+
+class AsyncWebDriver:
+    """
+    A WebDriver client speaking the W3C protocol over aiohttp, so that one event loop can
+    drive many sessions at once: every command is awaited instead of blocking a thread on
+    HTTP. It covers the commands the page objects use (navigation, finding, clicking,
+    typing, scripts); errors are raised as the same Selenium exceptions as the sync client.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+    def __init__(
+        self,
+        http: aiohttp.ClientSession,
+        executor_url: str,
+        session_id: str,
+        capabilities: Dict[str, Any],
+    ):
+        """
+        :param http: HTTP session the commands are sent with, shared by many drivers.
+        :param executor_url: URL of the WebDriver server or hub, e.g. http://localhost:4444/wd/hub.
+        :param session_id: Id of the created browser session.
+        :param capabilities: Capabilities returned by the server for the session.
+        """
+        self.http = http
+        self.executor_url = executor_url.rstrip("/")
+        self.session_id = session_id
+        self.capabilities = capabilities
+        self.base_url: Optional[str] = None
+
+    @staticmethod
+    async def _request(
+        http: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        async with http.request(
+            method,
+            url,
+            data=None if payload is None else json.dumps(payload),
+            headers={"Content-Type": "application/json; charset=utf-8"},
+        ) as response:
+            body = await response.text()
+        if response.status >= 300:
+            ErrorHandler().check_response({"status": response.status, "value": body})
+        return json.loads(body)["value"] if body else None
+
+    @classmethod
+    async def create(
+        cls,
+        http: aiohttp.ClientSession,
+        executor_url: str,
+        options: ArgOptions,
+    ) -> "AsyncWebDriver":
+        """Opens a new browser session with the capabilities of the options."""
+        value = await cls._request(
+            http,
+            "POST",
+            f"{executor_url.rstrip('/')}/session",
+            {
+                "capabilities": {
+                    "alwaysMatch": options.to_capabilities(),
+                    "firstMatch": [{}],
+                }
+            },
+        )
+        return cls(
+            http, executor_url, value["sessionId"], value.get("capabilities", {})
+        )
+
+    def _wrap(self, value: Any) -> Any:
+        """Turns element references of a response into AsyncWebElements."""
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            if self.ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[self.ELEMENT_KEY])
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value: Any) -> Any:
+        """Turns AsyncWebElements of script arguments into element references."""
+        if isinstance(value, AsyncWebElement):
+            return {self.ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._unwrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._unwrap(item) for key, item in value.items()}
+        return value
+
+    async def execute(
+        self, method: str, command: str, payload: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Sends a command of the session, e.g. ("POST", "/url", {"url": ...})."""
+        value = await self._request(
+            self.http,
+            method,
+            f"{self.executor_url}/session/{self.session_id}{command}",
+            payload,
+        )
+        return self._wrap(value)
+
+    async def get(self, url: str) -> None:
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self) -> str:
+        return await self.execute("GET", "/url")
+
+    async def title(self) -> str:
+        return await self.execute("GET", "/title")
+
+    async def page_source(self) -> str:
+        return await self.execute("GET", "/source")
+
+    async def find_elements(self, by: str, value: str) -> List[AsyncWebElement]:
+        return await self.execute("POST", "/elements", {"using": by, "value": value})
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        elements = await self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {value}")
+        return elements[0]
+
+    async def execute_script(self, script: str, *args: Any) -> Any:
+        return await self.execute(
+            "POST", "/execute/sync", {"script": script, "args": self._unwrap(args)}
+        )
+
+    async def execute_async_script(self, script: str, *args: Any) -> Any:
+        return await self.execute(
+            "POST", "/execute/async", {"script": script, "args": self._unwrap(args)}
+        )
+
+    async def quit(self) -> None:
+        await self._request(
+            self.http, "DELETE", f"{self.executor_url}/session/{self.session_id}"
+        )
+
+
+class AsyncSessionRunner:
+    """
+    Runs a flow for every item of a data set, each in its own browser session, with at
+    most `concurrency` sessions open at a time, all from one event loop.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        executor_url: str,
+        options_factory: Callable[[], ArgOptions],
+        concurrency: int = 4,
+        base_url: Optional[str] = None,
+    ):
+        """
+        :param executor_url: URL of the WebDriver server or hub.
+        :param options_factory: Returns the options of a new session.
+        :param concurrency: Maximum number of sessions open at once.
+        :param base_url: Set as driver.base_url of every session.
+        """
+        self.executor_url = executor_url
+        self.options_factory = options_factory
+        self.concurrency = concurrency
+        self.base_url = base_url
+
+    async def run(
+        self,
+        flow: Callable[[AsyncWebDriver, Any], Awaitable[Any]],
+        items: Iterable[Any],
+    ) -> List[Any]:
+        """
+        Returns the result of the flow per item in the order of the items, or the exception
+        the flow raised for it.
+        """
+        slots = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency * 2)
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+
+            async def run_one(item: Any) -> Any:
+                async with slots:
+                    driver = await AsyncWebDriver.create(
+                        http, self.executor_url, self.options_factory()
+                    )
+                    driver.base_url = self.base_url
+                    try:
+                        return await flow(driver, item)
+                    finally:
+                        try:
+                            await driver.quit()
+                        except Exception as e:
+                            self.logger.warning(
+                                f"Failed to quit session {driver.session_id}: {e}"
+                            )
+
+            return await asyncio.gather(
+                *(run_one(item) for item in items), return_exceptions=True
+            )
@@ -0,0 +1,165 @@
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+PAGES_PACKAGE = "src.main.frontend.pages"
+BASE_PAGE_MODULE = "src.main.frontend.pages.base_page"
+
+
+class CommandRecorder:
+    """
+    Wraps the command executor of a WebDriver and records every W3C command sent through it.
+    Each command is counted and timed per command name, per page-object method that issued it
+    and per BasePage helper it went through.
+    """
+
+    def __init__(self, browser: WebDriver):
+        self.browser = browser
+        self.records: List[Dict[str, Any]] = []
+        self._original_execute = None
+
+    def install(self) -> "CommandRecorder":
+        """Replaces the executor's execute method with a timing wrapper."""
+        executor = self.browser.command_executor
+        if self._original_execute is not None:
+            return self
+        self._original_execute = executor.execute
+
+        def execute(command, params):
+            started = time.perf_counter()
+            try:
+                return self._original_execute(command, params)
+            finally:
+                self._record(command, time.perf_counter() - started)
+
+        executor.execute = execute
+        return self
+
+    def uninstall(self) -> None:
+        """Restores the original executor method."""
+        if self._original_execute is not None:
+            self.browser.command_executor.execute = self._original_execute
+            self._original_execute = None
+
+    def reset(self) -> None:
+        """Drops everything recorded so far."""
+        self.records.clear()
+
+    def _record(self, command: str, duration: float) -> None:
+        page_method, helper = self._find_callers(sys._getframe(2))
+        self.records.append(
+            {
+                "command": command,
+                "page_method": page_method,
+                "helper": helper,
+                "seconds": duration,
+            }
+        )
+
+    @staticmethod
+    def _find_callers(frame) -> tuple:
+        """
+        Walks the stack and returns the outermost page-object method and the innermost
+        BasePage helper that led to the command.
+        """
+        page_method = None
+        helper = None
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith(PAGES_PACKAGE):
+                name = frame.f_code.co_qualname
+                if "<" not in name:
+                    page_method = name
+                    if helper is None and module == BASE_PAGE_MODULE:
+                        helper = name
+            frame = frame.f_back
+        return page_method or "<test>", helper or "<direct>"
+
+    @property
+    def total_commands(self) -> int:
+        return len(self.records)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(record["seconds"] for record in self.records)
+
+    def _group_by(self, key: str) -> Dict[str, Dict[str, float]]:
+        groups: Dict[str, Dict[str, float]] = {}
+        for record in self.records:
+            group = groups.setdefault(record[key], {"count": 0, "seconds": 0.0})
+            group["count"] += 1
+            group["seconds"] += record["seconds"]
+        return dict(
+            sorted(groups.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        )
+
+    def summary(self, test_name: str) -> Dict[str, Any]:
+        """Returns the recorded data aggregated for a single test."""
+        return {
+            "test": test_name,
+            "commands": self.total_commands,
+            "seconds": round(self.total_seconds, 4),
+            "by_command": self._group_by("command"),
+            "by_page_method": self._group_by("page_method"),
+            "by_helper": self._group_by("helper"),
+        }
+
+    def check_budget(
+        self, commands: Optional[int] = None, seconds: Optional[float] = None
+    ) -> List[str]:
+        """
+        Compares the recorded data with a round-trip budget.
+        Returns a list of human-readable violations, empty if the budget is respected.
+        """
+        violations = []
+        if commands is not None and self.total_commands > commands:
+            violations.append(
+                f"{self.total_commands} WebDriver commands sent, budget is {commands}"
+            )
+        if seconds is not None and self.total_seconds > seconds:
+            violations.append(
+                f"{self.total_seconds:.2f}s spent in WebDriver commands, budget is {seconds}s"
+            )
+        return violations
+
+
+class CommandReport:
+    """Collects per-test command summaries and writes them to a single JSON report."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.tests: List[Dict[str, Any]] = []
+
+    def add(self, summary: Dict[str, Any]) -> None:
+        self.tests.append(summary)
+
+    def _merge(self, key: str) -> Dict[str, Dict[str, float]]:
+        merged: Dict[str, Dict[str, float]] = {}
+        for test in self.tests:
+            for name, values in test[key].items():
+                group = merged.setdefault(name, {"count": 0, "seconds": 0.0})
+                group["count"] += values["count"]
+                group["seconds"] += values["seconds"]
+        return dict(
+            sorted(merged.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        )
+
+    def write(self) -> None:
+        """Writes the report if a path is configured and at least one test was recorded."""
+        if not self.path or not self.tests:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        report = {
+            "commands": sum(test["commands"] for test in self.tests),
+            "seconds": round(sum(test["seconds"] for test in self.tests), 4),
+            "by_command": self._merge("by_command"),
+            "by_page_method": self._merge("by_page_method"),
+            "by_helper": self._merge("by_helper"),
+            "tests": self.tests,
+        }
+        with open(self.path, "w") as f:
+            json.dump(report, f, indent=2)
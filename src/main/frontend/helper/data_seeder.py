@@ -0,0 +1,149 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import allure
+import requests
+from faker import Faker
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.main.backend.helper.orangehrm_api_helper import OrangeHrmApiHelper
+from src.main.backend.model.orangehrm.orangehrm_model import (
+    CandidateRequestBody,
+    EmployeeRequestBody,
+    SystemUserRequestBody,
+)
+from src.main.frontend.helper.worker_helper import WorkerHelper
+
+
+class DataSeeder:
+    """
+    Creates test preconditions (employees, candidates, users) through the OrangeHRM API
+    instead of the UI, reusing the session of a logged-in browser, and deletes everything
+    it created on cleanup. Fields not given are generated with Faker.
+    """
+
+    logger = logging.getLogger(__name__)
+    fake = Faker()
+
+    def __init__(
+        self,
+        api: OrangeHrmApiHelper,
+        browser: Optional[WebDriver] = None,
+        workers: int = 4,
+    ):
+        """
+        :param api: API helper for the OrangeHRM instance under test.
+        :param browser: Logged-in browser whose session cookies are reused, if any.
+        :param workers: Number of parallel requests for bulk creation.
+        """
+        self.api = api
+        self.browser = browser
+        self.workers = workers
+        self.created: Dict[str, List[int]] = {
+            "users": [],
+            "candidates": [],
+            "employees": [],
+        }
+        self._authenticated = browser is None
+
+    def _authenticate(self) -> None:
+        if not self._authenticated:
+            self.api.use_browser_session(self.browser)
+            self._authenticated = True
+
+    def _create(
+        self, kind: str, create: Callable[[Any], requests.Response], body: Any
+    ) -> Dict[str, Any]:
+        self._authenticate()
+        response = create(body)
+        response.raise_for_status()
+        record = response.json()["data"]
+        self.created[kind].append(
+            record["empNumber"] if kind == "employees" else record["id"]
+        )
+        return record
+
+    def _bulk(self, create: Callable[..., Dict[str, Any]], count: int, **fields):
+        self._authenticate()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(lambda _: create(**fields), range(count)))
+
+    @allure.step("Seeding an employee through the API")
+    def employee(self, **fields) -> Dict[str, Any]:
+        """
+        Creates an employee and returns the API record with its empNumber.
+
+        :param fields: EmployeeRequestBody fields, e.g. first_name
+        """
+        body = EmployeeRequestBody(
+            first_name=fields.pop("first_name", None) or self.fake.first_name(),
+            last_name=fields.pop("last_name", None) or self.fake.last_name(),
+            **fields,
+        )
+        return self._create("employees", self.api.create_employee, body)
+
+    @allure.step("Seeding {count} employees through the API")
+    def employees(self, count: int, **fields) -> List[Dict[str, Any]]:
+        return self._bulk(self.employee, count, **fields)
+
+    @allure.step("Seeding a candidate through the API")
+    def candidate(self, **fields) -> Dict[str, Any]:
+        """
+        Creates a recruitment candidate and returns the API record with its id.
+
+        :param fields: CandidateRequestBody fields, e.g. email
+        """
+        body = CandidateRequestBody(
+            first_name=fields.pop("first_name", None) or self.fake.first_name(),
+            last_name=fields.pop("last_name", None) or self.fake.last_name(),
+            email=fields.pop("email", None) or self.fake.email(),
+            **fields,
+        )
+        return self._create("candidates", self.api.create_candidate, body)
+
+    @allure.step("Seeding {count} candidates through the API")
+    def candidates(self, count: int, **fields) -> List[Dict[str, Any]]:
+        return self._bulk(self.candidate, count, **fields)
+
+    @allure.step("Seeding a system user through the API")
+    def user(self, emp_number: Optional[int] = None, **fields) -> Dict[str, Any]:
+        """
+        Creates a system user and returns the API record with its id.
+        A new employee is seeded for the user if emp_number is not given.
+
+        :param emp_number: Employee the user belongs to
+        :param fields: SystemUserRequestBody fields, e.g. password
+        """
+        if emp_number is None:
+            emp_number = self.employee()["empNumber"]
+        body = SystemUserRequestBody(
+            username=fields.pop("username", None)
+            or WorkerHelper.unique(self.fake.user_name()),
+            password=fields.pop("password", None)
+            or self.fake.password(length=10, special_chars=False),
+            emp_number=emp_number,
+            **fields,
+        )
+        return self._create("users", self.api.create_user, body)
+
+    @allure.step("Deleting seeded test data")
+    def cleanup(self) -> None:
+        """
+        Deletes everything created by this seeder, users before the employees they belong to.
+        Failures are logged so that cleanup never fails a test.
+        """
+        deletes = {
+            "users": self.api.delete_users,
+            "candidates": self.api.delete_candidates,
+            "employees": self.api.delete_employees,
+        }
+        for kind, delete in deletes.items():
+            ids = self.created[kind]
+            if not ids:
+                continue
+            try:
+                delete(ids).raise_for_status()
+                self.created[kind] = []
+            except requests.RequestException as e:
+                self.logger.warning(f"Failed to delete seeded {kind} {ids}: {e}")
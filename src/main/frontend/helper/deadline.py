@@ -0,0 +1,44 @@
+import time
+from typing import Optional
+
+
+class DeadlineExceededError(Exception):
+    """Raised by page-object waits once the test's time budget is used up."""
+
+
+class Deadline:
+    """
+    A per-test time budget that every BasePage wait draws down from: waits are shortened to
+    the remaining budget, and a wait that times out after the budget is used up raises
+    DeadlineExceededError instead of returning None, so a broken test fails at its first
+    exhausted wait instead of timing out step after step.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        :param seconds: The budget for the whole test, starting now.
+        """
+        self.seconds = seconds
+        self.started = time.monotonic()
+
+    def remaining(self) -> float:
+        return max(0.0, self.seconds - (time.monotonic() - self.started))
+
+    @property
+    def exceeded(self) -> bool:
+        return self.remaining() <= 0
+
+    def clamp(self, timeout: float, action: Optional[str] = None) -> float:
+        """
+        Returns the timeout shortened to the remaining budget.
+        Raises DeadlineExceededError if nothing is left.
+        """
+        if self.exceeded:
+            self.fail(action)
+        return min(timeout, self.remaining())
+
+    def fail(self, action: Optional[str] = None, cause: Optional[Exception] = None):
+        message = f"Test deadline of {self.seconds} seconds exceeded"
+        if action:
+            message += f" while waiting for {action}"
+        raise DeadlineExceededError(message) from cause
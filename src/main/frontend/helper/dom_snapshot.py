@@ -0,0 +1,146 @@
+from typing import Any, Collection, Hashable, List
+
+from lxml import etree, html
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class DomSnapshot:
+    """
+    A serialized DOM fetched from the browser once and queried locally with lxml, so that
+    reading many values from a settled page costs one WebDriver command instead of one
+    per query and element. Elements the browser did not display are marked `hidden`
+    when the snapshot is taken. The version identifies the page state the snapshot was
+    taken in; a snapshot is only reused while the browser is still in that state.
+    """
+
+    BLOCK_TAGS = {
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+        "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+        "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+        "table", "tr", "ul",
+    }  # fmt: skip
+    INVISIBLE_TAGS = {"head", "script", "style", "template", "title", "meta"}
+
+    def __init__(self, source: str, version: Hashable):
+        """
+        :param source: Serialized HTML of the page.
+        :param version: Page state the snapshot was taken in.
+        """
+        self.document = html.document_fromstring(source)
+        self.version = version
+
+    def _nodes(self, xpath: str) -> List[html.HtmlElement]:
+        nodes = self.document.xpath(getattr(xpath, "xpath", xpath))
+        if not isinstance(nodes, list):
+            raise etree.XPathEvalError(f"{xpath} does not select elements")
+        return [node for node in nodes if isinstance(getattr(node, "tag", None), str)]
+
+    def is_displayed(self, node: html.HtmlElement) -> bool:
+        while node is not None:
+            if node.get("hidden") is not None or node.tag in self.INVISIBLE_TAGS:
+                return False
+            node = node.getparent()
+        return True
+
+    def visible_text(self, node: html.HtmlElement) -> str:
+        """
+        Returns the rendered text of a node like WebElement.text: text of hidden
+        descendants is left out and block elements start a new line.
+        """
+        if not self.is_displayed(node):
+            return ""
+        parts = []
+
+        def collect(current):
+            if current.get("hidden") is not None or current.tag in self.INVISIBLE_TAGS:
+                return
+            block = current.tag in self.BLOCK_TAGS
+            if block:
+                parts.append("\n")
+            if current.text:
+                parts.append(current.text)
+            for child in current:
+                if isinstance(child.tag, str):
+                    collect(child)
+                if child.tail:
+                    parts.append(child.tail)
+            if block:
+                parts.append("\n")
+
+        collect(node)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def count(self, xpath: str) -> int:
+        """Returns the number of displayed elements matching the XPath."""
+        return sum(1 for node in self._nodes(xpath) if self.is_displayed(node))
+
+    def texts(self, xpath: str) -> List[str]:
+        """Returns the non-empty rendered texts of all elements matching the XPath."""
+        return [text for text in map(self.visible_text, self._nodes(xpath)) if text]
+
+    def text(self, xpath: str) -> str:
+        """Returns the rendered text of the first element matching the XPath, or ''."""
+        nodes = self._nodes(xpath)
+        return self.visible_text(nodes[0]) if nodes else ""
+
+
+class InteractionCounter:
+    """
+    Wraps the command executor of a WebDriver and counts the commands that can change the
+    page as `browser.interaction_count`: navigation, clicks, typing, actions and scripts,
+    except the given scripts known to only read the page. DOM snapshots are versioned
+    by this count.
+    """
+
+    MUTATING_COMMANDS = {
+        Command.GET,
+        Command.REFRESH,
+        Command.GO_BACK,
+        Command.GO_FORWARD,
+        Command.CLICK_ELEMENT,
+        Command.SEND_KEYS_TO_ELEMENT,
+        Command.CLEAR_ELEMENT,
+        Command.W3C_ACTIONS,
+        Command.W3C_EXECUTE_SCRIPT,
+        Command.W3C_EXECUTE_SCRIPT_ASYNC,
+        Command.SWITCH_TO_FRAME,
+        Command.SWITCH_TO_PARENT_FRAME,
+        Command.SWITCH_TO_WINDOW,
+        Command.NEW_WINDOW,
+        Command.CLOSE,
+    }
+    SCRIPT_COMMANDS = {Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC}
+
+    def __init__(self, browser: WebDriver, read_only_scripts: Collection[str] = ()):
+        """
+        :param browser: WebDriver whose commands are counted.
+        :param read_only_scripts: Scripts that don't change the page.
+        """
+        self.browser = browser
+        self.read_only_scripts = set(read_only_scripts)
+        self._original_execute = None
+
+    def install(self) -> "InteractionCounter":
+        """Replaces the executor's execute method with a counting wrapper."""
+        executor = self.browser.command_executor
+        if self._original_execute is not None:
+            return self
+        self._original_execute = executor.execute
+        self.browser.interaction_count = 0
+
+        def execute(command: str, params: Any):
+            if self.is_mutating(command, params):
+                self.browser.interaction_count += 1
+            return self._original_execute(command, params)
+
+        executor.execute = execute
+        return self
+
+    def is_mutating(self, command: str, params: Any) -> bool:
+        if command not in self.MUTATING_COMMANDS:
+            return False
+        if command in self.SCRIPT_COMMANDS:
+            return (params or {}).get("script") not in self.read_only_scripts
+        return True
@@ -0,0 +1,153 @@
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import requests
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+
+class DriverServiceManager:
+    """
+    Keeps chromedriver, msedgedriver and geckodriver running for the whole test process
+    (one per xdist worker) and opens every local session against a running service instead
+    of spawning a new driver binary per test. A service is health-checked through its
+    /status endpoint before a session is created on it and restarted if it died.
+    chromedriver and msedgedriver serve any number of sessions; geckodriver serves one
+    session at a time, so a geckodriver is started per concurrent Firefox session and
+    reused once that session has quit.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    SERVICE_CLASSES = {
+        "chrome": ChromeService,
+        "firefox": FirefoxService,
+        "edge": EdgeService,
+    }
+    SINGLE_SESSION = {"firefox"}
+
+    def __init__(self, health_timeout: float = 2.0):
+        """
+        :param health_timeout: Seconds to wait for the /status response of a service.
+        """
+        self.health_timeout = health_timeout
+        self.services: Dict[str, List[Service]] = {}
+        self.browser_paths: Dict[str, Optional[str]] = {}
+        self.started = 0
+        self.restarted = 0
+        self._busy: set = set()
+        self._lock = threading.Lock()
+
+    def is_healthy(self, service: Service) -> bool:
+        """Checks that the service process is alive and answers /status."""
+        if service.process is None or service.process.poll() is not None:
+            return False
+        try:
+            response = requests.get(
+                f"{service.service_url}/status", timeout=self.health_timeout
+            )
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
+
+    def _start(self, browser_name: str, options: ArgOptions) -> Service:
+        service = self.SERVICE_CLASSES[browser_name]()
+        service.path = service.env_path()
+        if not service.path:
+            finder = DriverFinder(service, options)
+            self.browser_paths[browser_name] = finder.get_browser_path()
+            service.path = finder.get_driver_path()
+        service.start()
+        self.started += 1
+        self.logger.info(
+            f"Started {browser_name} driver service at {service.service_url}"
+        )
+        return service
+
+    def acquire_service(self, browser_name: str, options: ArgOptions) -> Service:
+        """Returns a healthy service with room for a session, starting or restarting one if needed."""
+        with self._lock:
+            services = self.services.setdefault(browser_name, [])
+            for service in list(services):
+                if browser_name in self.SINGLE_SESSION and id(service) in self._busy:
+                    continue
+                if self.is_healthy(service):
+                    break
+                self.logger.warning(
+                    f"{browser_name} driver service at {service.service_url} is not healthy, restarting it"
+                )
+                services.remove(service)
+                self._stop(service)
+                self.restarted += 1
+            else:
+                service = self._start(browser_name, options)
+                services.append(service)
+            if browser_name in self.SINGLE_SESSION:
+                self._busy.add(id(service))
+            return service
+
+    def _connection(self, browser_name: str, service: Service) -> RemoteConnection:
+        if browser_name == "chrome":
+            return ChromiumRemoteConnection(service.service_url, "goog", "chrome")
+        if browser_name == "edge":
+            return ChromiumRemoteConnection(service.service_url, "ms", "MicrosoftEdge")
+        return FirefoxRemoteConnection(service.service_url)
+
+    def create_session(self, browser_name: str, options: ArgOptions) -> RemoteWebDriver:
+        """
+        Opens a session on a running driver service. The service is remembered as
+        driver.driver_service and has to be given back with release() after quitting.
+        """
+        if browser_name not in self.SERVICE_CLASSES:
+            raise ValueError(f"Unsupported browser: {browser_name}")
+        service = self.acquire_service(browser_name, options)
+        if self.browser_paths.get(browser_name):
+            options.binary_location = self.browser_paths[browser_name]
+            options.browser_version = None
+        try:
+            driver = RemoteWebDriver(
+                command_executor=self._connection(browser_name, service),
+                options=options,
+            )
+        except WebDriverException:
+            self.release_service(service)
+            raise
+        driver._is_remote = False
+        driver.driver_service = service
+        return driver
+
+    def release_service(self, service: Service) -> None:
+        with self._lock:
+            self._busy.discard(id(service))
+
+    def release(self, driver: RemoteWebDriver) -> None:
+        """Makes the service of a quit session available for the next one."""
+        service = getattr(driver, "driver_service", None)
+        if service is not None:
+            self.release_service(service)
+
+    @staticmethod
+    def _stop(service: Service) -> None:
+        try:
+            service.stop()
+        except Exception as e:
+            DriverServiceManager.logger.warning(f"Failed to stop driver service: {e}")
+
+    def stop(self) -> None:
+        """Stops all driver services."""
+        with self._lock:
+            for services in self.services.values():
+                for service in services:
+                    self._stop(service)
+            self.services.clear()
+            self._busy.clear()
@@ -0,0 +1,291 @@
+import functools
+import itertools
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from lxml import html
+
+from src.main.frontend.helper.fake_webdriver import FakeWebDriver
+
+
+class FakeOrangeHrmApi:
+    """
+    In-memory stand-in for the parts of the OrangeHRM API v2 used for seeding test data:
+    create, get, list and bulk delete of employees, candidates and system users.
+    """
+
+    RESOURCES = {
+        "pim/employees": "empNumber",
+        "recruitment/candidates": "id",
+        "admin/users": "id",
+    }
+
+    def __init__(self):
+        self.records: Dict[str, Dict[int, Dict[str, Any]]] = {
+            resource: {} for resource in self.RESOURCES
+        }
+        self._ids = itertools.count(100)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _error(status: int, message: str) -> Tuple[int, dict]:
+        return status, {"error": {"status": str(status), "message": message}}
+
+    def handle(
+        self, method: str, path: str, body: Optional[dict] = None
+    ) -> Tuple[int, dict]:
+        """
+        Handles a request to an API path relative to /api/v2, e.g. pim/employees/7.
+        Returns the status code and the JSON body.
+        """
+        resource, _, record_id = path.strip("/").rpartition("/")
+        if not record_id.isdigit():
+            resource, record_id = path.strip("/"), None
+        if resource not in self.RESOURCES:
+            return self._error(404, "Invalid Path")
+        records = self.records[resource]
+        with self._lock:
+            if method == "GET" and record_id:
+                record = records.get(int(record_id))
+                if record is None:
+                    return self._error(404, "Record Not Found")
+                return 200, {"data": record, "meta": [], "rels": []}
+            if method == "GET":
+                data = list(records.values())
+                return 200, {"data": data, "meta": {"total": len(data)}, "rels": []}
+            if method == "POST" and not record_id:
+                record = {**(body or {}), self.RESOURCES[resource]: next(self._ids)}
+                records[record[self.RESOURCES[resource]]] = record
+                return 200, {"data": record, "meta": [], "rels": []}
+            if method == "DELETE" and not record_id:
+                ids = [i for i in (body or {}).get("ids", []) if i in records]
+                if not ids:
+                    return self._error(404, "Records Not Found")
+                for i in ids:
+                    del records[i]
+                return 200, {"data": ids, "meta": [], "rels": []}
+        return self._error(405, "Method Not Allowed")
+
+
+class FakeOrangeHrm:
+    """
+    Server-side behaviour of the OrangeHRM snapshots for FakeWebDriver:
+    form actions validating input the way OrangeHRM does and navigating on success.
+    """
+
+    FIELD_ERROR_CLASS = (
+        "oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message"
+    )
+    ALERT_CLASS = "oxd-alert-content oxd-alert-content--error"
+    EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+    _ids = itertools.count(7)
+
+    @staticmethod
+    def create_driver(
+        base_url: str,
+        username: str,
+        password: str,
+        snapshots_dir: str,
+        api: Optional[FakeOrangeHrmApi] = None,
+    ) -> FakeWebDriver:
+        """
+        Returns a FakeWebDriver serving the OrangeHRM snapshots under base_url
+        that accepts the given admin credentials.
+        Pages of employees seeded through the api show their data.
+        """
+        driver = FakeWebDriver(
+            snapshots_dir,
+            actions={
+                "login": functools.partial(
+                    FakeOrangeHrm.login, username=username, password=password
+                ),
+                "reset_password": FakeOrangeHrm.reset_password,
+                "search_employees": FakeOrangeHrm.search_employees,
+                "save_employee": FakeOrangeHrm.save_employee,
+                "save_candidate": FakeOrangeHrm.save_candidate,
+            },
+        )
+        driver.base_url = base_url
+        if api is not None:
+            driver.load_hooks.append(
+                functools.partial(FakeOrangeHrm.show_employee, api=api)
+            )
+        return driver
+
+    @staticmethod
+    def show_employee(driver: FakeWebDriver, api: FakeOrangeHrmApi) -> None:
+        """Shows the name of a seeded employee on their personal details page."""
+        match = re.search(r"/viewPersonalDetails/empNumber/(\d+)$", driver.current_url)
+        employee = (
+            api.records["pim/employees"].get(int(match.group(1))) if match else None
+        )
+        if employee is None:
+            return
+        for title in driver.document.xpath(
+            "//div[contains(@class, 'orangehrm-edit-employee-name')]/h6"
+        ):
+            title.text = f"{employee['firstName']} {employee['lastName']}"
+
+    @staticmethod
+    def _input(form, xpath: str):
+        nodes = form.xpath(xpath)
+        return nodes[0] if nodes else None
+
+    @staticmethod
+    def _labelled_input(form, label: str):
+        return FakeOrangeHrm._input(
+            form,
+            f".//label[normalize-space(text())='{label}']"
+            "/ancestor::div[contains(concat(' ', @class, ' '), ' oxd-input-group ')][1]//input",
+        )
+
+    @staticmethod
+    def _value(node) -> str:
+        return node.get("value", "").strip() if node is not None else ""
+
+    @staticmethod
+    def _clear_errors(form) -> None:
+        for node in form.xpath(
+            ".//span[contains(@class, 'oxd-input-field-error-message')]"
+            " | //div[contains(@class, 'oxd-alert--error')]"
+        ):
+            node.getparent().remove(node)
+
+    @staticmethod
+    def _field_error(node, message: str) -> None:
+        """Shows a validation message under the input, like OrangeHRM's input groups."""
+        group = next(
+            (
+                ancestor
+                for ancestor in node.iterancestors("div")
+                if "oxd-input-group" in ancestor.get("class", "").split()
+            ),
+            node.getparent(),
+        )
+        error = html.Element("span", {"class": FakeOrangeHrm.FIELD_ERROR_CLASS})
+        error.text = message
+        group.append(error)
+
+    @staticmethod
+    def _required(nodes: Dict[str, object]) -> bool:
+        """Marks empty inputs as required. Returns True if all are filled."""
+        valid = True
+        for node in nodes.values():
+            if node is not None and not FakeOrangeHrm._value(node):
+                FakeOrangeHrm._field_error(node, "Required")
+                valid = False
+        return valid
+
+    @staticmethod
+    def login(driver: FakeWebDriver, form, username: str, password: str) -> None:
+        FakeOrangeHrm._clear_errors(form)
+        inputs = {
+            "username": FakeOrangeHrm._input(form, ".//input[@name='username']"),
+            "password": FakeOrangeHrm._input(form, ".//input[@name='password']"),
+        }
+        if not FakeOrangeHrm._required(inputs):
+            return
+        if (
+            FakeOrangeHrm._value(inputs["username"]) == username
+            and FakeOrangeHrm._value(inputs["password"]) == password
+        ):
+            driver.get("/web/index.php/dashboard/index")
+            return
+        alert = html.fragment_fromstring(
+            f'<div class="oxd-alert oxd-alert--error" role="alert">'
+            f'<div class="{FakeOrangeHrm.ALERT_CLASS}">'
+            f'<i class="oxd-icon bi-exclamation-circle oxd-alert-content-icon"></i>'
+            f'<p class="oxd-text oxd-text--p oxd-alert-content-text">Invalid credentials</p>'
+            f"</div></div>"
+        )
+        form.addprevious(alert)
+
+    @staticmethod
+    def reset_password(driver: FakeWebDriver, form) -> None:
+        FakeOrangeHrm._clear_errors(form)
+        username = FakeOrangeHrm._input(form, ".//input[@name='username']")
+        if FakeOrangeHrm._required({"username": username}):
+            driver.get("/web/index.php/auth/sendPasswordReset")
+
+    @staticmethod
+    def search_employees(driver: FakeWebDriver, form) -> None:
+        """Keeps only the rows with the selected employment status."""
+        status = " ".join(
+            form.xpath(
+                "string(.//div[@id='employment-status']"
+                "/div[contains(@class, 'oxd-select-text-input')])"
+            ).split()
+        )
+        if status == "-- Select --":
+            return
+        for row in driver.document.xpath(
+            "//div[contains(@class, 'oxd-table-body')]//div[@role='row']"
+        ):
+            cell = row.xpath("string(.//div[@data-column='employment-status'])")
+            if " ".join(cell.split()) != status:
+                card = row.getparent()
+                card.getparent().remove(card)
+
+    @staticmethod
+    def _names_valid(form) -> bool:
+        return FakeOrangeHrm._required(
+            {
+                "first_name": FakeOrangeHrm._input(form, ".//input[@name='firstName']"),
+                "last_name": FakeOrangeHrm._input(form, ".//input[@name='lastName']"),
+            }
+        )
+
+    @staticmethod
+    def save_employee(driver: FakeWebDriver, form) -> None:
+        FakeOrangeHrm._clear_errors(form)
+        valid = FakeOrangeHrm._names_valid(form)
+        if driver.is_visible(form.xpath(".//div[@id='login-details']")[0]):
+            username = FakeOrangeHrm._labelled_input(form, "Username")
+            password = FakeOrangeHrm._labelled_input(form, "Password")
+            confirm = FakeOrangeHrm._labelled_input(form, "Confirm Password")
+            valid = (
+                FakeOrangeHrm._required(
+                    {"username": username, "password": password, "confirm": confirm}
+                )
+                and valid
+            )
+            if (
+                FakeOrangeHrm._value(username)
+                and len(FakeOrangeHrm._value(username)) < 5
+            ):
+                FakeOrangeHrm._field_error(username, "Should be at least 5 characters")
+                valid = False
+            if (
+                FakeOrangeHrm._value(password)
+                and len(FakeOrangeHrm._value(password)) < 7
+            ):
+                FakeOrangeHrm._field_error(
+                    password, "Should have at least 7 characters"
+                )
+                valid = False
+            if FakeOrangeHrm._value(confirm) and FakeOrangeHrm._value(
+                confirm
+            ) != FakeOrangeHrm._value(password):
+                FakeOrangeHrm._field_error(confirm, "Passwords do not match")
+                valid = False
+        if valid:
+            driver.get(
+                f"/web/index.php/pim/viewPersonalDetails/empNumber/{next(FakeOrangeHrm._ids)}"
+            )
+
+    @staticmethod
+    def save_candidate(driver: FakeWebDriver, form) -> None:
+        FakeOrangeHrm._clear_errors(form)
+        email = FakeOrangeHrm._labelled_input(form, "Email")
+        valid = FakeOrangeHrm._names_valid(form)
+        valid = FakeOrangeHrm._required({"email": email}) and valid
+        if FakeOrangeHrm._value(email) and not FakeOrangeHrm.EMAIL_PATTERN.match(
+            FakeOrangeHrm._value(email)
+        ):
+            FakeOrangeHrm._field_error(email, "Expected format: admin@example.com")
+            valid = False
+        if valid:
+            driver.get(
+                f"/web/index.php/recruitment/addCandidate/{next(FakeOrangeHrm._ids)}"
+            )
@@ -0,0 +1,499 @@
+import copy
+import functools
+import itertools
+import json
+import logging
+import os
+import re
+import urllib.parse
+from typing import Any, Callable, Dict, List, Optional
+
+from cssselect import GenericTranslator, SelectorError
+from lxml import etree, html
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.main.frontend.pages.base_page import BasePage
+
+
+def sends(command: str) -> Callable:
+    """
+    Passes a call through the driver's command_executor as the given W3C command before
+    running it, so that executor wrappers like CommandRecorder see it. Commands issued
+    while another one runs (e.g. the navigation of a form action) are not sent again.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            driver = getattr(self, "_parent", self)
+            if driver._in_command:
+                return method(self, *args, **kwargs)
+            driver.command_executor.execute(command, {"args": list(args)})
+            driver._in_command = True
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                driver._in_command = False
+
+        return wrapper
+
+    return decorator
+
+
+class FakeCommandExecutor:
+    """Stands in for the RemoteConnection of a WebDriver; commands are handled in memory."""
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"value": None}
+
+
+class FakeWebElement(WebElement):
+    """
+    A WebElement backed by a node of the FakeWebDriver's lxml document.
+    It subclasses WebElement so that expected conditions treat it like a real element.
+    """
+
+    def __init__(self, parent: "FakeWebDriver", node: html.HtmlElement):
+        super().__init__(parent, f"fake-{next(parent.element_ids)}")
+        self.node = node
+        self.document = parent.document
+
+    def _check_stale(self) -> None:
+        if self.document is not self._parent.document or not self._parent.is_attached(
+            self.node
+        ):
+            raise StaleElementReferenceException(
+                f"Element <{self.node.tag}> is no longer attached to the DOM"
+            )
+
+    @property
+    def tag_name(self) -> str:
+        self._check_stale()
+        return self.node.tag
+
+    @property
+    @sends(Command.GET_ELEMENT_TEXT)
+    def text(self) -> str:
+        self._check_stale()
+        return self._parent.visible_text(self.node)
+
+    @sends(Command.GET_ELEMENT_ATTRIBUTE)
+    def get_attribute(self, name: str) -> Optional[str]:
+        self._check_stale()
+        if name == "value":
+            return self.node.get("value", "")
+        return self.node.get(name)
+
+    get_dom_attribute = get_attribute
+    get_property = get_attribute
+
+    @sends(Command.W3C_EXECUTE_SCRIPT)
+    def is_displayed(self) -> bool:
+        self._check_stale()
+        return self._parent.is_visible(self.node)
+
+    def is_enabled(self) -> bool:
+        self._check_stale()
+        return self.node.get("disabled") is None
+
+    def is_selected(self) -> bool:
+        self._check_stale()
+        return self.node.get("checked") is not None
+
+    @sends(Command.CLICK_ELEMENT)
+    def click(self) -> None:
+        self._check_stale()
+        if not self._parent.is_visible(self.node):
+            raise ElementNotInteractableException(
+                f"Element <{self.node.tag}> is not visible"
+            )
+        self._parent.click(self.node)
+
+    @sends(Command.CLEAR_ELEMENT)
+    def clear(self) -> None:
+        self._check_stale()
+        self.node.set("value", "")
+        self._parent.interaction_count += 1
+
+    @sends(Command.SEND_KEYS_TO_ELEMENT)
+    def send_keys(self, *value: Any) -> None:
+        self._check_stale()
+        if not self._parent.is_visible(self.node):
+            raise ElementNotInteractableException(
+                f"Element <{self.node.tag}> is not reachable by keyboard"
+            )
+        self._parent.type_keys(self.node, "".join(str(v) for v in value))
+
+    @sends(Command.FIND_CHILD_ELEMENT)
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> WebElement:
+        self._check_stale()
+        return self._parent.find_element(by, value, context=self.node)
+
+    @sends(Command.FIND_CHILD_ELEMENTS)
+    def find_elements(
+        self, by: str = By.ID, value: Optional[str] = None
+    ) -> List[WebElement]:
+        self._check_stale()
+        return self._parent.find_elements(by, value, context=self.node)
+
+    def __repr__(self) -> str:
+        return f"<FakeWebElement {self.node.tag} {self.id}>"
+
+
+class FakeWebDriver:
+    """
+    An in-memory stand-in for WebDriver that loads saved HTML snapshots into an lxml DOM,
+    so that page-object logic can be tested without a browser.
+
+    URLs are mapped to snapshots by routes.json in the snapshots directory.
+    Clicks follow simple declarative transitions on the clicked element or its ancestors:
+    href/data-href navigate, data-show/data-hide toggle the `hidden` attribute of the nodes
+    matched by an XPath, data-select copies the element's text into the nodes it matches,
+    and a submit button calls the Python action named by its form's data-action.
+    execute_script supports the scripts BasePage uses.
+    Public commands pass through command_executor like those of a real WebDriver.
+    Callables in load_hooks are called with the driver after every navigation, e.g. to fill
+    a snapshot with server-side data.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    NOT_FOUND_PAGE = (
+        "<html><head><title>404</title></head><body><h1>Not Found</h1></body></html>"
+    )
+    INVISIBLE_TAGS = {"head", "script", "style", "template", "title", "meta"}
+    # 1x1 transparent PNG returned as screenshot
+    BLANK_PNG = bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+    )
+
+    def __init__(
+        self,
+        snapshots_dir: str,
+        actions: Optional[Dict[str, Callable[["FakeWebDriver", Any], None]]] = None,
+    ):
+        """
+        :param snapshots_dir: Directory with the HTML snapshots and routes.json.
+        :param actions: Form actions by name, called with the driver and the form node.
+        """
+        self.snapshots_dir = snapshots_dir
+        self.actions = actions or {}
+        with open(os.path.join(snapshots_dir, "routes.json")) as f:
+            self.routes = [
+                (re.compile(pattern), name) for pattern, name in json.load(f)
+            ]
+        self.scripts: Dict[str, Callable[..., Any]] = {
+            "return document.readyState": lambda: "complete",
+            BasePage.JS_ARGUMENT_SCROLL: lambda element: None,
+            BasePage.JS_ARGUMENT_CLICK: lambda element: element.click(),
+            BasePage.JS_IS_ELEMENT_DISPLAYED: lambda element: element.is_displayed(),
+            BasePage.JS_FILL_FORM: self._fill_form,
+            BasePage.JS_DOM_SNAPSHOT: self._dom_snapshot,
+            BasePage.JS_TRACK_NETWORK: lambda: None,
+        }
+        self.async_scripts: Dict[str, Callable[..., Any]] = {
+            BasePage.JS_SETTLE_AND_COUNT_DISPLAYED: self._count_displayed,
+        }
+        self.load_hooks: List[Callable[["FakeWebDriver"], None]] = []
+        self.element_ids = itertools.count(1)
+        self.document = html.document_fromstring(self.NOT_FOUND_PAGE)
+        self.history: List[str] = []
+        self._url = "about:blank"
+        self._selected_node = None
+        # Counts changes of the page like the InteractionCounter of a real browser.
+        self.interaction_count = 0
+        self.command_executor = FakeCommandExecutor()
+        self._in_command = False
+
+    @property
+    @sends(Command.GET_CURRENT_URL)
+    def current_url(self) -> str:
+        return self._url
+
+    @property
+    def title(self) -> str:
+        return self.document.findtext(".//title") or ""
+
+    @property
+    def page_source(self) -> str:
+        return html.tostring(self.document, encoding="unicode")
+
+    def snapshot_for(self, url: str) -> Optional[str]:
+        """Returns the path of the snapshot served for a URL or None."""
+        path = urllib.parse.urlparse(url).path
+        for pattern, name in self.routes:
+            if pattern.search(path):
+                return os.path.join(self.snapshots_dir, name)
+        return None
+
+    def read_snapshot(self, url: str) -> Optional[bytes]:
+        """Returns the snapshot served for a URL or None."""
+        snapshot = self.snapshot_for(url)
+        if snapshot is None:
+            return None
+        with open(snapshot, "rb") as f:
+            return f.read()
+
+    def load(self, url: str, source) -> None:
+        """Replaces the current document, e.g. with a DOM state sent by a real browser."""
+        self.document = html.document_fromstring(source)
+        self._url = url
+        self._selected_node = None
+        self.interaction_count += 1
+
+    @sends(Command.GET)
+    def get(self, url: str) -> None:
+        url = urllib.parse.urljoin(self._url, url)
+        source = self.read_snapshot(url)
+        if source is None:
+            self.logger.warning(f"No snapshot for {url}")
+            source = self.NOT_FOUND_PAGE
+        self.load(url, source)
+        self.history.append(url)
+        for hook in self.load_hooks:
+            hook(self)
+
+    @sends(Command.REFRESH)
+    def refresh(self) -> None:
+        if self.history:
+            self.history.pop()
+        self.get(self._url)
+
+    @sends(Command.GO_BACK)
+    def back(self) -> None:
+        if len(self.history) > 1:
+            self.history.pop()
+            self.get(self.history.pop())
+
+    def _to_xpath(self, by: str, value: str) -> str:
+        if by == By.XPATH:
+            return value
+        if by == By.ID:
+            return f"//*[@id='{value}']"
+        if by == By.NAME:
+            return f"//*[@name='{value}']"
+        if by == By.TAG_NAME:
+            return f"//{value}"
+        if by == By.CSS_SELECTOR:
+            try:
+                return GenericTranslator().css_to_xpath(value)
+            except SelectorError as e:
+                raise InvalidSelectorException(f"Invalid selector {value}: {e}")
+        if by == By.CLASS_NAME:
+            return (
+                f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+            )
+        raise InvalidSelectorException(
+            f"FakeWebDriver does not support locating by {by}"
+        )
+
+    @sends(Command.FIND_ELEMENTS)
+    def find_elements(
+        self, by: str = By.ID, value: Optional[str] = None, context=None
+    ) -> List[WebElement]:
+        try:
+            nodes = (context if context is not None else self.document).xpath(
+                self._to_xpath(by, value)
+            )
+        except etree.XPathError as e:
+            raise InvalidSelectorException(f"Invalid selector {value}: {e}")
+        if not isinstance(nodes, list):
+            raise InvalidSelectorException(f"Selector {value} does not select elements")
+        return [
+            FakeWebElement(self, node)
+            for node in nodes
+            if isinstance(node, etree._Element) and isinstance(node.tag, str)
+        ]
+
+    @sends(Command.FIND_ELEMENT)
+    def find_element(
+        self, by: str = By.ID, value: Optional[str] = None, context=None
+    ) -> WebElement:
+        elements = self.find_elements(by, value, context)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {value}")
+        return elements[0]
+
+    def is_attached(self, node) -> bool:
+        root = node
+        while root.getparent() is not None:
+            root = root.getparent()
+        return root is self.document
+
+    def is_visible(self, node) -> bool:
+        if node.tag == "input" and node.get("type") == "hidden":
+            return False
+        while node is not None:
+            style = (node.get("style") or "").replace(" ", "")
+            if (
+                node.get("hidden") is not None
+                or "display:none" in style
+                or "visibility:hidden" in style
+                or "visibility:collapse" in style
+                or re.search(r"(^|;)opacity:0(\.0*)?(;|$)", style)
+                or node.tag in self.INVISIBLE_TAGS
+            ):
+                return False
+            node = node.getparent()
+        return True
+
+    def visible_text(self, node) -> str:
+        """Returns the whitespace-normalized text of the node's visible descendants."""
+        if not self.is_visible(node):
+            return ""
+        parts = []
+
+        def collect(current):
+            if current.get("hidden") is not None or current.tag in self.INVISIBLE_TAGS:
+                return
+            if current.text:
+                parts.append(current.text)
+            for child in current:
+                if isinstance(child.tag, str):
+                    collect(child)
+                if child.tail:
+                    parts.append(child.tail)
+
+        collect(node)
+        return " ".join(" ".join(parts).split())
+
+    def type_keys(self, node, text: str) -> None:
+        """Applies typed text to an input, supporting select-all, BACKSPACE and DELETE."""
+        self.interaction_count += 1
+        value = node.get("value", "")
+        modifier = False
+        for char in text:
+            if char in (Keys.CONTROL, Keys.COMMAND):
+                modifier = True
+            elif modifier and char.lower() == "a":
+                self._selected_node = node
+                modifier = False
+            elif char in (Keys.BACKSPACE, Keys.DELETE):
+                value = "" if self._selected_node is node else value[:-1]
+                self._selected_node = None
+            elif "\ue000" <= char <= "\uf8ff":
+                continue
+            else:
+                if self._selected_node is node:
+                    value = ""
+                    self._selected_node = None
+                value += char
+        node.set("value", value)
+
+    def click(self, node) -> None:
+        """Runs the transitions declared on the node or its closest ancestor declaring any."""
+        self.interaction_count += 1
+        current = node
+        while current is not None:
+            if self._run_transitions(current):
+                return
+            current = current.getparent()
+
+    def _run_transitions(self, node) -> bool:
+        handled = False
+        for target in self._xpath_targets(node.get("data-select")):
+            for child in list(target):
+                target.remove(child)
+            target.text = self.visible_text(node)
+            handled = True
+        for target in self._xpath_targets(node.get("data-show")):
+            target.attrib.pop("hidden", None)
+            handled = True
+        for target in self._xpath_targets(node.get("data-hide")):
+            target.set("hidden", "")
+            handled = True
+        if node.tag == "input" and node.get("type") == "checkbox":
+            if node.get("checked") is None:
+                node.set("checked", "")
+            else:
+                node.attrib.pop("checked")
+            handled = True
+        href = node.get("data-href") or (node.get("href") if node.tag == "a" else None)
+        if href:
+            self.get(href)
+            return True
+        if node.tag == "button" and node.get("type", "submit") == "submit":
+            form = next(node.iterancestors("form"), None)
+            action = form.get("data-action") if form is not None else None
+            if action:
+                if action not in self.actions:
+                    raise JavascriptException(
+                        f"FakeWebDriver has no form action {action}"
+                    )
+                self.actions[action](self, form)
+            return True
+        return handled
+
+    def _xpath_targets(self, xpath: Optional[str]) -> list:
+        return self.document.xpath(xpath) if xpath else []
+
+    def _fill_form(self, fields: List[List[str]]) -> List[str]:
+        self.interaction_count += 1
+        missing = []
+        for xpath, value in fields:
+            nodes = self.document.xpath(xpath)
+            if nodes:
+                nodes[0].set("value", value)
+            else:
+                missing.append(xpath)
+        return missing
+
+    def _dom_snapshot(self) -> str:
+        """Serializes a copy of the document with the invisible elements marked hidden."""
+        snapshot = copy.deepcopy(self.document)
+        for node, copied in zip(self.document.iter(), snapshot.iter()):
+            if isinstance(node.tag, str) and not self.is_visible(node):
+                copied.set("hidden", "")
+        return html.tostring(snapshot, encoding="unicode", doctype="<!DOCTYPE html>")
+
+    def _count_displayed(
+        self, kind: str, selector: str, quiet_ms: int, timeout_ms: int
+    ) -> Dict[str, Any]:
+        """The in-memory page is always settled, so only the displayed matches are counted."""
+        by = By.CSS_SELECTOR if kind == "css" else By.XPATH
+        displayed = [e for e in self.find_elements(by, selector) if e.is_displayed()]
+        return {"settled": True, "displayed": len(displayed)}
+
+    @sends(Command.W3C_EXECUTE_SCRIPT)
+    def execute_script(self, script: str, *args: Any) -> Any:
+        handler = self.scripts.get(script)
+        if handler is None:
+            raise JavascriptException(
+                f"FakeWebDriver does not support the script: {script.strip()[:80]}"
+            )
+        return handler(*args)
+
+    @sends(Command.W3C_EXECUTE_SCRIPT_ASYNC)
+    def execute_async_script(self, script: str, *args: Any) -> Any:
+        handler = self.async_scripts.get(script)
+        if handler is None:
+            raise JavascriptException(
+                f"FakeWebDriver does not support the async script: {script.strip()[:80]}"
+            )
+        return handler(*args)
+
+    @sends(Command.SCREENSHOT)
+    def get_screenshot_as_png(self) -> bytes:
+        return self.BLANK_PNG
+
+    def save_screenshot(self, filename: str) -> bool:
+        with open(filename, "wb") as f:
+            f.write(self.BLANK_PNG)
+        return True
+
+    def maximize_window(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
@@ -0,0 +1,200 @@
+import argparse
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from lxml import html
+
+from src.main.frontend.helper.fake_orangehrm import FakeOrangeHrm, FakeOrangeHrmApi
+from src.main.frontend.helper.fake_webdriver import FakeWebDriver
+
+
+class FixtureServer:
+    """
+    Serves the saved OrangeHRM snapshots over HTTP for tests with a real browser,
+    so that the page objects run against a zero-latency target.
+    Pages get a small script (app.js in the snapshots directory) for the declared click
+    transitions; form actions are sent to the server together with the current DOM and run
+    by FakeOrangeHrm, which answers with the URL to navigate to or the updated page.
+    Test data can be seeded through a stand-in for the OrangeHRM API (FakeOrangeHrmApi).
+    """
+
+    logger = logging.getLogger(__name__)
+
+    LOGIN_PATH = "/web/index.php/auth/login"
+    SCRIPT_PATH = "/__fixture/app.js"
+    ACTION_PATH = "/__fixture/action/"
+    API_PATH = "/web/index.php/api/v2/"
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        snapshots_dir: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        :param username: Admin username accepted by the login form.
+        :param password: Admin password accepted by the login form.
+        :param snapshots_dir: Directory with the snapshots, routes.json and app.js.
+        :param host: Interface to listen on.
+        :param port: Port to listen on, 0 picks a free one.
+        """
+        self.username = username
+        self.password = password
+        self.snapshots_dir = snapshots_dir
+        self.pages = FakeWebDriver(snapshots_dir)
+        self.api = FakeOrangeHrmApi()
+        with open(os.path.join(snapshots_dir, "app.js"), "rb") as f:
+            self.script = f.read()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        """URL of the login page, to be used as --base_url."""
+        return f"{self.url}{self.LOGIN_PATH}"
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fixture-server", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Serving OrangeHRM snapshots at {self.base_url}")
+        return self
+
+    def serve_forever(self) -> None:
+        self.logger.info(f"Serving OrangeHRM snapshots at {self.base_url}")
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _driver(self, url: str) -> FakeWebDriver:
+        return FakeOrangeHrm.create_driver(
+            url, self.username, self.password, self.snapshots_dir, self.api
+        )
+
+    def render(self, url: str) -> Optional[bytes]:
+        """Returns the page for a URL with the fixture script injected, or None."""
+        if self.pages.snapshot_for(url) is None:
+            return None
+        driver = self._driver(url)
+        driver.get(url)
+        source = html.tostring(
+            driver.document.getroottree(), encoding="utf-8", doctype="<!DOCTYPE html>"
+        )
+        tag = f'<script src="{self.SCRIPT_PATH}" defer></script>'.encode()
+        return source.replace(b"</head>", tag + b"\n</head>", 1)
+
+    def run_action(self, name: str, url: str, source: str) -> dict:
+        """
+        Runs a form action on the DOM state sent by the browser.
+        Returns {"location": url} if the action navigates, otherwise {"html": page}.
+        """
+        driver = self._driver(url)
+        action = driver.actions[name]
+        driver.load(url, source)
+        form = driver.document.xpath(f"//form[@data-action='{name}']")[0]
+        action(driver, form)
+        if driver.current_url != url:
+            return {"location": driver.current_url}
+        return {"html": driver.page_source}
+
+    def _handler(self):
+        server = self
+
+        class FixtureHandler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _api(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length)) if length else None
+                except ValueError as e:
+                    self._send(400, str(e).encode(), "text/plain")
+                    return
+                status, result = server.api.handle(
+                    method, self.path[len(server.API_PATH) :].split("?")[0], body
+                )
+                self._send(status, json.dumps(result).encode(), "application/json")
+
+            def do_DELETE(self):
+                if not self.path.startswith(server.API_PATH):
+                    self._send(404, b"Not Found", "text/plain")
+                    return
+                self._api("DELETE")
+
+            def do_GET(self):
+                if self.path.startswith(server.API_PATH):
+                    self._api("GET")
+                    return
+                if self.path == server.SCRIPT_PATH:
+                    self._send(200, server.script, "application/javascript")
+                    return
+                page = server.render(self.path)
+                if page is None:
+                    self._send(404, b"Not Found", "text/plain")
+                else:
+                    self._send(200, page, "text/html; charset=utf-8")
+
+            def do_POST(self):
+                if self.path.startswith(server.API_PATH):
+                    self._api("POST")
+                    return
+                if not self.path.startswith(server.ACTION_PATH):
+                    self._send(404, b"Not Found", "text/plain")
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length))
+                try:
+                    result = server.run_action(
+                        self.path[len(server.ACTION_PATH) :],
+                        request["url"],
+                        request["html"],
+                    )
+                except (IndexError, KeyError) as e:
+                    self._send(400, str(e).encode(), "text/plain")
+                    return
+                self._send(200, json.dumps(result).encode(), "application/json")
+
+            def log_message(self, format, *args):
+                server.logger.debug(format % args)
+
+        return FixtureHandler
+
+
+if __name__ == "__main__":
+    from src.main.frontend.helper.config_helper import ConfigHelper
+
+    parser = argparse.ArgumentParser(
+        description="Serve the OrangeHRM snapshots locally"
+    )
+    parser.add_argument("--snapshots", default="src/tests/frontend/snapshots")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    FixtureServer(
+        ConfigHelper.get_key("ADMIN_LOGIN"),
+        ConfigHelper.get_key("ADMIN_PASSWORD"),
+        args.snapshots,
+        args.host,
+        args.port,
+    ).serve_forever()
@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+import urllib3
+from selenium.common.exceptions import (
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+
+class Hub:
+    """
+    A Selenoid hub and its capacity per browser and version, e.g.
+    {"url": "http://hub-1:4444/wd/hub", "browsers": {"chrome": {"latest": 4}}}.
+    """
+
+    DEFAULT_VERSION = "latest"
+
+    def __init__(self, url: str, browsers: Dict[str, Dict[str, int]]):
+        self.url = url
+        self.browsers = browsers
+        self.used: Dict[Tuple[str, str], int] = {}
+        self.sessions = 0
+        self.failures = 0
+        self.queue_wait = 0.0
+        self.max_queue_wait = 0.0
+        self.busy_seconds = 0.0
+
+    def capacity(self, browser: str, version: Optional[str]) -> int:
+        versions = self.browsers.get(browser, {})
+        return versions.get(version or self.DEFAULT_VERSION, 0)
+
+    @property
+    def total_capacity(self) -> int:
+        return sum(sum(versions.values()) for versions in self.browsers.values())
+
+    def free_slots(self, browser: str, version: Optional[str]) -> int:
+        key = (browser, version or self.DEFAULT_VERSION)
+        return self.capacity(browser, version) - self.used.get(key, 0)
+
+    def load(self, browser: str, version: Optional[str]) -> float:
+        key = (browser, version or self.DEFAULT_VERSION)
+        return self.used.get(key, 0) / self.capacity(browser, version)
+
+    def status_url(self) -> str:
+        parsed = urllib.parse.urlparse(self.url)
+        return f"{parsed.scheme}://{parsed.netloc}/status"
+
+
+class HubScheduler:
+    """
+    Routes new remote sessions across several Selenoid hubs.
+    Requests wait in a queue until a hub has a free slot for the browser and version,
+    go to the least-loaded hub and are retried on another hub if session creation fails.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        hubs: List[Hub],
+        session_factory: Optional[Callable[[str, ArgOptions], Any]] = None,
+        queue_timeout: float = 300,
+        live_status: bool = True,
+    ):
+        """
+        :param hubs: Hubs to schedule sessions on.
+        :param session_factory: Callable creating a session from a hub URL and options.
+        :param queue_timeout: Maximum time in seconds a request may wait for a free slot.
+        :param live_status: Also take the load reported by each hub's /status into account,
+            so that sessions started by other workers are considered.
+        """
+        self.hubs = hubs
+        self.session_factory = session_factory or self._create_remote_session
+        self.queue_timeout = queue_timeout
+        self.live_status = live_status
+        self.started_at = time.monotonic()
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "HubScheduler":
+        """Loads hubs from a JSON file with a list of {"url": ..., "browsers": ...} objects."""
+        with open(path) as f:
+            hubs = [Hub(hub["url"], hub["browsers"]) for hub in json.load(f)]
+        return cls(hubs, **kwargs)
+
+    @property
+    def total_capacity(self) -> int:
+        return sum(hub.total_capacity for hub in self.hubs)
+
+    def capacity(self, browser: str, version: Optional[str]) -> int:
+        """Returns how many sessions of the browser and version the hubs can run at once."""
+        return sum(hub.capacity(browser, version) for hub in self.hubs)
+
+    @staticmethod
+    def _create_remote_session(url: str, options: ArgOptions) -> RemoteWebDriver:
+        return RemoteWebDriver(command_executor=url, options=options)
+
+    def _live_load(self, hub: Hub) -> float:
+        if not self.live_status:
+            return 0.0
+        try:
+            status = requests.get(hub.status_url(), timeout=2).json()
+            return status["used"] / status["total"] if status["total"] else 1.0
+        except (requests.RequestException, KeyError, ValueError, ZeroDivisionError):
+            return 0.0
+
+    def _pick(
+        self,
+        browser: str,
+        version: Optional[str],
+        tried: set,
+        live_load: Dict[str, float],
+    ) -> Optional[Hub]:
+        candidates = [
+            hub
+            for hub in self.hubs
+            if hub.url not in tried and hub.free_slots(browser, version) > 0
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda hub: (hub.load(browser, version), live_load.get(hub.url, 0.0)),
+        )
+
+    def _supported(self, browser: str, version: Optional[str], tried: set) -> bool:
+        return any(
+            hub.capacity(browser, version) > 0
+            for hub in self.hubs
+            if hub.url not in tried
+        )
+
+    def _reserve(self, browser: str, version: Optional[str], tried: set) -> Hub:
+        """
+        Blocks until a hub has a free slot and reserves it.
+        The /status of the hubs is read before taking the lock, so that a slow hub does
+        not hold up the other workers' threads.
+        """
+        queued_at = time.monotonic()
+        deadline = queued_at + self.queue_timeout
+        while True:
+            live_load = {
+                hub.url: self._live_load(hub)
+                for hub in self.hubs
+                if hub.url not in tried
+            }
+            with self._condition:
+                if not self._supported(browser, version, tried):
+                    raise SessionNotCreatedException(
+                        f"No hub left that can run {browser} {version or Hub.DEFAULT_VERSION}"
+                    )
+                hub = self._pick(browser, version, tried, live_load)
+                if hub:
+                    key = (browser, version or Hub.DEFAULT_VERSION)
+                    hub.used[key] = hub.used.get(key, 0) + 1
+                    waited = time.monotonic() - queued_at
+                    hub.queue_wait += waited
+                    hub.max_queue_wait = max(hub.max_queue_wait, waited)
+                    return hub
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(
+                        f"No free {browser} slot on any hub within {self.queue_timeout} seconds"
+                    )
+                self._condition.wait(remaining)
+
+    def release(self, hub: Hub, browser: str, version: Optional[str]) -> None:
+        """Frees the slot taken by a session and wakes up queued requests."""
+        key = (browser, version or Hub.DEFAULT_VERSION)
+        with self._condition:
+            hub.used[key] -= 1
+            self._condition.notify_all()
+
+    def acquire(
+        self, browser: str, version: Optional[str], options: ArgOptions
+    ) -> Tuple[Any, Hub]:
+        """
+        Creates a session on the least-loaded hub with a free slot.
+        If the hub refuses the session or cannot be reached, the next hub is tried.
+        Returns the session and the hub it runs on, which must be passed to finish().
+        """
+        tried = set()
+        while True:
+            hub = self._reserve(browser, version, tried)
+            try:
+                driver = self.session_factory(hub.url, options)
+            except BaseException as e:
+                self.release(hub, browser, version)
+                if not isinstance(
+                    e, (WebDriverException, urllib3.exceptions.HTTPError)
+                ):
+                    raise
+                self.logger.warning(f"Session not created on {hub.url}: {e}")
+                hub.failures += 1
+                tried.add(hub.url)
+                continue
+            hub.sessions += 1
+            driver.hub_acquired_at = time.monotonic()
+            self.logger.info(f"Session for {browser} created on {hub.url}")
+            return driver, hub
+
+    def finish(self, driver: Any, hub: Hub, browser: str, version: Optional[str]):
+        """Accounts the busy time of a finished session and releases its slot."""
+        hub.busy_seconds += time.monotonic() - driver.hub_acquired_at
+        self.release(hub, browser, version)
+
+    def report(self) -> Dict[str, Any]:
+        """Returns sessions, failures, queue wait and utilization per hub."""
+        elapsed = time.monotonic() - self.started_at
+        return {
+            hub.url: {
+                "sessions": hub.sessions,
+                "failures": hub.failures,
+                "queue_wait_seconds": round(hub.queue_wait, 3),
+                "max_queue_wait_seconds": round(hub.max_queue_wait, 3),
+                "utilization": round(
+                    hub.busy_seconds / (hub.total_capacity * elapsed), 3
+                )
+                if hub.total_capacity and elapsed
+                else 0.0,
+            }
+            for hub in self.hubs
+        }
+
+    def write_report(self, path: Optional[str]) -> None:
+        """Writes the per-hub report if a path is configured and sessions were scheduled."""
+        if not path or not any(hub.sessions or hub.failures for hub in self.hubs):
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,597 @@
+import argparse
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from src.main.frontend.helper.driver_service_manager import DriverServiceManager
+from src.main.frontend.helper.hub_scheduler import Hub
+from src.main.frontend.helper.remote_options import RemoteOptions
+
+
+class SessionNotCreated(Exception):
+    """Raised when the hub cannot hand out a session, answered as a W3C error."""
+
+
+class HubSession:
+    """A browser session on a local driver service."""
+
+    def __init__(self, browser: str, key: str, service: Service, value: Dict[str, Any]):
+        self.browser = browser
+        self.key = key
+        self.service = service
+        self.value = value
+        self.id = value["sessionId"]
+        self.acquired_at = time.monotonic()
+        self.last_used = self.acquired_at
+
+
+class LocalHub:
+    """
+    A small Selenoid stand-in: a WebDriver HTTP endpoint in front of headless browsers on
+    this machine, for developers and CI agents without Docker. Sessions are opened on driver
+    services kept running by DriverServiceManager; a few sessions per capability set are
+    launched ahead of time, with the capabilities RemoteOptions gives the tests, and handed
+    out warm. Concurrency is capped per browser, counting idle warm sessions as well, so
+    that no more browsers run than the limit; requests over the cap wait in a queue, and
+    /status answers in Selenoid's format so that --remote, -n auto and the HubScheduler
+    work against it unchanged.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    HUB_PREFIX = "/wd/hub"
+    OPTIONS_CLASSES = {
+        "chrome": ChromeOptions,
+        "firefox": FirefoxOptions,
+        "edge": EdgeOptions,
+    }
+    BROWSER_NAMES = {"MicrosoftEdge": "edge", "msedge": "edge"}
+    BACKEND_NAMES = {"chrome": "chrome", "firefox": "firefox", "edge": "MicrosoftEdge"}
+    HEADLESS = {
+        "chrome": ("goog:chromeOptions", ["--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]),
+        "edge": ("ms:edgeOptions", ["--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]),
+        "firefox": ("moz:firefoxOptions", ["-headless"]),
+    }  # fmt: skip
+    # Capabilities only meaningful to Selenoid or the client, not to the local browsers.
+    IGNORED_CAPABILITIES = ("selenoid:options", "browserVersion")
+
+    def __init__(
+        self,
+        capacity: Dict[str, int],
+        warm: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        queue_timeout: float = 300,
+        session_timeout: float = 60,
+        services: Optional[DriverServiceManager] = None,
+    ):
+        """
+        :param capacity: Maximum number of concurrent sessions per browser, e.g. {"chrome": 4}.
+        :param warm: Number of idle sessions kept launched per browser and capability set,
+            within the capacity of the browser.
+        :param host: Interface to listen on.
+        :param port: Port to listen on, 0 picks a free one.
+        :param queue_timeout: Maximum time in seconds a request may wait for a free slot.
+        :param session_timeout: Sessions without a command for this many seconds are closed.
+        :param services: Driver services to open sessions on.
+        """
+        self.hub = Hub(
+            "local",
+            {
+                browser: {Hub.DEFAULT_VERSION: limit}
+                for browser, limit in capacity.items()
+            },
+        )
+        self.warm = warm
+        self.queue_timeout = queue_timeout
+        self.session_timeout = session_timeout
+        self.services = services or DriverServiceManager()
+        self.sessions: Dict[str, HubSession] = {}
+        self.pool: Dict[str, List[HubSession]] = {}
+        self.launching: Dict[str, int] = {}
+        self.launching_keys: Dict[str, int] = {}
+        self.queued = 0
+        self.warm_hits = 0
+        self.cold_starts = 0
+        self.started_at = time.monotonic()
+        self._http = requests.Session()
+        self._http.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+        self._condition = threading.Condition()
+        self._launcher = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="hub-warm"
+        )
+        self._stopped = threading.Event()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._threads: List[threading.Thread] = []
+
+    @classmethod
+    def from_browsers_json(cls, path: str, limit: int, **kwargs) -> "LocalHub":
+        """Creates a hub for the browsers of a Selenoid browsers.json, `limit` sessions each."""
+        with open(path) as f:
+            browsers = json.load(f)
+        return cls({browser: limit for browser in browsers}, **kwargs)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def selenium_url(self) -> str:
+        """URL of the hub, to be used as --selenium_url."""
+        return f"{self.url}{self.HUB_PREFIX}"
+
+    def start(self) -> "LocalHub":
+        for target, name in (
+            (self._server.serve_forever, "local-hub"),
+            (self._reap_idle_sessions, "local-hub-reaper"),
+        ):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        for browser in self.hub.browsers:
+            self._refill(
+                self._backend_capabilities(
+                    RemoteOptions.create(browser).to_capabilities()
+                )
+            )
+        self.logger.info(f"Local hub listening at {self.selenium_url}")
+        return self
+
+    def serve_forever(self) -> None:
+        self.start()
+        self._stopped.wait()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+        self._launcher.shutdown(wait=True, cancel_futures=True)
+        with self._condition:
+            sessions = list(self.sessions.values()) + [
+                session for pooled in self.pool.values() for session in pooled
+            ]
+            self.sessions.clear()
+            self.pool.clear()
+        for session in sessions:
+            self._quit(session)
+        self.services.stop()
+
+    def _browser(self, capabilities: Dict[str, Any]) -> str:
+        name = capabilities.get("browserName", "")
+        return self.BROWSER_NAMES.get(name, name)
+
+    def _backend_capabilities(self, capabilities: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the capabilities to create a headless local session with."""
+        browser = self._browser(capabilities)
+        if browser not in self.HEADLESS:
+            raise SessionNotCreated(f"Browser {browser!r} is not supported")
+        backend = self.OPTIONS_CLASSES[browser]().to_capabilities()
+        backend.update(json.loads(json.dumps(capabilities)))
+        for name in self.IGNORED_CAPABILITIES:
+            backend.pop(name, None)
+        backend["browserName"] = self.BACKEND_NAMES[browser]
+        vendor_key, headless_args = self.HEADLESS[browser]
+        vendor_options = backend.setdefault(vendor_key, {})
+        vendor_options["args"] = list(
+            dict.fromkeys(vendor_options.get("args", []) + headless_args)
+        )
+        return backend
+
+    @staticmethod
+    def _requested_capabilities(body: Dict[str, Any]) -> Dict[str, Any]:
+        capabilities = body.get("capabilities", {})
+        first_match = (capabilities.get("firstMatch") or [{}])[0]
+        return {**capabilities.get("alwaysMatch", {}), **first_match}
+
+    def _forward(
+        self, method: str, url: str, body: Optional[bytes] = None
+    ) -> Tuple[int, bytes]:
+        response = self._http.request(
+            method,
+            url,
+            data=body,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            timeout=(5, None),
+        )
+        return response.status_code, response.content
+
+    def _launch(self, backend: Dict[str, Any]) -> HubSession:
+        """
+        Opens a new session with the backend capabilities on a driver service. The browser
+        binary found when the service was started is added here rather than to the backend
+        capabilities, so that it is not part of the warm pool key: sessions warmed before it
+        was known still match later requests.
+        """
+        browser = self._browser({"browserName": backend["browserName"]})
+        service = self.services.acquire_service(
+            browser, self.OPTIONS_CLASSES[browser]()
+        )
+        capabilities = json.loads(json.dumps(backend))
+        if self.services.browser_paths.get(browser):
+            vendor_key = self.HEADLESS[browser][0]
+            capabilities[vendor_key].setdefault(
+                "binary", self.services.browser_paths[browser]
+            )
+        body = json.dumps(
+            {"capabilities": {"alwaysMatch": capabilities, "firstMatch": [{}]}}
+        ).encode()
+        try:
+            status, data = self._forward("POST", f"{service.service_url}/session", body)
+            value = json.loads(data)["value"]
+        except (requests.RequestException, ValueError, KeyError) as e:
+            self.services.release_service(service)
+            raise SessionNotCreated(f"Driver service did not answer: {e}")
+        if status != 200:
+            self.services.release_service(service)
+            raise SessionNotCreated(value.get("message", data.decode()))
+        key = json.dumps(backend, sort_keys=True)
+        return HubSession(browser, key, service, value)
+
+    def _is_alive(self, session: HubSession) -> bool:
+        try:
+            status, _ = self._forward(
+                "GET", f"{session.service.service_url}/session/{session.id}/url"
+            )
+            return status == 200
+        except requests.RequestException:
+            return False
+
+    def _occupied(self, browser: str) -> int:
+        """Returns the browsers running for the hub: handed out, idle warm and launching."""
+        idle = sum(
+            len(pool)
+            for pool in self.pool.values()
+            if pool and pool[0].browser == browser
+        )
+        return (
+            self.hub.used.get((browser, Hub.DEFAULT_VERSION), 0)
+            + idle
+            + self.launching.get(browser, 0)
+        )
+
+    def _refill(self, backend: Dict[str, Any]) -> None:
+        """
+        Launches sessions in the background until `warm` are idle for the capabilities,
+        as far as the capacity of the browser leaves room for them.
+        """
+        if self._stopped.is_set():
+            return
+        key = json.dumps(backend, sort_keys=True)
+        browser = self._browser({"browserName": backend["browserName"]})
+        with self._condition:
+            missing = min(
+                self.warm
+                - len(self.pool.setdefault(key, []))
+                - self.launching_keys.get(key, 0),
+                self.hub.capacity(browser, None) - self._occupied(browser),
+            )
+            for _ in range(max(0, missing)):
+                self.launching[browser] = self.launching.get(browser, 0) + 1
+                self.launching_keys[key] = self.launching_keys.get(key, 0) + 1
+                self._launcher.submit(self._launch_warm, backend, browser, key)
+
+    def _launch_warm(self, backend: Dict[str, Any], browser: str, key: str) -> None:
+        session = None
+        try:
+            if not self._stopped.is_set():
+                session = self._launch(backend)
+        except SessionNotCreated as e:
+            self.logger.warning(f"Could not launch a warm session: {e}")
+        with self._condition:
+            self.launching[browser] -= 1
+            self.launching_keys[key] -= 1
+            if session is not None and not self._stopped.is_set():
+                self.pool.setdefault(key, []).append(session)
+                session = None
+            self._condition.notify_all()
+        if session is not None:
+            self._quit(session)
+
+    def _reserve(self, browser: str, key: str) -> Optional[HubSession]:
+        """
+        Blocks until a slot for the browser is free and takes it. Idle warm sessions count
+        against the capacity: a warm session for the key is handed over with its slot, and
+        warm sessions of other capabilities are closed when they hold the last slots.
+        Returns the warm session, or None if a session has to be launched.
+        """
+        if self.hub.capacity(browser, None) <= 0:
+            raise SessionNotCreated(f"Browser {browser!r} is not available on this hub")
+        queued_at = time.monotonic()
+        deadline = queued_at + self.queue_timeout
+        evicted = []
+        try:
+            with self._condition:
+                self.queued += 1
+                try:
+                    while True:
+                        pool = self.pool.get(key)
+                        session = pool.pop(0) if pool else None
+                        if session is not None:
+                            break
+                        if self._occupied(browser) < self.hub.capacity(browser, None):
+                            break
+                        other = next(
+                            (
+                                pooled
+                                for pooled in self.pool.values()
+                                if pooled and pooled[0].browser == browser
+                            ),
+                            None,
+                        )
+                        if other:
+                            evicted.append(other.pop(0))
+                            continue
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise SessionNotCreated(
+                                f"No free {browser} slot within {self.queue_timeout} seconds"
+                            )
+                        self._condition.wait(remaining)
+                finally:
+                    self.queued -= 1
+                slot = (browser, Hub.DEFAULT_VERSION)
+                self.hub.used[slot] = self.hub.used.get(slot, 0) + 1
+                waited = time.monotonic() - queued_at
+                self.hub.queue_wait += waited
+                self.hub.max_queue_wait = max(self.hub.max_queue_wait, waited)
+        finally:
+            for surplus in evicted:
+                self._quit(surplus)
+        return session
+
+    def _release(self, session: HubSession) -> None:
+        with self._condition:
+            self.hub.used[(session.browser, Hub.DEFAULT_VERSION)] -= 1
+            self.hub.busy_seconds += time.monotonic() - session.acquired_at
+            self._condition.notify_all()
+
+    def create_session(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Hands out a warm session for the requested capabilities or launches one."""
+        requested = self._requested_capabilities(body)
+        backend = self._backend_capabilities(requested)
+        browser = self._browser(requested)
+        session = self._reserve(browser, json.dumps(backend, sort_keys=True))
+        try:
+            if session is not None and not self._is_alive(session):
+                self.logger.warning(f"Warm session {session.id} died, discarding it")
+                self.services.release_service(session.service)
+                session = None
+            if session is not None:
+                self.warm_hits += 1
+            else:
+                self.cold_starts += 1
+                session = self._launch(backend)
+        except Exception:
+            with self._condition:
+                self.hub.used[(browser, Hub.DEFAULT_VERSION)] -= 1
+                self.hub.failures += 1
+                self._condition.notify_all()
+            raise
+        session.acquired_at = session.last_used = time.monotonic()
+        with self._condition:
+            self.sessions[session.id] = session
+        self.hub.sessions += 1
+        self._refill(backend)
+        self.logger.info(f"Session {session.id} for {browser} handed out")
+        return {"value": session.value}
+
+    def _quit(self, session: HubSession) -> None:
+        try:
+            self._forward(
+                "DELETE", f"{session.service.service_url}/session/{session.id}"
+            )
+        except requests.RequestException as e:
+            self.logger.warning(f"Failed to quit session {session.id}: {e}")
+        self.services.release_service(session.service)
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._condition:
+            session = self.sessions.pop(session_id, None)
+        if session is None:
+            return False
+        self._quit(session)
+        self._release(session)
+        # The freed slot takes the warm session that could not be launched while it was used
+        self._refill(json.loads(session.key))
+        return True
+
+    def _reap_idle_sessions(self) -> None:
+        while not self._stopped.wait(1):
+            now = time.monotonic()
+            with self._condition:
+                idle = [
+                    session_id
+                    for session_id, session in self.sessions.items()
+                    if now - session.last_used > self.session_timeout
+                ]
+            for session_id in idle:
+                self.logger.warning(
+                    f"Closing session {session_id} idle for {self.session_timeout} seconds"
+                )
+                self.delete_session(session_id)
+
+    def status(self) -> Dict[str, Any]:
+        """Returns the hub state in the format of Selenoid's /status."""
+        with self._condition:
+            browsers = {
+                browser: {
+                    version: {
+                        "local": {
+                            "count": self.hub.used.get((browser, version), 0),
+                            "sessions": [
+                                {"id": session.id}
+                                for session in self.sessions.values()
+                                if session.browser == browser
+                            ],
+                        }
+                    }
+                    for version in versions
+                }
+                for browser, versions in self.hub.browsers.items()
+            }
+            return {
+                "total": self.hub.total_capacity,
+                "used": sum(self.hub.used.values()),
+                "queued": self.queued,
+                "pending": 0,
+                "browsers": browsers,
+            }
+
+    def report(self) -> Dict[str, Any]:
+        """Returns sessions handed out, queue wait, utilization and warm pool hits."""
+        elapsed = time.monotonic() - self.started_at
+        with self._condition:
+            busy = self.hub.busy_seconds + sum(
+                time.monotonic() - session.acquired_at
+                for session in self.sessions.values()
+            )
+            warm = {key: len(pool) for key, pool in self.pool.items()}
+        return {
+            "sessions": self.hub.sessions,
+            "failures": self.hub.failures,
+            "warm_hits": self.warm_hits,
+            "cold_starts": self.cold_starts,
+            "queued": self.queued,
+            "queue_wait_seconds": round(self.hub.queue_wait, 3),
+            "max_queue_wait_seconds": round(self.hub.max_queue_wait, 3),
+            "utilization": round(busy / (self.hub.total_capacity * elapsed), 3)
+            if self.hub.total_capacity and elapsed
+            else 0.0,
+            "warm_sessions": sum(warm.values()),
+        }
+
+    def proxy(self, method: str, path: str, body: Optional[bytes]) -> Tuple[int, bytes]:
+        """Forwards a command of a session to the driver service running it."""
+        session_id = path.split("/")[2]
+        with self._condition:
+            session = self.sessions.get(session_id)
+        if session is None:
+            return 404, self.error(
+                "invalid session id", f"Unknown session {session_id}"
+            )
+        session.last_used = time.monotonic()
+        try:
+            return self._forward(method, f"{session.service.service_url}{path}", body)
+        except requests.RequestException as e:
+            return 500, self.error("unknown error", f"Driver service failed: {e}")
+
+    @staticmethod
+    def error(error: str, message: str) -> bytes:
+        return json.dumps(
+            {"value": {"error": error, "message": message, "stacktrace": ""}}
+        ).encode()
+
+    def _handler(self):
+        hub = self
+
+        class HubHandler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _path(self) -> str:
+                path = self.path.split("?")[0]
+                if path.startswith(hub.HUB_PREFIX):
+                    path = path[len(hub.HUB_PREFIX) :]
+                return path.rstrip("/") or "/"
+
+            def _body(self) -> Optional[bytes]:
+                length = int(self.headers.get("Content-Length", 0))
+                return self.rfile.read(length) if length else None
+
+            def _route(self, method: str) -> None:
+                path = self._path()
+                body = self._body()
+                parts = path.strip("/").split("/")
+                if method == "GET" and path == "/status":
+                    self._send(200, json.dumps(hub.status()).encode())
+                elif method == "GET" and path == "/metrics":
+                    self._send(200, json.dumps(hub.report()).encode())
+                elif method == "POST" and path == "/session":
+                    try:
+                        created = hub.create_session(json.loads(body or b"{}"))
+                    except (SessionNotCreated, ValueError) as e:
+                        self._send(500, hub.error("session not created", str(e)))
+                        return
+                    self._send(200, json.dumps(created).encode())
+                elif method == "DELETE" and len(parts) == 2 and parts[0] == "session":
+                    if hub.delete_session(parts[1]):
+                        self._send(200, b'{"value": null}')
+                    else:
+                        self._send(
+                            404,
+                            hub.error(
+                                "invalid session id", f"Unknown session {parts[1]}"
+                            ),
+                        )
+                elif len(parts) > 2 and parts[0] == "session":
+                    self._send(*hub.proxy(method, path, body))
+                else:
+                    self._send(404, hub.error("unknown command", f"{method} {path}"))
+
+            def do_GET(self):
+                self._route("GET")
+
+            def do_POST(self):
+                self._route("POST")
+
+            def do_DELETE(self):
+                self._route("DELETE")
+
+            def log_message(self, format, *args):
+                hub.logger.debug(format % args)
+
+        return HubHandler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve local headless browsers over the WebDriver protocol, like Selenoid"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4444)
+    parser.add_argument(
+        "--browsers",
+        default="browsers.json",
+        help="Selenoid browsers.json to take the browsers from",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=4, help="Concurrent sessions per browser"
+    )
+    parser.add_argument(
+        "--warm", type=int, default=1, help="Idle sessions kept launched per browser"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="Seconds after which an idle session is closed",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    local_hub = LocalHub.from_browsers_json(
+        args.browsers,
+        args.limit,
+        warm=args.warm,
+        host=args.host,
+        port=args.port,
+        session_timeout=args.timeout,
+    )
+    try:
+        local_hub.serve_forever()
+    except KeyboardInterrupt:
+        local_hub.stop()
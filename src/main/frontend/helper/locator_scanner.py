@@ -0,0 +1,212 @@
+import argparse
+import fnmatch
+import glob
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import re
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from cssselect import GenericTranslator, SelectorError
+from lxml import etree, html
+
+from src.main.frontend.pages.locator import Locator
+
+
+class LocatorScanner:
+    """
+    Evaluates the XPath constants of all page objects against saved DOM snapshots.
+    For every locator it reports the match count per snapshot and the evaluation cost,
+    flags invalid, unmatched and ambiguous locators and suggests cheaper equivalents.
+    Locators with a CSS selector are checked to select the same elements as their XPath.
+    Locators are checked against the snapshots of the pages their class is used on
+    (PAGE_SNAPSHOTS, all snapshots for classes not listed there).
+    Locators whose name is plural (e.g. TABLE_ROWS) are expected to match several elements.
+    """
+
+    PAGES_PACKAGE = "src.main.frontend.pages"
+    PAGE_SNAPSHOTS = {
+        "LoginPage": ("login*.html",),
+        "PasswordResetPage": ("reset_password*.html",),
+        "DashboardPage": ("dashboard.html",),
+        "PimPage": ("pim_*.html",),
+        "RecruitmentPage": ("recruitment_*.html",),
+        "UserDetailsElement": (
+            "pim_add_employee.html",
+            "recruitment_add_candidate.html",
+        ),
+    }
+    # libxml2 accepts some expressions that browsers reject with "not a valid XPath expression"
+    BROWSER_INVALID = [
+        (re.compile(r"///"), "'///' is not valid XPath 1.0"),
+        (re.compile(r"\[\s*\]"), "empty predicate"),
+    ]
+    SLOW_FACTOR = 3
+
+    def __init__(self, snapshots_dir: str, repeat: int = 20):
+        """
+        :param snapshots_dir: Directory with the *.html snapshots.
+        :param repeat: How many times each locator is evaluated per snapshot to time it.
+        """
+        self.repeat = repeat
+        self.snapshots = {
+            os.path.basename(path): html.parse(path).getroot()
+            for path in sorted(glob.glob(os.path.join(snapshots_dir, "*.html")))
+        }
+
+    @classmethod
+    def collect_locators(cls) -> Dict[str, str]:
+        """Imports every page module and returns its classes' Locator constants by Class.NAME."""
+        package = importlib.import_module(cls.PAGES_PACKAGE)
+        locators = {}
+        for module_info in pkgutil.walk_packages(
+            package.__path__, f"{package.__name__}."
+        ):
+            module = importlib.import_module(module_info.name)
+            for class_name, page_class in inspect.getmembers(module, inspect.isclass):
+                if page_class.__module__ != module.__name__:
+                    continue
+                for name, value in vars(page_class).items():
+                    if name.isupper() and isinstance(value, Locator):
+                        locators[f"{class_name}.{name}"] = value
+        return locators
+
+    @classmethod
+    def suggestions(cls, xpath: str) -> List[str]:
+        hints = []
+        if getattr(xpath, "css", None) is None and Locator.compile_css(xpath):
+            hints.append(f"use the CSS selector {Locator.compile_css(xpath)!r}")
+        if "translate(" in xpath:
+            hints.append(
+                "translate() case-folds the attribute of every candidate; "
+                "match the exact value or anchor on an id/name attribute"
+            )
+        if "ancestor::" in xpath:
+            hints.append(
+                "ancestor:: walks up from every candidate before searching down again; "
+                "anchor on the field's own attributes or use following-sibling::"
+            )
+        if re.search(r"text\(\)\s*=\s*'\s|\s'\s*\]", xpath):
+            hints.append(
+                "exact text() with surrounding spaces is brittle; use normalize-space()"
+            )
+        if xpath.startswith("//*"):
+            hints.append("//* scans every element; name the tag")
+        return hints
+
+    def _evaluate(self, compiled: etree.XPath, document) -> Dict[str, Any]:
+        started = time.perf_counter()
+        for _ in range(self.repeat):
+            result = compiled(document)
+        elapsed = (time.perf_counter() - started) / self.repeat
+        count = len(result) if isinstance(result, list) else int(bool(result))
+        return {"matches": count, "micros": elapsed * 1_000_000}
+
+    def snapshots_for(self, name: str) -> Dict[str, Any]:
+        patterns = self.PAGE_SNAPSHOTS.get(name.split(".")[0], ("*",))
+        return {
+            snapshot: document
+            for snapshot, document in self.snapshots.items()
+            if any(fnmatch.fnmatch(snapshot, pattern) for pattern in patterns)
+        }
+
+    def scan_locator(self, name: str, xpath: str) -> Dict[str, Any]:
+        css = getattr(xpath, "css", None)
+        report: Dict[str, Any] = {
+            "name": name,
+            "xpath": str(xpath),
+            "css": css,
+            "problems": [],
+            "warnings": [],
+        }
+        unquoted = re.sub(r"'[^']*'|\"[^\"]*\"", "''", xpath)
+        for pattern, reason in self.BROWSER_INVALID:
+            if pattern.search(unquoted):
+                report["problems"].append(f"invalid XPath: {reason}")
+        try:
+            compiled = etree.XPath(xpath)
+        except etree.XPathSyntaxError as e:
+            report["problems"].append(f"invalid XPath: {e}")
+        if css:
+            try:
+                css_compiled = etree.XPath(GenericTranslator().css_to_xpath(css))
+            except (SelectorError, etree.XPathSyntaxError) as e:
+                report["problems"].append(f"invalid CSS selector {css!r}: {e}")
+        if report["problems"]:
+            return report
+
+        matches = {}
+        costs = []
+        for snapshot, document in self.snapshots_for(name).items():
+            evaluated = self._evaluate(compiled, document)
+            costs.append(evaluated["micros"])
+            if evaluated["matches"]:
+                matches[snapshot] = evaluated["matches"]
+            if css and css_compiled(document) != compiled(document):
+                report["problems"].append(
+                    f"CSS selector {css!r} selects other elements than the XPath in {snapshot}"
+                )
+        report["matches"] = matches
+        report["cost_micros"] = round(statistics.mean(costs), 1) if costs else None
+        is_collection = name.endswith("S")
+        if not matches:
+            report["problems"].append("matches nothing in any snapshot")
+        elif not is_collection and max(matches.values()) > 1:
+            ambiguous = {k: v for k, v in matches.items() if v > 1}
+            report["problems"].append(f"ambiguous: {ambiguous}")
+        report["suggestions"] = self.suggestions(xpath)
+        return report
+
+    def scan(self, locators: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Scans the given locators, by default all page-object locators, sorted by cost."""
+        locators = locators if locators is not None else self.collect_locators()
+        reports = [self.scan_locator(name, xpath) for name, xpath in locators.items()]
+        costs = [r["cost_micros"] for r in reports if r.get("cost_micros")]
+        median = statistics.median(costs) if costs else 0
+        for report in reports:
+            if median and (report.get("cost_micros") or 0) > self.SLOW_FACTOR * median:
+                report["warnings"].append(
+                    f"slow: {report['cost_micros']}us vs median {median:.1f}us"
+                )
+        return sorted(reports, key=lambda r: -(r.get("cost_micros") or float("inf")))
+
+    @staticmethod
+    def format_report(reports: List[Dict[str, Any]]) -> str:
+        lines = []
+        for report in reports:
+            cost = report.get("cost_micros")
+            status = "FAIL" if report["problems"] else "ok"
+            lines.append(
+                f"{status:4} {report['name']:<55} "
+                f"{'-' if cost is None else f'{cost:8.1f}us'} "
+                f"{sum(report.get('matches', {}).values())} matches"
+            )
+            for problem in report["problems"]:
+                lines.append(f"       ! {problem}")
+            for warning in report.get("warnings", []):
+                lines.append(f"       ? {warning}")
+            for suggestion in report.get("suggestions", []):
+                lines.append(f"       ~ {suggestion}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check page-object locators against saved DOM snapshots"
+    )
+    parser.add_argument("--snapshots", default="src/tests/frontend/snapshots")
+    parser.add_argument("--json", help="Also write the report to this JSON file")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    scan_reports = LocatorScanner(args.snapshots, args.repeat).scan()
+    print(LocatorScanner.format_report(scan_reports))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(scan_reports, f, indent=2)
+    sys.exit(1 if any(r["problems"] for r in scan_reports) else 0)
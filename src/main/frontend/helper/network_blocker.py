@@ -0,0 +1,194 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import requests
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class NetworkBlocker:
+    """
+    Blocks requests to analytics, fonts, images and other assets in Chromium-based sessions
+    using DevTools Network.setBlockedURLs. Blocked requests are read back from the
+    performance log so they can be reported after the test.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    URL_PATTERNS = {
+        "analytics": [
+            "*google-analytics.com*",
+            "*googletagmanager.com*",
+            "*doubleclick.net*",
+            "*hotjar.com*",
+            "*segment.io*",
+            "*facebook.net*",
+        ],
+        "fonts": [
+            "*fonts.googleapis.com*",
+            "*fonts.gstatic.com*",
+            "*.woff",
+            "*.woff2",
+            "*.ttf",
+            "*.otf",
+            "*.eot",
+        ],
+        "images": [
+            "*.png",
+            "*.jpg",
+            "*.jpeg",
+            "*.gif",
+            "*.svg",
+            "*.webp",
+            "*.ico",
+        ],
+        "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav"],
+    }
+    LOGGING_PREFS = {"chrome": "goog:loggingPrefs", "edge": "ms:loggingPrefs"}
+    CDP_VENDOR_PREFIX = {"chrome": "goog", "edge": "ms"}
+
+    def __init__(self, browser: WebDriver, browser_name: str, patterns: List[str]):
+        self.browser = browser
+        self.browser_name = browser_name
+        self.patterns = patterns
+
+    @classmethod
+    def resolve_patterns(
+        cls, categories: Optional[str], extra_urls: Optional[str]
+    ) -> List[str]:
+        """
+        Builds the list of URL patterns from comma-separated category names and extra patterns.
+        """
+        patterns = []
+        for category in filter(
+            None, (c.strip() for c in (categories or "").split(","))
+        ):
+            if category not in cls.URL_PATTERNS:
+                raise ValueError(
+                    f"Unknown asset category '{category}', expected one of {list(cls.URL_PATTERNS)}"
+                )
+            patterns.extend(cls.URL_PATTERNS[category])
+        patterns.extend(
+            filter(None, (u.strip() for u in (extra_urls or "").split(",")))
+        )
+        return patterns
+
+    @classmethod
+    def is_supported(cls, browser_name: str) -> bool:
+        return browser_name in cls.LOGGING_PREFS
+
+    @classmethod
+    def enable_performance_log(cls, options: ArgOptions, browser_name: str) -> None:
+        """Turns on the performance log which carries the blocked-request events."""
+        options.set_capability(cls.LOGGING_PREFS[browser_name], {"performance": "ALL"})
+
+    def install(self) -> "NetworkBlocker":
+        """Enables the Network domain and sends the list of blocked URL patterns."""
+        executor = self.browser.command_executor
+        if executor.get_command("executeCdpCommand") is None:
+            executor.add_command(
+                "executeCdpCommand",
+                "POST",
+                f"/session/$sessionId/{self.CDP_VENDOR_PREFIX[self.browser_name]}/cdp/execute",
+            )
+        self.browser.execute_cdp_cmd("Network.enable", {})
+        self.browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+        self.logger.info(f"Blocking {len(self.patterns)} URL patterns.")
+        return self
+
+    def collect(self) -> Dict[str, Any]:
+        """
+        Reads the performance log and returns the blocked URLs and the bytes actually loaded.
+        """
+        try:
+            entries = self.browser.get_log("performance")
+        except WebDriverException as e:
+            self.logger.warning(f"Performance log is not available: {e}")
+            return {"blocked": [], "bytes_loaded": 0}
+
+        urls = {}
+        blocked = []
+        bytes_loaded = 0
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            method = message.get("method")
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked.append(urls.get(params["requestId"], params["requestId"]))
+            elif method == "Network.loadingFinished":
+                bytes_loaded += int(params.get("encodedDataLength", 0))
+        return {"blocked": blocked, "bytes_loaded": bytes_loaded}
+
+
+class NetworkBlockReport:
+    """
+    Collects blocked requests of all tests and writes them to a JSON report.
+    Blocked requests never reach the network, so their size is unknown. With
+    estimate_sizes, it is looked up once per URL with a HEAD request when the report is
+    written; this contacts the blocked hosts and is therefore off by default.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, path: Optional[str], estimate_sizes: bool = False):
+        """
+        :param path: Path of the JSON report, None disables it.
+        :param estimate_sizes: Look up the size of every blocked URL with a HEAD request.
+        """
+        self.path = path
+        self.estimate_sizes = estimate_sizes
+        self.tests: List[Dict[str, Any]] = []
+
+    def add(self, test_name: str, collected: Dict[str, Any]) -> None:
+        self.tests.append({"test": test_name, **collected})
+
+    @staticmethod
+    def _content_length(url: str) -> Optional[int]:
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=5)
+            return int(response.headers["Content-Length"])
+        except (requests.RequestException, KeyError, ValueError):
+            return None
+
+    def _sizes(self, urls: List[str]) -> Dict[str, Optional[int]]:
+        if not self.estimate_sizes or not urls:
+            return {url: None for url in urls}
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as pool:
+            return dict(zip(urls, pool.map(self._content_length, urls)))
+
+    def write(self) -> None:
+        if not self.path or not self.tests:
+            return
+        counts: Dict[str, int] = {}
+        for test in self.tests:
+            for url in test["blocked"]:
+                counts[url] = counts.get(url, 0) + 1
+
+        sizes = self._sizes(list(counts))
+        blocked = []
+        bytes_saved = 0
+        for url, count in sorted(counts.items(), key=lambda item: -item[1]):
+            size = sizes[url]
+            if size is not None:
+                bytes_saved += size * count
+            blocked.append({"url": url, "count": count, "bytes": size})
+
+        report = {
+            "blocked_requests": sum(counts.values()),
+            "bytes_saved": bytes_saved if self.estimate_sizes else None,
+            "bytes_loaded": sum(test["bytes_loaded"] for test in self.tests),
+            "urls": blocked,
+            "tests": self.tests,
+        }
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(report, f, indent=2)
+        self.logger.info(f"Blocked {report['blocked_requests']} requests.")
+        if self.estimate_sizes:
+            self.logger.info(f"About {bytes_saved} bytes saved.")
@@ -0,0 +1,128 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import allure
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class PerformanceCollector:
+    """
+    Reads Navigation Timing, paint, largest-contentful-paint and resource timing entries
+    with performance.getEntries() after navigations and key page-object actions.
+    Every captured step is attached to allure and can be checked against thresholds.
+    Timings are in milliseconds, sizes in bytes.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    JS_COLLECT_METRICS = """
+        const [seenResources, timeOrigin] = arguments;
+        const navigation = performance.getEntriesByType("navigation")[0];
+        const paints = {};
+        for (const paint of performance.getEntriesByType("paint")) {
+            paints[paint.name] = paint.startTime;
+        }
+        let largestContentfulPaint = null;
+        try {
+            const observer = new PerformanceObserver(() => {});
+            observer.observe({ type: "largest-contentful-paint", buffered: true });
+            const entries = observer.takeRecords();
+            observer.disconnect();
+            if (entries.length) {
+                largestContentfulPaint = entries[entries.length - 1].startTime;
+            }
+        } catch (e) {}
+        const resources = performance.getEntriesByType("resource");
+        const stepResources = resources.slice(
+            timeOrigin === performance.timeOrigin ? seenResources : 0
+        );
+        return {
+            url: location.href,
+            time_origin: performance.timeOrigin,
+            ttfb: navigation ? navigation.responseStart - navigation.requestStart : null,
+            dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd : null,
+            load: navigation ? navigation.loadEventEnd : null,
+            first_paint: paints["first-paint"] ?? null,
+            first_contentful_paint: paints["first-contentful-paint"] ?? null,
+            largest_contentful_paint: largestContentfulPaint,
+            resource_count: resources.length,
+            step_resource_count: stepResources.length,
+            step_transfer_size: stepResources.reduce(
+                (total, resource) => total + (resource.transferSize || 0), 0
+            ),
+            slowest_resources: stepResources
+                .sort((a, b) => b.duration - a.duration)
+                .slice(0, 5)
+                .map((resource) => ({ name: resource.name, duration: resource.duration })),
+        };
+    """
+
+    METRICS = (
+        "ttfb",
+        "dom_content_loaded",
+        "load",
+        "first_paint",
+        "first_contentful_paint",
+        "largest_contentful_paint",
+        "resource_count",
+        "step_resource_count",
+        "step_transfer_size",
+    )
+
+    def __init__(self, browser: WebDriver):
+        self.browser = browser
+        self.steps: List[Dict[str, Any]] = []
+        self._seen_resources = 0
+        self._time_origin = None
+
+    def capture(self, step: str) -> Optional[Dict[str, Any]]:
+        """
+        Collects the metrics of the current page, remembers them under the step name
+        and attaches them to allure.
+        """
+        try:
+            metrics = self.browser.execute_script(
+                self.JS_COLLECT_METRICS, self._seen_resources, self._time_origin
+            )
+        except WebDriverException as e:
+            self.logger.warning(f"Could not collect performance metrics: {e}")
+            return None
+
+        self._time_origin = metrics.pop("time_origin")
+        self._seen_resources = metrics["resource_count"]
+        metrics = {"step": step, **metrics}
+        self.steps.append(metrics)
+        allure.attach(
+            name=f"performance: {step}",
+            body=json.dumps(metrics, indent=2),
+            attachment_type=allure.attachment_type.JSON,
+        )
+        return metrics
+
+    def check_budget(
+        self, step: Optional[str] = None, **thresholds: float
+    ) -> List[str]:
+        """
+        Compares captured metrics with thresholds given as metric=max_value,
+        e.g. largest_contentful_paint=4000. If step is given, only steps whose name contains it
+        are checked. Returns a list of human-readable violations.
+        Raises ValueError for unknown metric names, so that a typo doesn't disable the budget.
+        """
+        unknown = sorted(set(thresholds) - set(self.METRICS))
+        if unknown:
+            raise ValueError(
+                f"Unknown performance metrics {unknown}, expected some of {list(self.METRICS)}"
+            )
+        violations = []
+        for captured in self.steps:
+            if step and step not in captured["step"]:
+                continue
+            for metric, limit in thresholds.items():
+                value = captured.get(metric)
+                if value is not None and value > limit:
+                    violations.append(
+                        f"{metric}={value:.0f} exceeds {limit} at step '{captured['step']}'"
+                    )
+        return violations
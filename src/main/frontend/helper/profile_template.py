@@ -0,0 +1,136 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.options import ArgOptions
+
+from src.main.frontend.helper.worker_helper import WorkerHelper
+
+
+class ProfileTemplate:
+    """
+    A browser profile whose HTTP cache holds the static assets of the application (JS
+    bundles, CSS, fonts), built once per run by loading the warm-up URLs in a throwaway
+    session. Every local session starts from its own copy of the template, so the first
+    page load is served from the disk cache instead of downloading the bundles again.
+    Chrome and Edge get the copy as --user-data-dir, Firefox as -profile.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    # Files a running browser keeps in its profile to lock it against a second instance.
+    LOCK_FILES = (
+        "SingletonLock",
+        "SingletonSocket",
+        "SingletonCookie",
+        "lockfile",
+        "lock",
+        ".parentlock",
+        "parent.lock",
+    )
+    JS_WAIT_FOR_FONTS = """
+        const done = arguments[arguments.length - 1];
+        document.fonts.ready.then(() => done(true), () => done(false));
+    """
+
+    def __init__(
+        self,
+        root: str,
+        urls: List[str],
+        launch: Callable[[str, str], Any],
+        stop: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        :param root: Directory the templates and the session copies are kept in.
+        :param urls: Pages loaded to fill the cache of the template.
+        :param launch: Starts a session with the browser name and a profile directory.
+        :param stop: Quits a session started by launch, driver.quit() by default.
+        """
+        self.root = os.path.abspath(root)
+        self.urls = urls
+        self.launch = launch
+        self.stop = stop or (lambda driver: driver.quit())
+        self.clones = 0
+        self.clone_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def reset(root: str) -> None:
+        """Removes the templates of a previous run, so that they are built again."""
+        shutil.rmtree(root, ignore_errors=True)
+
+    def template_dir(self, browser_name: str) -> str:
+        return os.path.join(self.root, browser_name)
+
+    def ensure(self, browser_name: str) -> str:
+        """Returns the template of the browser, building it if no worker has done so yet."""
+        template = self.template_dir(browser_name)
+        with self._lock:
+            if not os.path.isdir(template):
+                self._build(browser_name, template)
+        return template
+
+    def _build(self, browser_name: str, template: str) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        started = time.perf_counter()
+        build_dir = tempfile.mkdtemp(prefix=f".{browser_name}-", dir=self.root)
+        driver = self.launch(browser_name, build_dir)
+        try:
+            for url in self.urls:
+                driver.get(url)
+                try:
+                    driver.execute_async_script(self.JS_WAIT_FOR_FONTS)
+                except WebDriverException as e:
+                    self.logger.debug(f"Could not wait for the fonts of {url}: {e}")
+        finally:
+            self.stop(driver)
+        try:
+            # Workers racing for the same template: the first rename wins.
+            os.rename(build_dir, template)
+        except OSError:
+            shutil.rmtree(build_dir, ignore_errors=True)
+            return
+        self.logger.info(
+            f"Built {browser_name} profile template in {time.perf_counter() - started:.1f}s"
+        )
+
+    def clone(self, browser_name: str) -> str:
+        """Copies the template of the browser to a new profile directory for one session."""
+        template = self.ensure(browser_name)
+        started = time.perf_counter()
+        sessions_dir = os.path.join(
+            self.root, "sessions", WorkerHelper.get_worker_id() or "main"
+        )
+        os.makedirs(sessions_dir, exist_ok=True)
+        profile_dir = tempfile.mkdtemp(prefix=f"{browser_name}-", dir=sessions_dir)
+        shutil.copytree(
+            template,
+            profile_dir,
+            ignore=shutil.ignore_patterns(*self.LOCK_FILES),
+            symlinks=True,
+            dirs_exist_ok=True,
+        )
+        self.clones += 1
+        self.clone_seconds += time.perf_counter() - started
+        return profile_dir
+
+    @staticmethod
+    def discard(profile_dir: str) -> None:
+        """Removes the profile copy of a quit session."""
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+    @staticmethod
+    def apply(options: ArgOptions, browser_name: str, profile_dir: str) -> ArgOptions:
+        """Makes the browser start with the profile directory."""
+        if browser_name == "firefox":
+            options.add_argument("-profile")
+            options.add_argument(profile_dir)
+            options.set_preference("browser.cache.disk.parent_directory", profile_dir)
+        else:
+            options.add_argument(f"--user-data-dir={profile_dir}")
+        return options
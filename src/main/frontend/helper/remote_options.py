@@ -0,0 +1,60 @@
+from typing import Optional
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+
+class RemoteOptions:
+    """
+    Builds the options of a session on a Selenoid hub. The local hub pre-warms its
+    sessions with the same capabilities, so that they match what the tests request.
+    """
+
+    OPTIONS_CLASSES = {
+        "chrome": ChromeOptions,
+        "firefox": FirefoxOptions,
+        "edge": EdgeOptions,
+    }
+
+    @staticmethod
+    def create(
+        browser_name: str,
+        version: Optional[str] = None,
+        test_name: Optional[str] = None,
+        vnc: bool = False,
+        video: bool = False,
+        logs: bool = False,
+    ) -> ArgOptions:
+        """
+        Returns the options of a remote session of the browser.
+        :param browser_name: chrome, firefox or edge.
+        :param version: Browser version, None for the hub's default.
+        :param test_name: Session name shown by Selenoid.
+        :param vnc: Enable VNC in the browser container.
+        :param video: Record a video of the session.
+        :param logs: Keep the session logs.
+        """
+        if browser_name not in RemoteOptions.OPTIONS_CLASSES:
+            raise ValueError(
+                f"Unsupported browser for remote execution: {browser_name}"
+            )
+        options = RemoteOptions.OPTIONS_CLASSES[browser_name]()
+        caps = {
+            "browserName": browser_name,
+            "browserVersion": version,
+            "selenoid:options": {
+                "enableVNC": vnc,
+                "name": test_name,
+                "screenResolution": "1280x2000",
+                "enableVideo": video,
+                "enableLog": logs,
+                "timeZone": "Europe/Moscow",
+                "env": ["LANG=ru_RU.UTF-8", "LANGUAGE=ru:en", "LC_ALL=ru_RU.UTF-8"],
+            },
+            "acceptInsecureCerts": True,
+        }
+        for k, v in caps.items():
+            options.set_capability(k, v)
+        return options
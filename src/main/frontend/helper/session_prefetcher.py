@@ -0,0 +1,108 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, List, Tuple
+
+
+class SessionPrefetcher:
+    """
+    Creates browser sessions in background threads ahead of the tests that will use them,
+    and quits finished sessions in the background, so that the teardown of one test
+    overlaps with the session startup of the next ones.
+    Sessions are matched to tests by a capabilities key; pre-spawned sessions whose key
+    is no longer expected are discarded.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        start_session: Callable[[Hashable, str], Any],
+        stop_session: Callable[[Any], None],
+        depth: int,
+    ):
+        """
+        :param start_session: Creates a session for a capabilities key and a test name.
+        :param stop_session: Quits a session.
+        :param depth: How many sessions to keep pre-spawned.
+        """
+        self.start_session = start_session
+        self.stop_session = stop_session
+        self.depth = depth
+        self._pending: List[Tuple[Hashable, Future]] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(depth, 1) + 1, thread_name_prefix="session-prefetch"
+        )
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def acquire(self, key: Hashable, test_name: str) -> Any:
+        """
+        Returns a pre-spawned session for the key, or creates one if none was prefetched.
+        """
+        with self._lock:
+            future = next((f for k, f in self._pending if k == key), None)
+            if future is not None:
+                self._pending.remove((key, future))
+        if future is not None:
+            try:
+                session = future.result()
+                self.hits += 1
+                return session
+            except Exception as e:
+                self.logger.warning(f"Pre-spawned session failed to start: {e}")
+        self.misses += 1
+        return self.start_session(key, test_name)
+
+    def prefetch(self, upcoming: List[Tuple[Hashable, str]]) -> None:
+        """
+        Aligns pre-spawned sessions with the upcoming tests given as (key, test name):
+        sessions for keys that are not expected any more are discarded and new ones are
+        started until `depth` sessions are pending.
+        """
+        upcoming = upcoming[: self.depth]
+        expected = [key for key, _ in upcoming]
+        with self._lock:
+            for key, future in list(self._pending):
+                if key in expected:
+                    expected.remove(key)
+                else:
+                    self._pending.remove((key, future))
+                    self._discard(future)
+            for key, test_name in upcoming:
+                if len(self._pending) >= self.depth:
+                    break
+                if key in expected:
+                    expected.remove(key)
+                    self._pending.append(
+                        (key, self._executor.submit(self.start_session, key, test_name))
+                    )
+
+    def release(self, session: Any) -> None:
+        """Quits a finished session in the background."""
+        self._executor.submit(self._stop_quietly, session)
+
+    def _discard(self, future: Future) -> None:
+        self.discarded += 1
+        future.add_done_callback(
+            lambda done: done.exception() is None and self._stop_quietly(done.result())
+        )
+
+    def _stop_quietly(self, session: Any) -> None:
+        try:
+            self.stop_session(session)
+        except Exception as e:
+            self.logger.warning(f"Failed to quit session: {e}")
+
+    def close(self) -> None:
+        """Discards all pre-spawned sessions and waits for background work to finish."""
+        with self._lock:
+            for _, future in self._pending:
+                self._discard(future)
+            self._pending.clear()
+        self._executor.shutdown(wait=True)
+        self.logger.info(
+            f"Session prefetch: {self.hits} hits, {self.misses} misses, {self.discarded} discarded"
+        )
@@ -0,0 +1,156 @@
+import functools
+import json
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.main.frontend.helper.action_log import ActionLog
+
+
+class StepTracer:
+    """
+    Keeps the last page-object steps of a test in a bounded in-memory ring buffer:
+    action, locator, start time, duration, outcome and, optionally, a small DOM snapshot.
+    Recording a step costs no WebDriver commands unless DOM snapshots are enabled,
+    so the trace is only serialized when a test fails.
+    """
+
+    SNAPSHOT_LENGTH = 2000
+    JS_DOM_SNAPSHOT = """
+        const [xpath, length] = arguments;
+        let element = null;
+        if (xpath) {
+            try {
+                element = document.evaluate(
+                    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue;
+            } catch (e) {}
+        }
+        return {
+            url: location.href,
+            title: document.title,
+            ready_state: document.readyState,
+            active_element: document.activeElement ? document.activeElement.tagName : null,
+            element: element ? element.outerHTML.slice(0, length) : null,
+        };
+    """
+
+    def __init__(
+        self, browser: WebDriver, capacity: int = 50, dom_snapshot: bool = False
+    ):
+        """
+        :param browser: WebDriver to take DOM snapshots with.
+        :param capacity: Number of most recent steps to keep.
+        :param dom_snapshot: Also record the URL and the outerHTML of the step's element.
+        """
+        self.browser = browser
+        self.dom_snapshot = dom_snapshot
+        self.steps: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self.recorded = 0
+        self.started_at = time.perf_counter()
+        self._depth = 0
+
+    @staticmethod
+    def describe_result(result: Any) -> Any:
+        """Summarizes a step's return value without keeping references to it."""
+        if result is None:
+            return "not found"
+        if isinstance(result, (bool, int, float)):
+            return result
+        if isinstance(result, (list, tuple)):
+            return f"{len(result)} items"
+        if isinstance(result, str):
+            return result[:200]
+        return type(result).__name__
+
+    def record(
+        self,
+        action: str,
+        locator: Optional[str],
+        started: float,
+        outcome: str,
+        result: Any = None,
+    ) -> None:
+        step = {
+            "action": action,
+            "locator": getattr(locator, "name", None) or locator,
+            "depth": self._depth,
+            "start_ms": round((started - self.started_at) * 1000, 1),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "outcome": outcome,
+            "result": result,
+        }
+        if self.dom_snapshot:
+            step["dom"] = self._snapshot(locator)
+        self.steps.append(step)
+        self.recorded += 1
+
+    def _snapshot(self, locator: Optional[str]) -> Optional[Dict[str, Any]]:
+        try:
+            return self.browser.execute_script(
+                self.JS_DOM_SNAPSHOT, locator, self.SNAPSHOT_LENGTH
+            )
+        except WebDriverException as e:
+            return {"error": str(e).splitlines()[0]}
+
+    def to_json(self, test_name: str) -> str:
+        """Serializes the buffered steps as compact JSON."""
+        return json.dumps(
+            {
+                "test": test_name,
+                "recorded_steps": self.recorded,
+                "steps": list(self.steps),
+            },
+            separators=(",", ":"),
+            default=str,
+        )
+
+    @staticmethod
+    def traced(action: Optional[str] = None) -> Callable:
+        """
+        Decorates a page method so that each call is recorded as a step when a StepTracer
+        is attached to the page's browser as `step_tracer`, and written to the ActionLog
+        when it is enabled.
+        The first positional argument is recorded as the locator if it is a string,
+        by name if it is a Locator declared on a page.
+        For methods returning a value, None and False are recorded as a failed step.
+        """
+
+        def decorator(method: Callable) -> Callable:
+            name = action or method.__name__
+            returns_value = method.__annotations__.get("return") is not None
+
+            @functools.wraps(method)
+            def wrapper(page, *args, **kwargs):
+                tracer = getattr(page.browser, "step_tracer", None)
+                if tracer is None and not ActionLog.is_enabled():
+                    return method(page, *args, **kwargs)
+                locator = args[0] if args and isinstance(args[0], str) else None
+                started = time.perf_counter()
+                if tracer is not None:
+                    tracer._depth += 1
+                try:
+                    result = method(page, *args, **kwargs)
+                except Exception as e:
+                    outcome = f"{type(e).__name__}: {e}"
+                    if tracer is not None:
+                        tracer._depth -= 1
+                        tracer.record(name, locator, started, outcome)
+                    ActionLog.record(name, locator, started, outcome)
+                    raise
+                outcome, described = "ok", None
+                if returns_value:
+                    outcome = "failed" if result is None or result is False else "ok"
+                    described = StepTracer.describe_result(result)
+                if tracer is not None:
+                    tracer._depth -= 1
+                    tracer.record(name, locator, started, outcome, described)
+                ActionLog.record(name, locator, started, outcome, described)
+                return result
+
+            return wrapper
+
+        return decorator
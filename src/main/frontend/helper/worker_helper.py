@@ -0,0 +1,63 @@
+import itertools
+import logging
+import os
+import urllib.parse
+from typing import Optional
+
+import requests
+
+
+class WorkerHelper:
+    """
+    Helpers for running frontend tests in parallel pytest-xdist workers:
+    worker-unique data and per-worker artifact paths.
+    """
+
+    logger = logging.getLogger(__name__)
+    _counter = itertools.count(1)
+
+    @staticmethod
+    def get_worker_id() -> Optional[str]:
+        """Returns the xdist worker id (gw0, gw1, ...) or None when not running in a worker."""
+        return os.getenv("PYTEST_XDIST_WORKER")
+
+    @staticmethod
+    def artifact_dir(name: str) -> str:
+        """Returns a directory for artifacts of the current worker, creating it if needed."""
+        worker_id = WorkerHelper.get_worker_id()
+        path = os.path.join(name, worker_id) if worker_id else name
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def worker_path(path: Optional[str]) -> Optional[str]:
+        """Adds the worker id to a file path, e.g. reports/a.json -> reports/a_gw0.json."""
+        worker_id = WorkerHelper.get_worker_id()
+        if not path or not worker_id:
+            return path
+        root, ext = os.path.splitext(path)
+        return f"{root}_{worker_id}{ext}"
+
+    @staticmethod
+    def unique(value: str) -> str:
+        """Makes a value unique across workers and within the worker process."""
+        worker_id = WorkerHelper.get_worker_id() or "gw"
+        return f"{value}{worker_id}{next(WorkerHelper._counter)}"
+
+    @staticmethod
+    def selenoid_capacity(selenium_url: str) -> Optional[int]:
+        """
+        Returns the number of sessions the Selenoid hub can run at once,
+        or None if its /status endpoint is not reachable.
+        """
+        parsed = urllib.parse.urlparse(selenium_url)
+        status_url = f"{parsed.scheme}://{parsed.netloc}/status"
+        try:
+            response = requests.get(status_url, timeout=5)
+            response.raise_for_status()
+            return int(response.json()["total"])
+        except (requests.RequestException, KeyError, ValueError) as e:
+            WorkerHelper.logger.warning(
+                f"Could not read Selenoid capacity from {status_url}: {e}"
+            )
+            return None
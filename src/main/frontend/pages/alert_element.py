@@ -1,19 +1,28 @@
+from typing import List, Optional
+
 import allure
 from selenium.common.exceptions import NoSuchElementException
 
 from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import Locator
 
 
 class AlertErrorElement(BasePage):
-    FAILURE_ALERT = "//div[@class='oxd-alert-content oxd-alert-content--error']"
-    INPUT_FIELD_ALERT = "//span[@class='oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message']"
+    FAILURE_ALERT = Locator(
+        "//div[@class='oxd-alert-content oxd-alert-content--error']"
+    )
+    INPUT_FIELD_ALERT = Locator(
+        "//span[@class='oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message']"
+    )
 
-    def _get_alert_text(self, locator: str, timeout: int, alert_name: str) -> str:
+    def _get_alert_text(
+        self, locator: str, timeout: Optional[float], alert_name: str
+    ) -> str:
         """
         Utility method to wait for an alert element, retrieve its text, and handle exceptions.
 
         :param locator: The XPath locator for the alert element.
-        :param timeout: Maximum time to wait for the element.
+        :param timeout: Maximum time to wait for the element, None for the default.
         :param alert_name: A descriptive name for logging purposes.
         :return: The text of the alert element or an empty string if not found.
         """
@@ -21,17 +30,31 @@ class AlertErrorElement(BasePage):
             alert_element = self.wait_for_element(locator, timeout=timeout)
             return alert_element.text
         except NoSuchElementException:
-            self.logger.info(f"{alert_name} did not appear within the timeout period.")
+            self.logger.info("%s did not appear within the timeout period.", alert_name)
             return ""
 
     @allure.step("Getting failure text alert")
     def get_failure_text_alert(self) -> str:
         return self._get_alert_text(
-            self.FAILURE_ALERT, timeout=10, alert_name="Failure alert"
+            self.FAILURE_ALERT, timeout=None, alert_name="Failure alert"
         )
 
     @allure.step("Getting input text alert")
     def get_input_field_text_alert(self) -> str:
         return self._get_alert_text(
-            self.INPUT_FIELD_ALERT, timeout=10, alert_name="Input field alert"
+            self.INPUT_FIELD_ALERT, timeout=None, alert_name="Input field alert"
         )
+
+    @allure.step("Getting all input field alerts")
+    def get_input_field_text_alerts(self) -> List[str]:
+        """Returns the validation messages of all fields, read from a single DOM snapshot."""
+        self.wait_for_element(self.INPUT_FIELD_ALERT)
+        return self.get_items_elements(self.INPUT_FIELD_ALERT)
+
+    @allure.step("Checking that no failure alert is shown")
+    def is_failure_alert_absent(self) -> bool:
+        return self.is_element_absent(self.FAILURE_ALERT)
+
+    @allure.step("Checking that no input field alert is shown")
+    def is_input_field_alert_absent(self) -> bool:
+        return self.is_element_absent(self.INPUT_FIELD_ALERT)
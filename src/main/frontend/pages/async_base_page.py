@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.support.wait import POLL_FREQUENCY
+
+from src.main.frontend.helper.async_webdriver import AsyncWebDriver, AsyncWebElement
+from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import LocatorStats
+
+
+class AsyncBasePage:
+    """
+    The BasePage primitives for an AsyncWebDriver: waits poll with asyncio.sleep, so
+    that other sessions on the event loop run while this one waits for the page.
+    """
+
+    DEFAULT_TIMEOUT = BasePage.DEFAULT_TIMEOUT
+
+    def __init__(self, browser: AsyncWebDriver):
+        """
+        Initialize the AsyncBasePage with an AsyncWebDriver session.
+        """
+        self.browser = browser
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def open_url(self, url: str) -> None:
+        await self.browser.get(url)
+
+    async def wait_for_page_load(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the page has completely loaded by checking the document.readyState.
+        """
+        deadline = time.monotonic() + (timeout or self.DEFAULT_TIMEOUT)
+        while time.monotonic() < deadline:
+            if await self.browser.execute_script("return document.readyState") == (
+                "complete"
+            ):
+                return True
+            await asyncio.sleep(POLL_FREQUENCY)
+        return False
+
+    async def _displayed(self, locator: str) -> List[AsyncWebElement]:
+        displayed = []
+        for element in await self.browser.find_elements(*BasePage._by(locator)):
+            try:
+                if await self.browser.execute_script(
+                    BasePage.JS_IS_ELEMENT_DISPLAYED, element
+                ):
+                    displayed.append(element)
+            except (StaleElementReferenceException, JavascriptException):
+                continue
+        return displayed
+
+    async def wait_for_elements(
+        self, locator: str, timeout: Optional[float] = None
+    ) -> List[AsyncWebElement]:
+        """
+        Waits for at least one element matching the locator to be visible.
+        Returns the visible elements, or an empty list if none appeared within the timeout.
+        """
+        timeout = timeout or self.DEFAULT_TIMEOUT
+        started = time.perf_counter()
+        elements: List[AsyncWebElement] = []
+        try:
+            await self.wait_for_page_load(timeout)
+            while True:
+                elements = await self._displayed(locator)
+                if elements or time.perf_counter() - started >= timeout:
+                    break
+                await asyncio.sleep(POLL_FREQUENCY)
+        finally:
+            LocatorStats.record(locator, time.perf_counter() - started, bool(elements))
+        if not elements:
+            self.logger.error(
+                "Element with locator '%s' was not found within %s seconds.",
+                BasePage._describe(locator),
+                timeout,
+            )
+        return elements
+
+    async def wait_for_element(
+        self, locator: str, timeout: Optional[float] = None
+    ) -> Optional[AsyncWebElement]:
+        """
+        Waits for an element to be visible on the page.
+        Returns the element if found, or None if not found within the timeout.
+        """
+        elements = await self.wait_for_elements(locator, timeout)
+        return elements[0] if elements else None
+
+    async def click(self, locator: str) -> bool:
+        """
+        Clicks the element once it is visible. Returns False if it did not appear.
+        """
+        element = await self.wait_for_element(locator)
+        if element is None:
+            return False
+        await element.click()
+        self.logger.info(
+            "Clicked element with locator: %s", BasePage._describe(locator)
+        )
+        return True
+
+    async def input_value(self, locator: str, value: str) -> None:
+        """
+        Finds an element by the provided locator, clears its content, and inputs the given value.
+        """
+        self.logger.info(
+            "Inputting value '%s' into element with locator: %s",
+            value,
+            BasePage._describe(locator),
+        )
+        element = await self.wait_for_element(locator)
+        if element:
+            await element.clear()
+            await element.send_keys(value)
+        else:
+            self.logger.error(
+                "Element with locator '%s' not found to input value.",
+                BasePage._describe(locator),
+            )
+
+    async def get_text(self, locator: str) -> str:
+        """
+        Returns the text of the first element matching the locator, or '' if there is none.
+        """
+        try:
+            element = await self.browser.find_element(*BasePage._by(locator))
+            return (await element.text()).strip()
+        except (NoSuchElementException, StaleElementReferenceException) as e:
+            self.logger.error(
+                "No available text from element '%s': %s",
+                BasePage._describe(locator),
+                e,
+            )
+            return ""
+
+    async def get_items_elements(self, locator: str) -> List[str]:
+        """
+        Returns the non-empty texts of the visible elements matching the locator.
+        """
+        texts = [
+            (await element.text()).strip()
+            for element in await self.wait_for_elements(locator)
+        ]
+        return [text for text in texts if text]
+
+    async def wait_for_url_to_contain(
+        self, partial_url: str, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Waits for the current URL to contain the given substring.
+        Returns True if found, False if the timeout is reached.
+        """
+        deadline = time.monotonic() + (timeout or self.DEFAULT_TIMEOUT)
+        while partial_url not in await self.browser.current_url():
+            if time.monotonic() >= deadline:
+                self.logger.error(
+                    "Expected URL containing '%s' did not load within %s seconds.",
+                    partial_url,
+                    timeout or self.DEFAULT_TIMEOUT,
+                )
+                return False
+            await asyncio.sleep(POLL_FREQUENCY)
+        return True
+
+    async def execute_script(self, script: str, *args) -> object:
+        return await self.browser.execute_script(script, *args)
@@ -0,0 +1,28 @@
+from typing import List, Optional
+
+from src.main.frontend.pages.async_base_page import AsyncBasePage
+from src.main.frontend.pages.login_page import LoginPage
+from src.main.frontend.pages.orm.dashboard_page import DashboardPage
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """The login flow of LoginPage for an AsyncWebDriver, with the same locators."""
+
+    async def go_to_login_page(self) -> None:
+        await self.open_url(self.browser.base_url)
+        self.logger.info("Navigated to login page: %s", self.browser.base_url)
+
+    async def login_to_admin_panel(
+        self, username: str, password: str, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Logs in from the login page. Returns True once the dashboard is open.
+        """
+        await self.go_to_login_page()
+        await self.input_value(LoginPage.USERNAME_INPUT, username)
+        await self.input_value(LoginPage.PASSWORD_INPUT, password)
+        await self.click(LoginPage.LOGIN_BUTTON)
+        return await self.wait_for_url_to_contain("/dashboard", timeout)
+
+    async def get_list_available_dashboards(self) -> List[str]:
+        return await self.get_items_elements(DashboardPage.DASHBOARD_TITLES)
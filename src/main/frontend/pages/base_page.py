@@ -1,8 +1,11 @@
 import logging
 import os
-from typing import List, Optional
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
+from pydantic import BaseModel
 from selenium.common.exceptions import (
+    JavascriptException,
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
@@ -12,43 +15,218 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY, WebDriverWait
+
+from src.main.frontend.helper.adaptive_wait_policy import AdaptiveWaitPolicy
+from src.main.frontend.helper.deadline import Deadline
+from src.main.frontend.helper.dom_snapshot import DomSnapshot
+from src.main.frontend.helper.step_tracer import StepTracer
+from src.main.frontend.helper.worker_helper import WorkerHelper
+from src.main.frontend.pages.locator import Locator, LocatorStats
 
 
 class BasePage:
     DEFAULT_TIMEOUT = 10
+    # Longest time absence checks wait for the page to settle before deciding.
+    SETTLE_TIMEOUT = 3
     JS_ARGUMENT_CLICK = "arguments[0].click();"
     JS_ARGUMENT_SCROLL = "arguments[0].scrollIntoView(true);"
+    JS_IS_ELEMENT_DISPLAYED = """
+        const element = arguments[0];
+        return element.isConnected
+            && !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+    """
+    JS_FILL_FORM = """
+        const missing = [];
+        for (const [xpath, value] of arguments[0]) {
+            const element = document.evaluate(
+                xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+            if (!element) {
+                missing.push(xpath);
+                continue;
+            }
+            const prototype = element instanceof HTMLTextAreaElement
+                ? HTMLTextAreaElement.prototype
+                : HTMLInputElement.prototype;
+            const setValue = Object.getOwnPropertyDescriptor(prototype, "value").set;
+            element.focus();
+            setValue.call(element, value);
+            element.dispatchEvent(new Event("input", { bubbles: true }));
+            element.dispatchEvent(new Event("change", { bubbles: true }));
+            element.blur();
+        }
+        return missing;
+    """
+    # Counts the pending XHR/fetch requests of the page from now on, installed after every
+    # page-object navigation and by the first absence check on a page reached otherwise.
+    JS_TRACK_NETWORK = """
+        if (!window.__pageObjectNetwork) {
+            const network = { pending: 0 };
+            const send = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function (...args) {
+                network.pending++;
+                this.addEventListener("loadend", () => network.pending--, { once: true });
+                return send.apply(this, args);
+            };
+            const fetch = window.fetch;
+            window.fetch = (...args) => {
+                network.pending++;
+                return fetch(...args).finally(() => network.pending--);
+            };
+            window.__pageObjectNetwork = network;
+        }
+    """
+    # Waits until the page is loaded, has no pending XHR/fetch requests, no responses and no DOM
+    # mutations for a quiet window, then counts the displayed matches. Requests started before
+    # JS_TRACK_NETWORK was installed are seen through the responseEnd of their resource timing.
+    JS_SETTLE_AND_COUNT_DISPLAYED = (
+        """
+        const [kind, selector, quietMs, timeoutMs, done] = arguments;
+    """
+        + JS_TRACK_NETWORK
+        + """
+        const network = window.__pageObjectNetwork;
+        const started = performance.now();
+        let lastMutation = started;
+        const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+        observer.observe(document, { childList: true, subtree: true, attributes: true });
+        const find = () => {
+            if (kind === "css") {
+                return Array.from(document.querySelectorAll(selector));
+            }
+            const result = document.evaluate(
+                selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            return Array.from({ length: result.snapshotLength }, (_, i) => result.snapshotItem(i));
+        };
+        const isDisplayed = (element) =>
+            !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+        const lastResponse = () => performance.getEntriesByType("resource")
+            .reduce((last, entry) => Math.max(last, entry.responseEnd), 0);
+        const check = () => {
+            const now = performance.now();
+            const settled = document.readyState === "complete"
+                && network.pending <= 0
+                && now - Math.max(lastMutation, lastResponse()) >= quietMs;
+            if (!settled && now - started < timeoutMs) {
+                setTimeout(check, 25);
+                return;
+            }
+            observer.disconnect();
+            done({ settled: settled, displayed: find().filter(isDisplayed).length });
+        };
+        check();
+    """
+    )
+    # Serializes the page with the elements that are not displayed marked `hidden` and the
+    # current values of inputs, without changing the page itself.
+    JS_DOM_SNAPSHOT = """
+        const root = document.documentElement;
+        const copy = root.cloneNode(true);
+        const originals = root.getElementsByTagName("*");
+        const copies = copy.getElementsByTagName("*");
+        for (let i = 0; i < originals.length; i++) {
+            const element = originals[i];
+            const style = getComputedStyle(element);
+            if (
+                !(element.offsetWidth || element.offsetHeight || element.getClientRects().length)
+                || style.visibility !== "visible"
+                || style.opacity === "0"
+            ) {
+                copies[i].setAttribute("hidden", "");
+            }
+            if (element.tagName === "INPUT" || element.tagName === "TEXTAREA") {
+                copies[i].setAttribute("value", element.value);
+            }
+        }
+        return "<!DOCTYPE html>" + copy.outerHTML;
+    """
+    # Scripts that only read the page, they don't invalidate DOM snapshots.
+    READ_ONLY_SCRIPTS = frozenset(
+        {
+            "return document.readyState",
+            JS_IS_ELEMENT_DISPLAYED,
+            JS_TRACK_NETWORK,
+            JS_SETTLE_AND_COUNT_DISPLAYED,
+            JS_DOM_SNAPSHOT,
+            StepTracer.JS_DOM_SNAPSHOT,
+        }
+    )
+    # Maps model field names to input locators, used by fill_form for models.
+    FORM_FIELDS: Dict[str, str] = {}
+    # Part of the URL of the page this page object drives, None for elements found on any page.
+    PAGE_PATH: Optional[str] = None
+    # Loggers already configured in this process.
+    _configured_loggers: Set[str] = set()
 
     def __init__(self, browser: WebDriver):
         """
         Initialize the BasePage with a Selenium WebDriver instance.
         """
         self.browser = browser
+        # Elements found by wait_for_element by locator, with the navigation epoch they were found in.
+        self._element_cache: Dict[str, Tuple[WebElement, int]] = {}
+        self._active = False
         self.__config_logger()
 
     def __config_logger(self, to_file: bool = False) -> None:
         """
-        Configures the logger for the page.
+        Configures the logger for the page, once per page class and process.
         If to_file is True, logs will be saved to a file named based on the browser's test name.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
-        os.makedirs("logs", exist_ok=True)
-        if not self.logger.handlers:
-            if to_file:
-                self.logger.addHandler(
-                    logging.FileHandler(
-                        f"logs/{getattr(self.browser, 'test_name', 'default')}.log"
+        if self.logger.name in BasePage._configured_loggers:
+            return
+        BasePage._configured_loggers.add(self.logger.name)
+        if to_file and not self.logger.handlers:
+            self.logger.addHandler(
+                logging.FileHandler(
+                    os.path.join(
+                        WorkerHelper.artifact_dir("logs"),
+                        f"{getattr(self.browser, 'test_name', 'default')}.log",
                     )
                 )
-            self.logger.setLevel(getattr(self.browser, "log_level", logging.INFO))
+            )
+        self.logger.setLevel(getattr(self.browser, "log_level", logging.INFO))
+
+    def navigate(self) -> None:
+        """
+        Opens the page, implemented by page objects with a PAGE_PATH.
+        """
+
+    def is_open(self) -> bool:
+        """
+        Checks whether the browser is already on the page.
+        """
+        return self.PAGE_PATH is not None and self.PAGE_PATH in self.browser.current_url
+
+    def activate(self) -> "BasePage":
+        """
+        Navigates to the page on the first action that needs it, unless the browser is
+        already there. Page objects don't navigate when they are created, so several of
+        them can be composed in a test without reloading the page.
+        """
+        if self._active or self.PAGE_PATH is None:
+            return self
+        self._active = True
+        if self.is_open():
+            self.logger.info(
+                "Already on %s, skipping navigation.", self.__class__.__name__
+            )
+        else:
+            self.navigate()
+        return self
 
+    @StepTracer.traced()
     def input_value(self, locator: str, value: str) -> None:
         """
         Finds an element by the provided locator, clears its content, and inputs the given value.
         """
         self.logger.info(
-            f"Inputting value '{value}' into element with locator: {locator}"
+            "Inputting value '%s' into element with locator: %s",
+            value,
+            self._describe(locator),
         )
         element = self.wait_for_element(locator)
         if element:
@@ -56,167 +234,539 @@ class BasePage:
             element.send_keys(value)
         else:
             self.logger.error(
-                f"Element with locator '{locator}' not found to input value."
+                "Element with locator '%s' not found to input value.",
+                self._describe(locator),
             )
 
+    @StepTracer.traced()
+    def fill_form(
+        self,
+        data: Union[BaseModel, Dict[str, str]],
+        keystrokes: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Fills several inputs at once from a model or a dict of locator -> value.
+        Model fields are mapped to locators through FORM_FIELDS, empty fields are skipped.
+        By default the first field is waited for and all values are then set in one script call
+        that fires input/change events, repeated for the fields not rendered yet until the
+        timeout; keystrokes=True waits for every field and types its value with send_keys.
+        Returns the locators that were not found.
+        """
+        values = self._collect_form_values(data)
+        if not values:
+            return []
+
+        if keystrokes:
+            missing = []
+            for locator, value in values.items():
+                element = self.wait_for_element(locator, timeout)
+                if element:
+                    element.clear()
+                    element.send_keys(value)
+                else:
+                    missing.append(locator)
+        else:
+            missing = self._fill_form_with_script(values, timeout)
+
+        self.logger.info(
+            "Filled %s of %s fields.", len(values) - len(missing), len(values)
+        )
+        for locator in missing:
+            self.logger.error(
+                "Element with locator '%s' not found to input value.", locator
+            )
+        return missing
+
+    def _fill_form_with_script(
+        self, values: Dict[str, str], timeout: Optional[float]
+    ) -> List[str]:
+        """
+        Waits for the first field, then sets the values with JS_FILL_FORM, polling the fields
+        the script did not find until the rest of the timeout. Returns those never found.
+        """
+        first_locator = next(iter(values))
+        timeout = self._resolve_timeout(first_locator, timeout)
+        started = time.monotonic()
+        self.wait_for_element(first_locator, timeout)
+
+        pending = dict(values)
+
+        def fill(driver: WebDriver) -> bool:
+            not_found = set(
+                driver.execute_script(
+                    self.JS_FILL_FORM,
+                    [[locator, value] for locator, value in pending.items()],
+                )
+            )
+            for locator in list(pending):
+                if locator not in not_found:
+                    del pending[locator]
+            return not pending
+
+        remaining = max(0.0, timeout - (time.monotonic() - started))
+        try:
+            self._wait_with_timeout(remaining).until(fill)
+        except TimeoutException as e:
+            self._fail_if_deadline_exceeded("the form fields", e)
+        return list(pending)
+
+    def _collect_form_values(
+        self, data: Union[BaseModel, Dict[str, str]]
+    ) -> Dict[str, str]:
+        """
+        Converts a model or a dict into an ordered dict of locator -> value.
+        """
+        if not isinstance(data, BaseModel):
+            return {
+                locator: str(value)
+                for locator, value in data.items()
+                if value is not None
+            }
+
+        values = {}
+        for field, value in data.model_dump().items():
+            if value is None or value == "":
+                continue
+            locator = self.FORM_FIELDS.get(field)
+            if locator is None:
+                self.logger.warning(
+                    "Field '%s' has no locator on %s, skipping.",
+                    field,
+                    self.__class__.__name__,
+                )
+                continue
+            values[locator] = str(value)
+        return values
+
+    @StepTracer.traced()
     def get_items_elements(self, xpath_locator: str) -> List[str]:
         """
         Retrieves and returns a list of non-empty text strings from all elements matching the given XPath locator.
-        Handles individual element errors gracefully.
+        The texts are read from a DOM snapshot instead of one WebDriver command per element.
         """
-        texts = []
-        try:
-            elements = self.browser.find_elements(By.XPATH, xpath_locator)
-            self.logger.info(
-                f"Found {len(elements)} items matching locator '{xpath_locator}'."
-            )
-            for el in elements:
-                try:
-                    text = el.text.strip()
-                    if text:
-                        texts.append(text)
-                except Exception as e:
-                    self.logger.error(f"Error retrieving text from element: {e}")
-            return texts
-        except (NoSuchElementException, StaleElementReferenceException) as e:
-            self.logger.error(f"No available text from elements '{xpath_locator}': {e}")
-            return []
+        self.activate()
+        started = time.perf_counter()
+        texts = self.dom_snapshot().texts(xpath_locator)
+        LocatorStats.record(xpath_locator, time.perf_counter() - started, bool(texts))
+        self.logger.info(
+            "Found %s items matching locator '%s'.",
+            len(texts),
+            self._describe(xpath_locator),
+        )
+        return texts
 
+    @StepTracer.traced()
+    def dom_snapshot(self) -> DomSnapshot:
+        """
+        Returns the serialized DOM of the page for evaluating several XPath queries locally.
+        The snapshot is fetched with a single script call and shared by the page objects of
+        the browser until the next navigation, interaction (as counted by the browser's
+        InteractionCounter) or wait, since the page may change while a wait polls, e.g.
+        when an XHR started by a click fills a table. Without a counter, every call
+        fetches a new snapshot.
+        """
+        self.activate()
+        interactions = getattr(self.browser, "interaction_count", None)
+        version = (self.navigation_epoch, interactions)
+        snapshot = getattr(self.browser, "dom_snapshot", None)
+        if (
+            snapshot is not None
+            and interactions is not None
+            and snapshot.version == version
+        ):
+            return snapshot
+        self.browser.dom_snapshot = DomSnapshot(
+            self.browser.execute_script(self.JS_DOM_SNAPSHOT), version
+        )
+        return self.browser.dom_snapshot
+
+    @StepTracer.traced()
     def get_text(self, path: str, locator: By = By.XPATH) -> str:
         """
         Returns the text from a single element identified by the locator and path.
         If the element is not found, returns an empty string.
         """
+        self.activate()
         try:
-            element = self.browser.find_element(locator, path)
+            by = self._by(path) if locator == By.XPATH else (locator, path)
+            element = self.browser.find_element(*by)
             text = element.text.strip()
             self.logger.info(
-                f"Retrieved text '{text}' from element with locator '{path}'."
+                "Retrieved text '%s' from element with locator '%s'.",
+                text,
+                self._describe(path),
             )
             return text
         except (NoSuchElementException, StaleElementReferenceException) as e:
             self.logger.error(
-                f"No available text from element '{path}' using locator {locator}: {e}"
+                "No available text from element '%s' using locator %s: %s",
+                self._describe(path),
+                locator,
+                e,
             )
             return ""
 
-    def _wait_with_timeout(self, timeout: int) -> WebDriverWait:
+    @property
+    def navigation_epoch(self) -> int:
         """
-        Returns a WebDriverWait instance with the specified timeout.
+        Counts the navigations done through open_url and refresh_page on this browser.
         """
-        return WebDriverWait(self.browser, timeout)
+        return getattr(self.browser, "navigation_epoch", 0)
 
-    def wait_for_page_load(self, timeout: int = DEFAULT_TIMEOUT) -> None:
+    def open_url(self, url: str) -> None:
         """
-        Waits until the page has completely loaded by checking the document.readyState.
+        Navigates to the URL, starts counting its XHR/fetch requests for absence checks and
+        invalidates the cached elements of all pages on this browser.
         """
-        WebDriverWait(self.browser, timeout).until(
-            lambda driver: driver.execute_script("return document.readyState")
-            == "complete"
+        self.browser.get(url)
+        self.browser.navigation_epoch = self.navigation_epoch + 1
+        self.browser.execute_script(self.JS_TRACK_NETWORK)
+
+    def refresh_page(self) -> None:
+        """
+        Reloads the page, starts counting its XHR/fetch requests for absence checks and
+        invalidates the cached elements of all pages on this browser.
+        """
+        self.browser.refresh()
+        self.browser.navigation_epoch = self.navigation_epoch + 1
+        self.browser.execute_script(self.JS_TRACK_NETWORK)
+
+    def invalidate_element_cache(self) -> None:
+        self._element_cache.clear()
+
+    def invalidate_dom_snapshot(self) -> None:
+        self.browser.dom_snapshot = None
+
+    def _cached_element(self, locator: str) -> Optional[WebElement]:
+        """
+        Returns the element found earlier for the locator if it was found after the last
+        navigation and is still attached and displayed, checked with a single script call.
+        """
+        cached = self._element_cache.pop(locator, None)
+        if cached is None:
+            return None
+        element, epoch = cached
+        if epoch != self.navigation_epoch:
+            return None
+        try:
+            if not self.browser.execute_script(self.JS_IS_ELEMENT_DISPLAYED, element):
+                return None
+        except (StaleElementReferenceException, JavascriptException):
+            return None
+        self._element_cache[locator] = cached
+        return element
+
+    @property
+    def wait_policy(self) -> Optional[AdaptiveWaitPolicy]:
+        """
+        The adaptive wait policy attached to the browser, if any.
+        """
+        return getattr(self.browser, "wait_policy", None)
+
+    @property
+    def deadline(self) -> Optional[Deadline]:
+        """
+        The time budget of the current test attached to the browser, if any.
+        """
+        return getattr(self.browser, "deadline", None)
+
+    def _resolve_timeout(
+        self, locator: Optional[str], timeout: Optional[float], action: str = ""
+    ) -> float:
+        """
+        Returns the timeout given by the caller, else the one learned for the locator by the
+        wait policy, else DEFAULT_TIMEOUT, shortened to what is left of the test's deadline.
+        Raises DeadlineExceededError if the deadline has passed.
+        """
+        if timeout is None and self.wait_policy is not None and locator is not None:
+            timeout = self.wait_policy.timeout_for(locator, self.DEFAULT_TIMEOUT)
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+        if self.deadline is not None:
+            return self.deadline.clamp(timeout, action or self._describe(locator))
+        return timeout
+
+    def _fail_if_deadline_exceeded(self, action: str, error: Exception) -> None:
+        """
+        Raises DeadlineExceededError for a timed out wait if the test's deadline has passed.
+        """
+        if self.deadline is not None and self.deadline.exceeded:
+            self.deadline.fail(action, error)
+
+    def _wait_with_timeout(
+        self,
+        timeout: float,
+        locator: Optional[str] = None,
+        poll: Optional[float] = None,
+    ) -> WebDriverWait:
+        """
+        Returns a WebDriverWait instance with the specified timeout, polling every `poll` seconds
+        or at the intervals the wait policy learned for the locator.
+        DOM snapshots taken before the wait are not reused after it.
+        """
+        self.invalidate_dom_snapshot()
+        if self.wait_policy is not None:
+            return self.wait_policy.wait(self.browser, locator, timeout, poll)
+        return WebDriverWait(
+            self.browser, timeout, poll_frequency=poll or POLL_FREQUENCY
         )
 
+    @staticmethod
+    def _by(locator: str) -> Tuple[str, str]:
+        """
+        Returns the (By, value) pair for a locator: the compiled CSS selector of a Locator
+        if it has one, otherwise the XPath.
+        """
+        if isinstance(locator, Locator):
+            return locator.by
+        return By.XPATH, locator
+
+    @staticmethod
+    def _describe(locator: str) -> str:
+        """
+        Returns the name of a Locator for logs, or the locator itself.
+        """
+        return getattr(locator, "name", None) or locator
+
+    def _wait_for_locator(
+        self,
+        locator: str,
+        condition: Callable,
+        timeout: float,
+        poll: Optional[float] = None,
+    ) -> WebElement:
+        """
+        Waits for an expected condition on the locator and records how long it took to resolve.
+        """
+        self.activate()
+        started = time.perf_counter()
+        found = False
+        try:
+            element = self._wait_with_timeout(timeout, locator, poll).until(
+                condition(self._by(locator))
+            )
+            found = True
+            return element
+        finally:
+            elapsed = time.perf_counter() - started
+            LocatorStats.record(locator, elapsed, found)
+            if found and self.wait_policy is not None:
+                self.wait_policy.record(locator, elapsed)
+
+    @StepTracer.traced()
+    def wait_for_page_load(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits until the page has completely loaded by checking the document.readyState.
+        """
+        timeout = self._resolve_timeout(None, timeout, "the page to load")
+        try:
+            self._wait_with_timeout(timeout).until(
+                lambda driver: driver.execute_script("return document.readyState")
+                == "complete"
+            )
+        except TimeoutException as e:
+            self._fail_if_deadline_exceeded("the page to load", e)
+            raise
+
+    @StepTracer.traced()
     def wait_for_url_to_contain(
-        self, partial_url: str, timeout: int = DEFAULT_TIMEOUT
+        self, partial_url: str, timeout: Optional[float] = None
     ) -> bool:
         """
         Waits for the current URL to contain the given substring.
         Returns True if found, False if the timeout is reached.
         """
+        action = f"the URL to contain '{partial_url}'"
+        timeout = self._resolve_timeout(None, timeout, action)
         try:
-            WebDriverWait(self.browser, timeout).until(EC.url_contains(partial_url))
-            self.logger.info(f"URL contains '{partial_url}'. Proceeding...")
+            self._wait_with_timeout(timeout).until(EC.url_contains(partial_url))
+            self.logger.info("URL contains '%s'. Proceeding...", partial_url)
             return True
         except TimeoutException as e:
+            self._fail_if_deadline_exceeded(action, e)
             self.logger.error(
-                f"Expected URL containing '{partial_url}' did not load within {timeout} seconds: {e}"
+                "Expected URL containing '%s' did not load within %s seconds: %s",
+                partial_url,
+                timeout,
+                e,
             )
             return False
 
+    @StepTracer.traced()
     def wait_for_element(
-        self, xpath: str, timeout: int = DEFAULT_TIMEOUT
+        self, xpath: str, timeout: Optional[float] = None, poll: Optional[float] = None
     ) -> Optional[WebElement]:
         """
         Waits for an element to be visible on the page using its XPath locator.
+        An element found earlier for the same locator is reused while it is still displayed.
         Returns the WebElement if found, or None if not found within the timeout.
         """
+        self.activate()
+        element = self._cached_element(xpath)
+        if element is not None:
+            self.invalidate_dom_snapshot()
+            return element
+        timeout = self._resolve_timeout(xpath, timeout)
         try:
             self.wait_for_page_load()
-            wait = self._wait_with_timeout(timeout)
-            element = wait.until(EC.visibility_of_element_located((By.XPATH, xpath)))
+            element = self._wait_for_locator(
+                xpath, EC.visibility_of_element_located, timeout, poll
+            )
+            self._element_cache[xpath] = (element, self.navigation_epoch)
             return element
         except TimeoutException as e:
+            self._fail_if_deadline_exceeded(self._describe(xpath), e)
             self.logger.error(
-                f"Element with locator '{xpath}' was not found within {timeout} seconds: {e}"
+                "Element with locator '%s' was not found within %s seconds: %s",
+                self._describe(xpath),
+                timeout,
+                e,
             )
             return None
 
+    @StepTracer.traced()
     def wait_for_element_to_be_clickable(
-        self, xpath: str, timeout: int = DEFAULT_TIMEOUT
+        self, xpath: str, timeout: Optional[float] = None, poll: Optional[float] = None
     ) -> Optional[WebElement]:
         """
         Waits for an element to be clickable.
         Returns the WebElement if clickable, or None if the timeout is reached.
         """
+        timeout = self._resolve_timeout(xpath, timeout)
         try:
-            wait = self._wait_with_timeout(timeout)
-            element = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-            return element
+            return self._wait_for_locator(
+                xpath, EC.element_to_be_clickable, timeout, poll
+            )
         except TimeoutException as e:
+            self._fail_if_deadline_exceeded(self._describe(xpath), e)
             self.logger.error(
-                f"Element with locator '{xpath}' was not clickable within {timeout} seconds: {e}"
+                "Element with locator '%s' was not clickable within %s seconds: %s",
+                self._describe(xpath),
+                timeout,
+                e,
             )
             return None
 
+    @StepTracer.traced()
     def wait_for_new_page_loaded(
-        self, url: str, timeout: int = DEFAULT_TIMEOUT
+        self, url: str, timeout: Optional[float] = None
     ) -> bool:
         """
         Waits for a new page to load by checking if the current URL contains the given substring.
         Returns True if the new page loads, otherwise returns False.
         """
+        action = f"a page with URL containing '{url}'"
+        timeout = self._resolve_timeout(None, timeout, action)
         try:
             wait = self._wait_with_timeout(timeout)
             result = wait.until(EC.url_contains(url))
             return result
         except TimeoutException as e:
+            self._fail_if_deadline_exceeded(action, e)
             self.logger.warning(
-                f"Page did not load with URL containing '{url}' within {timeout} seconds: {e}"
+                "Page did not load with URL containing '%s' within %s seconds: %s",
+                url,
+                timeout,
+                e,
             )
             return False
 
+    @StepTracer.traced()
+    def is_element_absent(
+        self, xpath: str, quiet: float = 0.3, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Checks that no element matching the locator is displayed, in a single script call:
+        the check runs once the page has settled, i.e. is loaded, has no pending XHR/fetch
+        requests and no DOM mutations for `quiet` seconds, or after SETTLE_TIMEOUT at most.
+        Returns True if the element is absent or hidden.
+        """
+        self.activate()
+        action = f"the page to settle before checking '{self._describe(xpath)}'"
+        timeout = self._resolve_timeout(
+            None, self.SETTLE_TIMEOUT if timeout is None else timeout, action
+        )
+        by, value = self._by(xpath)
+        state = self.browser.execute_async_script(
+            self.JS_SETTLE_AND_COUNT_DISPLAYED,
+            "css" if by == By.CSS_SELECTOR else "xpath",
+            value,
+            int(quiet * 1000),
+            int(timeout * 1000),
+        )
+        if not state["settled"]:
+            self.logger.warning(
+                "Page did not settle within %s seconds, checked '%s' anyway.",
+                timeout,
+                self._describe(xpath),
+            )
+        absent = state["displayed"] == 0
+        self.logger.info(
+            "Element with locator '%s' is %s.",
+            self._describe(xpath),
+            "absent" if absent else "displayed",
+        )
+        return absent
+
+    @StepTracer.traced()
     def wait_for_element_to_disappear(
-        self, xpath: str, timeout: int = DEFAULT_TIMEOUT
+        self, xpath: str, timeout: Optional[float] = None, poll: Optional[float] = None
     ) -> bool:
         """
-        Waits for an element to disappear from the page.
+        Waits for an element to appear and then disappear from the page, e.g. a loader.
+        Use is_element_absent to check that an element is not shown.
         Returns True if the element disappears within the timeout, otherwise returns False.
         """
+        timeout = self._resolve_timeout(xpath, timeout)
         try:
-            wait = self._wait_with_timeout(timeout)
-            element = wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
-            wait.until(EC.invisibility_of_element(element))
-            self.logger.info(f"Element with locator '{xpath}' disappeared.")
+            element = self._wait_for_locator(
+                xpath, EC.presence_of_element_located, timeout, poll
+            )
+            self._wait_with_timeout(timeout, poll=poll).until(
+                EC.invisibility_of_element(element)
+            )
+            self.logger.info(
+                "Element with locator '%s' disappeared.", self._describe(xpath)
+            )
             return True
         except TimeoutException as e:
+            self._fail_if_deadline_exceeded(self._describe(xpath), e)
             self.logger.warning(
-                f"Element with locator '{xpath}' didn't disappear within {timeout} seconds: {e}"
+                "Element with locator '%s' didn't disappear within %s seconds: %s",
+                self._describe(xpath),
+                timeout,
+                e,
             )
             return False
 
+    @StepTracer.traced()
     def scroll_to_element(self, element: WebElement) -> None:
         """
         Scrolls the page until the specified element is in view.
         """
-        self.logger.info(f"Scrolling to element: {element}.")
+        self.logger.info("Scrolling to element: %s.", element)
         self.browser.execute_script(self.JS_ARGUMENT_SCROLL, element)
 
+    @StepTracer.traced()
     def js_click_to_element(self, element: WebElement) -> None:
         """
         Clicks on an element using JavaScript.
         """
-        self.logger.info(f"Clicking element via JS: {element}.")
+        self.logger.info("Clicking element via JS: %s.", element)
         self.browser.execute_script(self.JS_ARGUMENT_CLICK, element)
 
+    def capture_performance(self, step: str) -> None:
+        """
+        Captures page performance metrics for the step once the page has loaded.
+        Does nothing unless a performance collector is attached to the browser.
+        """
+        collector = getattr(self.browser, "performance_collector", None)
+        if collector is None:
+            return
+        self.wait_for_page_load()
+        collector.capture(step)
+
     def maximize_browser_window(self) -> None:
         """
         Maximizes the browser window.
@@ -224,12 +774,14 @@ class BasePage:
         self.logger.info("Maximizing browser window.")
         self.browser.maximize_window()
 
+    @StepTracer.traced()
     def click_using_action(self, locator: str) -> None:
         """
         Clicks an element using ActionChains for a more robust interaction.
         """
         self.logger.info(
-            f"Clicking element using ActionChains with locator '{locator}'."
+            "Clicking element using ActionChains with locator '%s'.",
+            self._describe(locator),
         )
         element = self.wait_for_element(locator)
         if element:
@@ -237,5 +789,6 @@ class BasePage:
             actions.move_to_element(element).click().perform()
         else:
             self.logger.error(
-                f"Element with locator '{locator}' not found for clicking using ActionChains."
+                "Element with locator '%s' not found for clicking using ActionChains.",
+                self._describe(locator),
             )
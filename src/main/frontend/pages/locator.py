@@ -0,0 +1,181 @@
+import json
+import os
+import re
+import statistics
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+
+class Locator(str):
+    """
+    An XPath locator declared once on a page object, e.g. LOGIN_BUTTON = Locator("//button").
+    It stays a str, so it can be used wherever an XPath string is expected, and additionally
+    carries a stable name (Class.ATTRIBUTE) and an equivalent CSS selector when the XPath can be
+    translated exactly. Elements are then located by CSS, which browsers resolve faster.
+    """
+
+    IDENTIFIER = re.compile(r"^-?[_a-zA-Z][\w-]*$")
+    STEP = re.compile(r"^([a-zA-Z][\w-]*|\*)((?:\[[^\[\]]+\])*)$")
+    PREDICATE_ATTRIBUTE = re.compile(r"^@([\w-]+)$")
+    PREDICATE_EQUALS = re.compile(r"^@([\w-]+)\s*=\s*'([^']*)'$")
+    PREDICATE_FUNCTION = re.compile(
+        r"^(contains|starts-with)\(\s*@([\w-]+)\s*,\s*'([^']*)'\s*\)$"
+    )
+
+    def __new__(cls, xpath: str, css: Optional[str] = None, name: Optional[str] = None):
+        """
+        :param xpath: The XPath of the element.
+        :param css: An explicit CSS equivalent; compiled from the XPath if not given.
+        :param name: A name for logs; set from the class attribute name when declared on a class.
+        """
+        locator = super().__new__(cls, xpath)
+        locator.css = css or cls.compile_css(xpath)
+        locator.name = name
+        return locator
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = f"{owner.__name__}.{name}"
+        LocatorStats.register(self)
+
+    @property
+    def xpath(self) -> str:
+        return str.__str__(self)
+
+    @property
+    def by(self) -> Tuple[str, str]:
+        """Returns the (By, value) pair used to locate the element."""
+        if self.css:
+            return By.CSS_SELECTOR, self.css
+        return By.XPATH, self.xpath
+
+    @staticmethod
+    def _split(xpath: str) -> Optional[List[Tuple[str, str]]]:
+        """Splits an absolute XPath into (axis, step) pairs, ignoring '/' inside quotes and predicates."""
+        steps, depth, quote, current, axis = [], 0, None, "", None
+        index = 0
+        while index < len(xpath):
+            char = xpath[index]
+            if quote:
+                quote = None if char == quote else quote
+            elif char in "'\"":
+                quote = char
+            elif char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
+            elif char == "/" and depth == 0:
+                if axis is not None:
+                    if not current:
+                        return None
+                    steps.append((axis, current))
+                descendant = xpath[index : index + 2] == "//"
+                axis = "//" if descendant else "/"
+                current = ""
+                index += 2 if descendant else 1
+                continue
+            current += char
+            index += 1
+        if axis is None or not current:
+            return None
+        steps.append((axis, current))
+        return steps
+
+    @classmethod
+    def _compile_predicate(cls, predicate: str) -> Optional[str]:
+        predicate = predicate.strip()
+        equals = cls.PREDICATE_EQUALS.match(predicate)
+        if equals:
+            attribute, value = equals.groups()
+            if attribute == "id" and cls.IDENTIFIER.match(value):
+                return f"#{value}"
+            return f"[{attribute}='{value}']"
+        attribute = cls.PREDICATE_ATTRIBUTE.match(predicate)
+        if attribute:
+            return f"[{attribute.group(1)}]"
+        function = cls.PREDICATE_FUNCTION.match(predicate)
+        if function:
+            name, attribute, value = function.groups()
+            operator = "*=" if name == "contains" else "^="
+            return f"[{attribute}{operator}'{value}']"
+        return None
+
+    @classmethod
+    def compile_css(cls, xpath: str) -> Optional[str]:
+        """
+        Translates an XPath into an equivalent CSS selector, or returns None if it uses anything
+        CSS cannot express exactly (text(), axes other than child and descendant, positions, ...).
+        Supported are steps like tag[@a='v' and contains(@class, 'c') and starts-with(@b, 'p')].
+        """
+        steps = cls._split(xpath.strip())
+        if not steps or steps[0][0] != "//":
+            return None
+        parts = []
+        for axis, step in steps:
+            match = cls.STEP.match(step)
+            if not match:
+                return None
+            tag, predicates = match.groups()
+            selector = "" if tag == "*" else tag
+            for group in re.findall(r"\[([^\[\]]+)\]", predicates):
+                for predicate in re.split(r"\s+and\s+", group):
+                    compiled = cls._compile_predicate(predicate)
+                    if compiled is None:
+                        return None
+                    selector += compiled
+            if parts:
+                parts.append(" " if axis == "//" else " > ")
+            parts.append(selector or "*")
+        return "".join(parts)
+
+
+class LocatorStats:
+    """Collects resolution latency and failures per locator across the run."""
+
+    _lock = threading.Lock()
+    locators: Dict[str, Locator] = {}
+    timings: Dict[str, List[float]] = {}
+    failures: Dict[str, int] = {}
+
+    @staticmethod
+    def register(locator: Locator) -> None:
+        LocatorStats.locators[locator.name] = locator
+
+    @staticmethod
+    def record(locator: str, seconds: float, found: bool) -> None:
+        """Records one resolution of a locator; unnamed locators are recorded by their value."""
+        key = getattr(locator, "name", None) or str(locator)
+        with LocatorStats._lock:
+            LocatorStats.timings.setdefault(key, []).append(seconds)
+            if not found:
+                LocatorStats.failures[key] = LocatorStats.failures.get(key, 0) + 1
+
+    @staticmethod
+    def report() -> List[Dict[str, Any]]:
+        """Returns the stats per locator, slowest total time first. Times are in milliseconds."""
+        rows = []
+        for key, timings in LocatorStats.timings.items():
+            locator = LocatorStats.locators.get(key)
+            ordered = sorted(timings)
+            rows.append(
+                {
+                    "locator": key,
+                    "by": locator.by[0] if locator else By.XPATH,
+                    "resolutions": len(timings),
+                    "failures": LocatorStats.failures.get(key, 0),
+                    "total_ms": round(sum(timings) * 1000, 1),
+                    "mean_ms": round(statistics.mean(timings) * 1000, 1),
+                    "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 1),
+                    "max_ms": round(ordered[-1] * 1000, 1),
+                }
+            )
+        return sorted(rows, key=lambda row: -row["total_ms"])
+
+    @staticmethod
+    def write(path: Optional[str]) -> None:
+        if not path or not LocatorStats.timings:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(LocatorStats.report(), f, indent=2)
@@ -1,34 +1,42 @@
 import allure
 
+from src.main.frontend.helper.deadline import DeadlineExceededError
 from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import Locator
 
 
 class LoginPage(BasePage):
-    USERNAME_INPUT = "//input[@name='username']"
-    PASSWORD_INPUT = "//input[@type='password']"
-    LOGIN_BUTTON = "//button[@type='submit']"
-    LOGIN_TITLE = "//h5[@class='oxd-text oxd-text--h5 orangehrm-login-title']"
-    FORGOT_PASSWORD_BUTTON = "//div[@class='orangehrm-login-forgot']"
+    USERNAME_INPUT = Locator("//input[@name='username']")
+    PASSWORD_INPUT = Locator("//input[@type='password']")
+    LOGIN_BUTTON = Locator("//button[@type='submit']")
+    LOGIN_TITLE = Locator("//h5[@class='oxd-text oxd-text--h5 orangehrm-login-title']")
+    FORGOT_PASSWORD_BUTTON = Locator("//div[@class='orangehrm-login-forgot']")
+    PAGE_PATH = "/web/index.php/auth/login"
 
-    def __init__(self, browser):
-        super().__init__(browser)
+    def navigate(self) -> None:
         self.go_to_login_page()
 
+    def is_open(self) -> bool:
+        return super().is_open() or self.browser.current_url == self.browser.base_url
+
     @allure.step("Going to login page")
     def go_to_login_page(self) -> None:
         try:
             url = self.browser.base_url
-            self.browser.get(url)
-            self.logger.info(f"Navigated to login page: {url}")
+            self.open_url(url)
+            self.logger.info("Navigated to login page: %s", url)
+            self.capture_performance("Login page")
+        except DeadlineExceededError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to navigate to the login page: {e}")
+            self.logger.error("Failed to navigate to the login page: %s", e)
 
     @allure.step("Getting login title text")
     def get_login_title_text(self) -> str:
         element = self.wait_for_element(self.LOGIN_TITLE)
         if element:
             text = element.text
-            self.logger.info(f"Login title text retrieved: '{text}'")
+            self.logger.info("Login title text retrieved: '%s'", text)
             return text
         else:
             self.logger.error("Login title did not appear within the timeout period.")
@@ -40,7 +48,7 @@ class LoginPage(BasePage):
         if element:
             element.clear()
             element.send_keys(username)
-            self.logger.info(f"Filled username: '{username}'")
+            self.logger.info("Filled username: '%s'", username)
         else:
             self.logger.error("Username input field not found.")
         return self
@@ -1,44 +1,95 @@
+import os
 import time
+import urllib.parse
 
 import allure
 from selenium.common import NoSuchElementException
 
+from src.main.frontend.helper.worker_helper import WorkerHelper
+from src.main.frontend.model.pim_employee_model import PimEmployeeModel
 from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import Locator
 from src.main.frontend.pages.user_details_element import UserDetailsElement
 
 
 class PimPage(BasePage):
-    PIM = "//a[contains(@class, 'oxd-main-menu-item') and contains(@href, '/web/index.php/pim/viewPimModule')]"
-    EMPLOYEE_NAME_INPUT = "///label[text()='Employee Name']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
-    EMPLOYEE_ID_INPUT = "//label[text()='Employee Id']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
-    USERNAME_LOGIN_INPUT = "//label[normalize-space(text())='Username']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
-    PASSWORD_LOGIN_INPUT = "//label[normalize-space(text())='Password']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
-    CONFIRM_PASSWORD_LOGIN_INPUT = "//label[normalize-space(text())='Confirm Password']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
-    EMPLOYMENT_STATUS_SELECTOR = "//label[normalize-space(text())='Employment Status']/ancestor::div[contains(@class, 'oxd-input-group')]//div[contains(@class, 'oxd-select-text-input') and @tabindex='0']"
-    SUPERVISOR_NAME_INPUT = "//label[text()='Supervisor Name']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
-    SEARCH_BUTTON = "//button[@type='submit' and contains(@class, 'oxd-button--secondary') and normalize-space(.)='Search']"
-    ADD_BUTTON = "//button[@type='button' and contains(@class, 'oxd-button--secondary') and .//i[contains(@class, 'bi-plus')] and contains(normalize-space(.), 'Add')]"
-    CREATE_LOGIN_DETAILS_BUTTON = "//span[contains(@class, 'oxd-switch-input') and contains(@class, 'oxd-switch-input--active') and contains(@class, '--label-right')]"
-    PIM_PERSONAL_TITLE = "//h6[contains(@class, 'orangehrm-main-title')]"
-    TABLE_ROWS = "//div[contains(@class, 'oxd-table-body')]//div[@role='row' and contains(@class, 'oxd-table-row--clickable')]"
+    PIM = Locator(
+        "//a[contains(@class, 'oxd-main-menu-item') and contains(@href, '/web/index.php/pim/viewPimModule')]"
+    )
+    EMPLOYEE_NAME_INPUT = Locator(
+        "//label[text()='Employee Name']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
+    )
+    EMPLOYEE_ID_INPUT = Locator(
+        "//label[text()='Employee Id']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
+    )
+    USERNAME_LOGIN_INPUT = Locator(
+        "//label[normalize-space(text())='Username']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
+    )
+    PASSWORD_LOGIN_INPUT = Locator(
+        "//label[normalize-space(text())='Password']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
+    )
+    CONFIRM_PASSWORD_LOGIN_INPUT = Locator(
+        "//label[normalize-space(text())='Confirm Password']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
+    )
+    EMPLOYMENT_STATUS_SELECTOR = Locator(
+        "//label[normalize-space(text())='Employment Status']/ancestor::div[contains(@class, 'oxd-input-group')]//div[contains(@class, 'oxd-select-text-input') and @tabindex='0']"
+    )
+    SUPERVISOR_NAME_INPUT = Locator(
+        "//label[text()='Supervisor Name']/ancestor::div[contains(@class, 'oxd-input-group')]//input"
+    )
+    SEARCH_BUTTON = Locator(
+        "//button[@type='submit' and contains(@class, 'oxd-button--secondary') and normalize-space(.)='Search']"
+    )
+    ADD_BUTTON = Locator(
+        "//button[@type='button' and contains(@class, 'oxd-button--secondary') and .//i[contains(@class, 'bi-plus')] and contains(normalize-space(.), 'Add')]"
+    )
+    CREATE_LOGIN_DETAILS_BUTTON = Locator(
+        "//span[contains(@class, 'oxd-switch-input') and contains(@class, 'oxd-switch-input--active') and contains(@class, '--label-right')]"
+    )
+    PIM_PERSONAL_TITLE = Locator("//h6[contains(@class, 'orangehrm-main-title')]")
+    EMPLOYEE_FULL_NAME = Locator(
+        "//div[contains(@class, 'orangehrm-edit-employee-name')]/h6"
+    )
+    TABLE_ROWS = Locator(
+        "//div[contains(@class, 'oxd-table-body')]//div[@role='row' and contains(@class, 'oxd-table-row--clickable')]"
+    )
+    FORM_FIELDS = {
+        **UserDetailsElement.FORM_FIELDS,
+        "username": USERNAME_LOGIN_INPUT,
+        "password": PASSWORD_LOGIN_INPUT,
+        "confirm_password": CONFIRM_PASSWORD_LOGIN_INPUT,
+    }
+
+    PAGE_PATH = "/web/index.php/pim/"
 
     def __init__(self, browser):
         super().__init__(browser)
-        self.personal_info = UserDetailsElement(browser)
+        self._personal_info = UserDetailsElement(browser)
+
+    @property
+    def personal_info(self) -> UserDetailsElement:
+        self.activate()
+        return self._personal_info
+
+    def navigate(self) -> None:
         self.click_pim()
 
     @allure.step("Clicking pim section")
     def click_pim(self):
         try:
-            self.browser.refresh()
+            self.refresh_page()
             self.wait_for_element(self.PIM, 3).click()
             self.wait_for_element(self.PIM, 3).click()
-            self.browser.refresh()
+            self.refresh_page()
+            self.capture_performance("PIM employee list")
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click the pim button: {e}")
-            screenshot_path = f"error_screenshot_{int(time.time())}.png"
+            self.logger.warning("Error when trying to click the pim button: %s", e)
+            screenshot_path = os.path.join(
+                WorkerHelper.artifact_dir("screenshots"),
+                f"error_screenshot_{int(time.time())}.png",
+            )
             self.browser.save_screenshot(screenshot_path)
-            self.logger.info(f"Screenshot saved to {screenshot_path}")
+            self.logger.info("Screenshot saved to %s", screenshot_path)
         return self
 
     @allure.step("Selecting employment status '{status}'")
@@ -50,23 +101,27 @@ class PimPage(BasePage):
             ).click()
             self.wait_for_element(employment_status).click()
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click the employment status button: {e}")
+            self.logger.warning(
+                "Error when trying to click the employment status button: %s", e
+            )
         return self
 
     @allure.step("Clicking search button")
     def click_search(self):
         try:
             self.wait_for_element(self.SEARCH_BUTTON).click()
+            self.capture_performance("PIM search")
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click search button: {e}")
+            self.logger.warning("Error when trying to click search button: %s", e)
         return self
 
     @allure.step("Clicking add button")
     def click_add_button(self):
         try:
             self.wait_for_element(self.ADD_BUTTON).click()
+            self.capture_performance("PIM add employee")
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click add button: {e}")
+            self.logger.warning("Error when trying to click add button: %s", e)
         return self
 
     @allure.step("Clicking create login details button")
@@ -74,29 +129,28 @@ class PimPage(BasePage):
         try:
             self.wait_for_element(self.CREATE_LOGIN_DETAILS_BUTTON).click()
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click add button: {e}")
+            self.logger.warning("Error when trying to click add button: %s", e)
         return self
 
     @allure.step(
         "Filling login details: username '{username}', password '{password}', confirm password '{confirm_password}'"
     )
-    def fill_login_details(self, username, password, confirm_password):
-        try:
-            input_username = self.wait_for_element(self.USERNAME_LOGIN_INPUT)
-            input_username.clear()
-            input_username.send_keys(username)
-
-            input_password = self.wait_for_element(self.PASSWORD_LOGIN_INPUT)
-            input_password.clear()
-            input_password.send_keys(password)
+    def fill_login_details(
+        self, username, password, confirm_password, keystrokes=False
+    ):
+        self.fill_form(
+            {
+                self.USERNAME_LOGIN_INPUT: username,
+                self.PASSWORD_LOGIN_INPUT: password,
+                self.CONFIRM_PASSWORD_LOGIN_INPUT: confirm_password,
+            },
+            keystrokes=keystrokes,
+        )
+        return self
 
-            input_confirm_password = self.wait_for_element(
-                self.CONFIRM_PASSWORD_LOGIN_INPUT
-            )
-            input_confirm_password.clear()
-            input_confirm_password.send_keys(confirm_password)
-        except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to fill login details: {e}")
+    @allure.step("Filling employee details '{employee}'")
+    def fill_employee_details(self, employee: PimEmployeeModel, keystrokes=False):
+        self.fill_form(employee, keystrokes=keystrokes)
         return self
 
     @allure.step("Get list of available pim records")
@@ -106,18 +160,33 @@ class PimPage(BasePage):
             pim_rows = self.get_items_elements(self.TABLE_ROWS)
             return pim_rows
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to retrieve categories: {e}")
+            self.logger.warning("Error when trying to retrieve categories: %s", e)
 
     @allure.step(
         "Filling personal  details: first name '{first}', last name '{last}', middle name '{middle}'"
     )
-    def fill_personal_details(self, first=None, last=None, middle=None):
-        if first:
-            self.personal_info.fill_first_name(first)
-        if last:
-            self.personal_info.fill_last_name(last)
-        if middle:
-            self.personal_info.fill_middle_name(middle)
+    def fill_personal_details(
+        self, first=None, last=None, middle=None, keystrokes=False
+    ):
+        self.fill_employee_details(
+            PimEmployeeModel(first_name=first, last_name=last, middle_name=middle),
+            keystrokes=keystrokes,
+        )
+
+    @allure.step("Opening personal details of employee {emp_number}")
+    def open_personal_details(self, emp_number):
+        url = urllib.parse.urljoin(
+            self.browser.current_url,
+            f"/web/index.php/pim/viewPersonalDetails/empNumber/{emp_number}",
+        )
+        self.open_url(url)
+        self.capture_performance("PIM personal details")
+        return self
+
+    @allure.step("Getting employee full name")
+    def get_employee_full_name(self) -> str:
+        element = self.wait_for_element(self.EMPLOYEE_FULL_NAME)
+        return element.text if element else ""
 
     @allure.step("Getting pim title")
     def get_pim_title(self) -> str:
@@ -127,6 +196,7 @@ class PimPage(BasePage):
             return ""
         try:
             application_stage = self.wait_for_element(self.PIM_PERSONAL_TITLE)
+            self.capture_performance("PIM personal details")
             return application_stage.text
         except NoSuchElementException:
             self.logger.warning("PIM title did not appear within the timeout period.")
@@ -4,56 +4,95 @@ import allure
 from selenium.common import NoSuchElementException
 from selenium.webdriver import Keys
 
+from src.main.frontend.model.candidate_model import CandidateModel
 from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import Locator
 from src.main.frontend.pages.user_details_element import UserDetailsElement
 
 
 class RecruitmentPage(BasePage):
-    RECRUITMENT = "//a[contains(@class, 'oxd-main-menu-item') and contains(@href, '/web/index.php/recruitment/viewRecruitmentModule')]"
-    ADD_CANDIDATE_BUTTON = "//button[contains(@class, 'oxd-button') and contains(@class, 'oxd-button--secondary') and contains(., 'Add')]"
-    VACANCY_SELECTOR = "//i[contains(@class, 'oxd-icon') and contains(@class, 'bi-caret-down-fill') and contains(@class, 'oxd-select-text--arrow')]"
-    DATE_OF_APPLICATION_INPUT = "//div[label[text()='Date of Application']]/following-sibling::div//input[contains(@class, 'oxd-input')]"
-    CONSENT_CHECKBOX = (
+    RECRUITMENT = Locator(
+        "//a[contains(@class, 'oxd-main-menu-item') and contains(@href, '/web/index.php/recruitment/viewRecruitmentModule')]"
+    )
+    ADD_CANDIDATE_BUTTON = Locator(
+        "//button[contains(@class, 'oxd-button') and contains(@class, 'oxd-button--secondary') and contains(., 'Add')]"
+    )
+    VACANCY_SELECTOR = Locator(
+        "//i[contains(@class, 'oxd-icon') and contains(@class, 'bi-caret-down-fill') and contains(@class, 'oxd-select-text--arrow')]"
+    )
+    DATE_OF_APPLICATION_INPUT = Locator(
+        "//div[label[text()='Date of Application']]/following-sibling::div//input[contains(@class, 'oxd-input')]"
+    )
+    CONSENT_CHECKBOX = Locator(
         "//label[contains(@class, 'oxd-label') and text()='Consent to keep data']"
     )
-    SAVE_BUTTON = "//button[contains(@class, 'oxd-button') and text()=' Save ']"
-    APPLICATION_STAGE_TITLE = "//h6[contains(@class, 'oxd-text') and contains(@class, 'orangehrm-main-title')]"
+    SAVE_BUTTON = Locator(
+        "//button[contains(@class, 'oxd-button') and text()=' Save ']"
+    )
+    APPLICATION_STAGE_TITLE = Locator(
+        "//h6[contains(@class, 'oxd-text') and contains(@class, 'orangehrm-main-title')]"
+    )
+    FORM_FIELDS = UserDetailsElement.FORM_FIELDS
+
+    PAGE_PATH = "/web/index.php/recruitment/"
 
     def __init__(self, browser):
         super().__init__(browser)
-        self.personal_info = UserDetailsElement(browser)
+        self._personal_info = UserDetailsElement(browser)
+
+    @property
+    def personal_info(self) -> UserDetailsElement:
+        self.activate()
+        return self._personal_info
+
+    def navigate(self) -> None:
         self.click_recruitment()
 
     @allure.step(
         "Filling personal  details: first name '{first}', last name '{last}', middle name '{middle}', email '{email}'"
     )
-    def fill_personal_details(self, first=None, last=None, middle=None, email=None):
-        if first:
-            self.personal_info.fill_first_name(first)
-        if last:
-            self.personal_info.fill_last_name(last)
-        if middle:
-            self.personal_info.fill_middle_name(middle)
-        if email:
-            self.personal_info.fill_email(email)
+    def fill_personal_details(
+        self, first=None, last=None, middle=None, email=None, keystrokes=False
+    ):
+        self.fill_candidate_details(
+            CandidateModel(
+                first_name=first, last_name=last, middle_name=middle, email=email
+            ),
+            keystrokes=keystrokes,
+        )
+
+    @allure.step("Filling candidate details '{candidate}'")
+    def fill_candidate_details(self, candidate: CandidateModel, keystrokes=False):
+        self.fill_form(
+            candidate.model_copy(update={"date": None}), keystrokes=keystrokes
+        )
+        if candidate.date:
+            self.fill_application_date(candidate.date)
+        return self
 
     @allure.step("Clicking recruitment section")
     def click_recruitment(self):
         try:
-            self.browser.refresh()
+            self.refresh_page()
             self.wait_for_element(self.RECRUITMENT).click()
             self.wait_for_element(self.RECRUITMENT).click()
-            self.browser.refresh()
+            self.refresh_page()
+            self.capture_performance("Recruitment candidates")
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click the recruitment button: {e}")
+            self.logger.warning(
+                "Error when trying to click the recruitment button: %s", e
+            )
         return self
 
     @allure.step("Clicking add candidate")
     def click_add_candidate(self):
         try:
             self.wait_for_element(self.ADD_CANDIDATE_BUTTON).click()
+            self.capture_performance("Recruitment add candidate")
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click the add candidate button: {e}")
+            self.logger.warning(
+                "Error when trying to click the add candidate button: %s", e
+            )
         return self
 
     @allure.step("Clicking select candidate")
@@ -65,7 +104,9 @@ class RecruitmentPage(BasePage):
             self.wait_for_element_to_be_clickable(self.VACANCY_SELECTOR).click()
             self.wait_for_element(vacancy_input).click()
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click the add candidate button: {e}")
+            self.logger.warning(
+                "Error when trying to click the add candidate button: %s", e
+            )
         return self
 
     @allure.step("Filling application date '{application_date}'")
@@ -86,7 +127,7 @@ class RecruitmentPage(BasePage):
             input_application_date.send_keys(application_date)
 
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to fill application date: {e}")
+            self.logger.warning("Error when trying to fill application date: %s", e)
 
         return self
 
@@ -95,7 +136,7 @@ class RecruitmentPage(BasePage):
         try:
             self.wait_for_element(self.CONSENT_CHECKBOX).click()
         except NoSuchElementException as e:
-            self.logger.warning(f"Error when trying to click consent checkbox: {e}")
+            self.logger.warning("Error when trying to click consent checkbox: %s", e)
         return self
 
     @allure.step("Getting application stage title")
@@ -107,6 +148,7 @@ class RecruitmentPage(BasePage):
 
         try:
             application_stage = self.wait_for_element(self.APPLICATION_STAGE_TITLE)
+            self.capture_performance("Recruitment application stage")
             return application_stage.text
         except NoSuchElementException:
             self.logger.info("Failure alert did not appear within the timeout period.")
@@ -1,13 +1,14 @@
 import allure
 
 from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import Locator
 
 
 class PasswordResetPage(BasePage):
-    USERNAME_INPUT = "//input[@name='username']"
-    RESET_BUTTON = "//button[@type='submit']"
-    CANCEL_BUTTON = "//button[@type='button']"
-    CONFIRMATION_OF_RESETTING_PASSWORD = (
+    USERNAME_INPUT = Locator("//input[@name='username']")
+    RESET_BUTTON = Locator("//button[@type='submit']")
+    CANCEL_BUTTON = Locator("//button[@type='button']")
+    CONFIRMATION_OF_RESETTING_PASSWORD = Locator(
         "//h6[@class='oxd-text oxd-text--h6 orangehrm-forgot-password-title']"
     )
 
@@ -17,7 +18,7 @@ class PasswordResetPage(BasePage):
         if element:
             element.clear()
             element.send_keys(username)
-            self.logger.info(f"Filled username: '{username}'")
+            self.logger.info("Filled username: '%s'", username)
         else:
             self.logger.error(
                 "Username input field not found when trying to fill username."
@@ -55,7 +56,7 @@ class PasswordResetPage(BasePage):
         if element:
             confirmation_text = element.text
             self.logger.info(
-                f"Reset password confirmation retrieved: '{confirmation_text}'"
+                "Reset password confirmation retrieved: '%s'", confirmation_text
             )
             return confirmation_text
         else:
@@ -1,27 +1,38 @@
 import allure
 
 from src.main.frontend.pages.base_page import BasePage
+from src.main.frontend.pages.locator import Locator
 
 
 class UserDetailsElement(BasePage):
-    FIRST_NAME_INPUT = (
+    FIRST_NAME_INPUT = Locator(
         "//input[contains(@class, 'oxd-input') and translate(@placeholder, "
         "'ABCDEFGHIJKLMNOPQRSTUVWXYZ-', 'abcdefghijklmnopqrstuvwxyz ')='first name']"
     )
-    MIDDLE_NAME_INPUT = (
+    MIDDLE_NAME_INPUT = Locator(
         "//input[contains(@class, 'oxd-input') and translate(@placeholder, "
         "'ABCDEFGHIJKLMNOPQRSTUVWXYZ-', 'abcdefghijklmnopqrstuvwxyz ')='middle name']"
     )
-    LAST_NAME_INPUT = (
+    LAST_NAME_INPUT = Locator(
         "//input[contains(@class, 'oxd-input') and translate(@placeholder, "
         "'ABCDEFGHIJKLMNOPQRSTUVWXYZ-', 'abcdefghijklmnopqrstuvwxyz ')='last name']"
     )
-    EMAIL_INPUT = (
+    EMAIL_INPUT = Locator(
         "//div[label[text()='Email']]/following-sibling::div//input[contains(@class, 'oxd-input') "
         "and contains(@class, 'oxd-input--active')]"
     )
-    SAVE_BUTTON = "//button[@type='submit' and contains(@class, 'oxd-button--secondary') and normalize-space(.)='Save']"
-    CANCEL_BUTTON = "//button[@type='button' and contains(@class, 'oxd-button--ghost') and normalize-space(.)='Cancel']"
+    SAVE_BUTTON = Locator(
+        "//button[@type='submit' and contains(@class, 'oxd-button--secondary') and normalize-space(.)='Save']"
+    )
+    CANCEL_BUTTON = Locator(
+        "//button[@type='button' and contains(@class, 'oxd-button--ghost') and normalize-space(.)='Cancel']"
+    )
+    FORM_FIELDS = {
+        "first_name": FIRST_NAME_INPUT,
+        "middle_name": MIDDLE_NAME_INPUT,
+        "last_name": LAST_NAME_INPUT,
+        "email": EMAIL_INPUT,
+    }
 
     @allure.step("Filling first name '{first_name}'")
     def fill_first_name(self, first_name: str) -> "UserDetailsElement":
@@ -29,7 +40,7 @@ class UserDetailsElement(BasePage):
         if element:
             element.clear()
             element.send_keys(first_name)
-            self.logger.info(f"Filled first name: '{first_name}'")
+            self.logger.info("Filled first name: '%s'", first_name)
         else:
             self.logger.error("First name input field not found.")
         return self
@@ -40,7 +51,7 @@ class UserDetailsElement(BasePage):
         if element:
             element.clear()
             element.send_keys(middle_name)
-            self.logger.info(f"Filled middle name: '{middle_name}'")
+            self.logger.info("Filled middle name: '%s'", middle_name)
         else:
             self.logger.error("Middle name input field not found.")
         return self
@@ -51,7 +62,7 @@ class UserDetailsElement(BasePage):
         if element:
             element.clear()
             element.send_keys(last_name)
-            self.logger.info(f"Filled last name: '{last_name}'")
+            self.logger.info("Filled last name: '%s'", last_name)
         else:
             self.logger.error("Last name input field not found.")
         return self
@@ -62,7 +73,7 @@ class UserDetailsElement(BasePage):
         if element:
             element.clear()
             element.send_keys(email)
-            self.logger.info(f"Filled email: '{email}'")
+            self.logger.info("Filled email: '%s'", email)
         else:
             self.logger.error("Email input field not found.")
         return self
@@ -0,0 +1,84 @@
+import json
+import logging
+from types import SimpleNamespace
+from typing import Optional
+
+import allure
+import pytest
+
+from src.main.frontend.helper.action_log import ActionLog
+from src.main.frontend.helper.step_tracer import StepTracer
+from src.main.frontend.helper.worker_helper import WorkerHelper
+from src.main.frontend.pages.login_page import LoginPage
+
+
+class ActionPage:
+    def __init__(self):
+        self.browser = SimpleNamespace()
+
+    @StepTracer.traced()
+    def wait_for_element(self, xpath: str) -> Optional[str]:
+        return None if "missing" in xpath else "element"
+
+
+@pytest.fixture
+def action_log_path(request, tmp_path):
+    """Writes the actions of the test to its own file, then restores the session's log."""
+    yield str(tmp_path / "actions.jsonl")
+    ActionLog.stop()
+    if request.config.getoption("--action_log"):
+        ActionLog.start(
+            WorkerHelper.worker_path(request.config.getoption("--action_log")),
+            logging.getLevelName(request.config.getoption("--action_log_level")),
+        )
+
+
+def read_actions(path):
+    ActionLog.stop()
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@allure.title("Actions are written as JSON lines with test id, locator and duration")
+def test_actions_are_written_as_json_lines(action_log_path):
+    ActionLog.start(action_log_path)
+    page = ActionPage()
+    page.wait_for_element(LoginPage.LOGIN_TITLE)
+    page.wait_for_element("//div[@id='missing']")
+
+    actions = read_actions(action_log_path)
+
+    assert [(a["locator"], a["outcome"], a["level"]) for a in actions] == [
+        ("LoginPage.LOGIN_TITLE", "ok", "INFO"),
+        ("//div[@id='missing']", "failed", "WARNING"),
+    ]
+    assert all("test_actions_are_written_as_json_lines" in a["test"] for a in actions)
+    assert actions[0]["message"].startswith(
+        "wait_for_element LoginPage.LOGIN_TITLE: ok"
+    )
+    summary = ActionLog.summarize(action_log_path)
+    assert {(row["locator"], row["calls"], row["failures"]) for row in summary} == {
+        ("LoginPage.LOGIN_TITLE", 1, 0),
+        ("//div[@id='missing']", 1, 1),
+    }
+
+
+@allure.title("Actions below the level are filtered out before anything is built")
+def test_level_filters_actions(action_log_path):
+    ActionLog.start(action_log_path, logging.WARNING)
+    page = ActionPage()
+    page.wait_for_element(LoginPage.LOGIN_TITLE)
+    page.wait_for_element("//div[@id='missing']")
+
+    actions = read_actions(action_log_path)
+
+    assert [a["outcome"] for a in actions] == ["failed"]
+
+
+@allure.title("Nothing is recorded until the action log is started")
+def test_action_log_is_off_until_started(action_log_path):
+    ActionLog.stop()
+    ActionPage().wait_for_element("//div[@id='missing']")
+
+    assert not ActionLog.is_enabled()
+    assert ActionLog.logger.handlers == []
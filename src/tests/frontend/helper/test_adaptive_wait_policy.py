@@ -0,0 +1,101 @@
+import json
+
+import allure
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.main.frontend.helper.adaptive_wait_policy import (
+    AdaptiveWait,
+    AdaptiveWaitPolicy,
+)
+from src.main.frontend.pages.login_page import LoginPage
+
+
+@pytest.fixture
+def history_path(tmp_path):
+    path = tmp_path / "wait_history.json"
+    path.write_text(
+        json.dumps(
+            {
+                "chrome-local": {
+                    "LoginPage.USERNAME_INPUT": [0.2, 0.3, 0.4, 0.4, 0.6, 0.8],
+                    "LoginPage.LOGIN_TITLE": [9.0, 12.0, 15.0, 20.0, 25.0],
+                },
+                "firefox-local": {"LoginPage.PASSWORD_INPUT": [0.1] * 5},
+            }
+        )
+    )
+    return str(path)
+
+
+@allure.title("Timeouts and poll intervals are learned from the wait history")
+def test_learned_timeouts_and_polling(history_path):
+    policy = AdaptiveWaitPolicy(history_path, "chrome-local")
+
+    assert policy.timeout_for(LoginPage.USERNAME_INPUT, 2) == 2.2
+    assert policy.timeout_for(LoginPage.USERNAME_INPUT, 10) == 10
+    assert policy.timeout_for(LoginPage.LOGIN_TITLE, 10) == 30.0
+    assert policy.timeout_for(LoginPage.PASSWORD_INPUT, 10) == 10
+    assert policy.poll_intervals(LoginPage.USERNAME_INPUT) == [0.1, 0.2, 0.4, 0.5]
+    assert policy.poll_intervals(LoginPage.PASSWORD_INPUT) == [0.5]
+
+
+@allure.title("Observations are merged into the history written by other workers")
+def test_save_merges_history(history_path):
+    policy = AdaptiveWaitPolicy(history_path, "chrome-local", max_samples=7)
+    policy.record(LoginPage.USERNAME_INPUT, 0.25)
+    policy.record(LoginPage.PASSWORD_INPUT, 0.5)
+    with open(history_path) as f:
+        history = json.load(f)
+    history["chrome-local"]["LoginPage.LOGIN_BUTTON"] = [0.1]
+    with open(history_path, "w") as f:
+        json.dump(history, f)
+
+    policy.save()
+
+    with open(history_path) as f:
+        saved = json.load(f)["chrome-local"]
+    assert saved["LoginPage.USERNAME_INPUT"] == [0.2, 0.3, 0.4, 0.4, 0.6, 0.8, 0.25]
+    assert saved["LoginPage.PASSWORD_INPUT"] == [0.5]
+    assert saved["LoginPage.LOGIN_BUTTON"] == [0.1]
+    assert [row["locator"] for row in policy.report()] == [
+        "LoginPage.USERNAME_INPUT",
+        "LoginPage.PASSWORD_INPUT",
+    ]
+
+
+@allure.title("Each environment learns from its own section of the history")
+def test_history_is_kept_per_environment(history_path):
+    firefox = AdaptiveWaitPolicy(history_path, "firefox-local")
+    remote = AdaptiveWaitPolicy(history_path, "chrome-remote-latest")
+
+    assert firefox.poll_intervals(LoginPage.PASSWORD_INPUT) == [
+        0.05,
+        0.1,
+        0.2,
+        0.4,
+        0.5,
+    ]
+    assert firefox.poll_intervals(LoginPage.USERNAME_INPUT) == [0.5]
+    assert remote.samples(LoginPage.USERNAME_INPUT) == []
+
+    remote.record(LoginPage.USERNAME_INPUT, 3.0)
+    remote.save()
+
+    with open(history_path) as f:
+        saved = json.load(f)
+    assert saved["chrome-remote-latest"] == {"LoginPage.USERNAME_INPUT": [3.0]}
+    assert len(saved["chrome-local"]["LoginPage.USERNAME_INPUT"]) == 6
+
+
+@allure.title("An adaptive wait polls at growing intervals until its timeout")
+def test_adaptive_wait_polls_at_intervals():
+    polls = []
+
+    def condition(driver):
+        polls.append(driver)
+        return len(polls) == 3 and "ready"
+
+    assert AdaptiveWait("driver", 1, [0.01, 0.02]).until(condition) == "ready"
+    with pytest.raises(TimeoutException):
+        AdaptiveWait("driver", 0.05, [0.01, 0.02]).until(lambda driver: False)
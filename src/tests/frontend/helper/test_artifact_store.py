@@ -0,0 +1,90 @@
+import gzip
+import json
+import os
+
+import allure
+
+from src.main.frontend.helper.artifact_store import ArtifactStore
+
+PAGE_SOURCE = """
+<html>
+    <!-- login form -->
+    <body>
+        <form>  <input name="username">  </form>
+    </body>
+</html>
+"""
+
+
+@allure.title("Identical artifacts of different tests are stored once")
+def test_identical_artifacts_are_deduplicated(tmp_path):
+    store = ArtifactStore(str(tmp_path), str(tmp_path / "index.json"))
+
+    first = store.save("test_a", "page_source", PAGE_SOURCE, "html")
+    second = store.save("test_b[chrome]", "page_source", PAGE_SOURCE, "html")
+    store.close()
+
+    assert first["path"] == second["path"]
+    assert second.get("deduplicated")
+    stored = [name for _, _, files in os.walk(tmp_path) for name in files]
+    assert sorted(stored) == sorted([os.path.basename(first["path"]), "index.json"])
+
+
+@allure.title("Page sources are minified and compressed")
+def test_page_source_is_minified_and_compressed(tmp_path):
+    store = ArtifactStore(str(tmp_path), str(tmp_path / "index.json"))
+
+    entry = store.save("test_a", "page_source", PAGE_SOURCE, "html")
+    store.close()
+
+    with gzip.open(entry["path"], "rt") as f:
+        assert (
+            f.read() == '<html><body><form><input name="username"></form></body></html>'
+        )
+
+
+@allure.title("Artifacts over the size caps are skipped and listed in the index")
+def test_size_caps(tmp_path):
+    index_path = tmp_path / "index.json"
+    store = ArtifactStore(
+        str(tmp_path), str(index_path), max_artifact_bytes=1000, max_total_bytes=1
+    )
+
+    too_large = store.save("test_a", "failure_screenshot", b"\x89PNG" * 500, "png")
+    stored = store.save("test_a", "page_source", PAGE_SOURCE, "html")
+    store._executor.submit(lambda: None).result()
+    over_total = store.save("test_b", "page_source", PAGE_SOURCE + " ", "html")
+    store.close()
+
+    assert "skipped" in too_large
+    assert os.path.exists(stored["path"])
+    assert "skipped" in over_total
+    index = json.loads(index_path.read_text())
+    assert [entry["name"] for entry in index["tests"]["test_a"]] == [
+        "failure_screenshot",
+        "page_source",
+    ]
+
+
+@allure.title("A reference to the stored file is attached to allure once per artifact")
+def test_references_are_attached_once_per_artifact(tmp_path, monkeypatch):
+    attached = []
+    monkeypatch.setattr(
+        allure,
+        "attach",
+        lambda body, name, attachment_type: attached.append(
+            (name, body, attachment_type)
+        ),
+    )
+    store = ArtifactStore(
+        str(tmp_path), str(tmp_path / "index.json"), max_artifact_bytes=1000
+    )
+
+    store.save("test_a", "failure_screenshot", b"\x89PNG" * 500, "png")
+    page_source = store.save("test_a", "page_source", PAGE_SOURCE, "html")
+    store.save("test_b", "page_source", PAGE_SOURCE, "html")
+    store.close()
+
+    assert attached == [
+        ("page_source", page_source["path"], allure.attachment_type.URI_LIST)
+    ]
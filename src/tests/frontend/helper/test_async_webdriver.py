@@ -0,0 +1,157 @@
+import asyncio
+
+import allure
+import pytest
+from aiohttp import web
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from src.main.frontend.helper.async_webdriver import AsyncSessionRunner, AsyncWebDriver
+from src.main.frontend.helper.fake_orangehrm import FakeOrangeHrm
+from src.main.frontend.pages.async_login_page import AsyncLoginPage
+
+USERNAME = "Admin"
+PASSWORD = "admin123"
+ERRORS = {
+    NoSuchElementException: "no such element",
+    StaleElementReferenceException: "stale element reference",
+    JavascriptException: "javascript error",
+}
+
+
+class FakeW3CServer:
+    """Answers the W3C commands AsyncWebDriver sends with a FakeWebDriver per session."""
+
+    def __init__(self, base_url: str, snapshots_dir: str, latency: float = 0.01):
+        self.base_url = base_url
+        self.snapshots_dir = snapshots_dir
+        self.latency = latency
+        self.sessions = {}
+        self.elements = {}
+        self.max_open = 0
+        self.app = web.Application()
+        self.app.router.add_post("/session", self.new_session)
+        self.app.router.add_delete("/session/{session}", self.delete_session)
+        self.app.router.add_route("*", "/session/{session}/{command:.*}", self.command)
+
+    def reference(self, session_id, value):
+        if hasattr(value, "node"):
+            element_id = f"{session_id}.{value.id}"
+            self.elements[element_id] = value
+            return {AsyncWebDriver.ELEMENT_KEY: element_id}
+        if isinstance(value, list):
+            return [self.reference(session_id, item) for item in value]
+        return value
+
+    async def new_session(self, request):
+        driver = FakeOrangeHrm.create_driver(
+            self.base_url, USERNAME, PASSWORD, self.snapshots_dir
+        )
+        session_id = f"session-{len(self.sessions) + 1}"
+        self.sessions[session_id] = driver
+        self.max_open = max(self.max_open, sum(map(bool, self.sessions.values())))
+        return web.json_response(
+            {"value": {"sessionId": session_id, "capabilities": {}}}
+        )
+
+    async def delete_session(self, request):
+        self.sessions[request.match_info["session"]] = None
+        return web.json_response({"value": None})
+
+    async def command(self, request):
+        await asyncio.sleep(self.latency)
+        session_id = request.match_info["session"]
+        driver = self.sessions[session_id]
+        parts = request.match_info["command"].split("/")
+        body = await request.json() if request.can_read_body else {}
+        try:
+            if parts == ["url"]:
+                value = driver.get(body["url"]) if body else driver.current_url
+            elif parts == ["elements"]:
+                value = driver.find_elements(body["using"], body["value"])
+            elif parts == ["execute", "sync"]:
+                args = [
+                    self.elements[arg[AsyncWebDriver.ELEMENT_KEY]]
+                    if isinstance(arg, dict)
+                    else arg
+                    for arg in body["args"]
+                ]
+                value = driver.execute_script(body["script"], *args)
+            else:
+                element = self.elements[parts[1]]
+                if parts[2] == "value":
+                    value = element.send_keys(body["text"])
+                elif parts[2] == "text":
+                    value = element.text
+                else:
+                    value = getattr(element, parts[2])()
+        except tuple(ERRORS) as e:
+            error = {"error": ERRORS[type(e)], "message": e.msg, "stacktrace": ""}
+            return web.json_response({"value": error}, status=404)
+        return web.json_response({"value": self.reference(session_id, value)})
+
+
+async def serve(server: FakeW3CServer, main):
+    runner = web.AppRunner(server.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        return await main(f"http://127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def base_url(pytestconfig):
+    return pytestconfig.getoption("--base_url")
+
+
+@allure.title("Async sessions log in many users concurrently from one event loop")
+def test_async_sessions_log_in_concurrently(base_url, snapshots_dir):
+    server = FakeW3CServer(base_url, snapshots_dir)
+    users = [(USERNAME, PASSWORD)] * 3 + [(USERNAME, "qwerty123")]
+
+    async def flow(driver, user):
+        page = AsyncLoginPage(driver)
+        if not await page.login_to_admin_panel(*user, timeout=1):
+            return None
+        return await page.get_list_available_dashboards()
+
+    async def main(url):
+        runner = AsyncSessionRunner(
+            url, ChromeOptions, concurrency=4, base_url=base_url
+        )
+        return await runner.run(flow, users)
+
+    results = asyncio.run(serve(server, main))
+
+    assert server.max_open == 4
+    assert all("Time at Work" in dashboards for dashboards in results[:3])
+    assert results[3] is None
+    assert not any(server.sessions.values())
+
+
+@allure.title("W3C errors of async commands are raised as Selenium exceptions")
+def test_async_errors_are_selenium_exceptions(base_url, snapshots_dir):
+    server = FakeW3CServer(base_url, snapshots_dir)
+
+    async def flow(driver, _):
+        await driver.get(base_url)
+        with pytest.raises(NoSuchElementException):
+            await driver.find_element("xpath", "//missing")
+        button = await driver.find_element("xpath", "//button[@type='submit']")
+        await driver.get(base_url)
+        with pytest.raises(StaleElementReferenceException):
+            await button.click()
+        return await driver.current_url()
+
+    async def main(url):
+        return await AsyncSessionRunner(url, ChromeOptions).run(flow, [None])
+
+    assert asyncio.run(serve(server, main)) == [base_url]
@@ -0,0 +1,51 @@
+import allure
+import pytest
+import requests
+
+from src.main.backend.helper.orangehrm_api_helper import OrangeHrmApiHelper
+from src.main.frontend.helper.data_seeder import DataSeeder
+from src.main.frontend.helper.fixture_server import FixtureServer
+
+
+@pytest.fixture
+def fixture_server(snapshots_dir):
+    server = FixtureServer("Admin", "admin123", snapshots_dir).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def seeder(fixture_server):
+    return DataSeeder(OrangeHrmApiHelper(fixture_server.base_url))
+
+
+@allure.title("Seeded records are created through the API and removed on cleanup")
+def test_seeds_and_cleans_up(fixture_server, seeder):
+    employees = seeder.employees(3, last_name="Seeded")
+    user = seeder.user()
+    candidate = seeder.candidate(email="seeded@example.com")
+
+    records = fixture_server.api.records
+    assert [e["lastName"] for e in employees] == ["Seeded"] * 3
+    assert len(records["pim/employees"]) == 4
+    assert records["admin/users"][user["id"]]["empNumber"] in records["pim/employees"]
+    assert records["recruitment/candidates"][candidate["id"]]["email"] == (
+        "seeded@example.com"
+    )
+
+    seeder.cleanup()
+
+    assert all(not resource for resource in records.values())
+
+
+@allure.title("A seeded employee is shown on their personal details page")
+def test_seeded_employee_page(fixture_server, seeder):
+    employee = seeder.employee(first_name="Ada", last_name="Lovelace")
+
+    page = requests.get(
+        f"{fixture_server.url}/web/index.php/pim/viewPersonalDetails/empNumber/"
+        f"{employee['empNumber']}",
+        timeout=5,
+    )
+
+    assert "Ada Lovelace" in page.text
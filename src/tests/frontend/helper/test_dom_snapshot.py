@@ -0,0 +1,35 @@
+import allure
+
+from src.main.frontend.helper.dom_snapshot import DomSnapshot, InteractionCounter
+from src.main.frontend.pages.base_page import BasePage
+
+SOURCE = """
+<html><head><title>Dashboard</title></head><body>
+  <div class="row"><div>0038</div><div>Ada <b>Lovelace</b></div></div>
+  <div class="row"><div>0039</div><div hidden>Charles Babbage</div></div>
+  <div class="row" hidden><div>0040</div></div>
+  <div class="row">   </div>
+</body></html>
+"""
+
+
+@allure.title("Rendered texts of a snapshot leave out hidden elements")
+def test_snapshot_texts():
+    snapshot = DomSnapshot(SOURCE, version=1)
+
+    assert snapshot.texts("//div[@class='row']") == ["0038\nAda Lovelace", "0039"]
+    assert snapshot.count("//div[@class='row']") == 3
+    assert snapshot.text("//b") == "Lovelace"
+    assert snapshot.text("//h1") == ""
+
+
+@allure.title("Only commands that can change the page are counted as interactions")
+def test_interaction_counter_skips_read_only_commands():
+    counter = InteractionCounter(None, BasePage.READ_ONLY_SCRIPTS)
+
+    assert counter.is_mutating("clickElement", {"id": "1"})
+    assert counter.is_mutating("w3cExecuteScript", {"script": BasePage.JS_FILL_FORM})
+    assert not counter.is_mutating(
+        "w3cExecuteScript", {"script": BasePage.JS_DOM_SNAPSHOT}
+    )
+    assert not counter.is_mutating("findElements", {"using": "xpath"})
@@ -0,0 +1,73 @@
+import sys
+
+import allure
+import pytest
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from src.main.frontend.helper.driver_service_manager import DriverServiceManager
+
+# A stand-in for chromedriver answering /status and creating and deleting sessions.
+FAKE_DRIVER = """
+import itertools, json, sys, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ids = itertools.count(1)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def reply(self, value):
+        body = json.dumps({"value": value}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.reply({"ready": True, "message": "ready"})
+        if self.path == "/shutdown":
+            threading.Thread(target=self.server.shutdown).start()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.reply({"sessionId": f"session-{next(ids)}", "capabilities": {}})
+
+    def do_DELETE(self):
+        self.reply(None)
+
+    def log_message(self, *args):
+        pass
+
+
+port = int(next(a for a in sys.argv if a.startswith("--port=")).split("=")[1])
+ThreadingHTTPServer(("localhost", port), Handler).serve_forever()
+"""
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    driver_path = tmp_path / "chromedriver"
+    driver_path.write_text(f"#!{sys.executable}\n{FAKE_DRIVER}")
+    driver_path.chmod(0o755)
+    monkeypatch.setenv("SE_CHROMEDRIVER", str(driver_path))
+    manager = DriverServiceManager()
+    yield manager
+    manager.stop()
+
+
+@allure.title("Sessions share one driver service, which is restarted after a crash")
+def test_sessions_share_and_restart_service(manager):
+    first = manager.create_session("chrome", ChromeOptions())
+    second = manager.create_session("chrome", ChromeOptions())
+
+    assert first.session_id != second.session_id
+    assert first.driver_service is second.driver_service
+    assert manager.started == 1
+
+    first.driver_service.process.kill()
+    first.driver_service.process.wait()
+    third = manager.create_session("chrome", ChromeOptions())
+
+    assert third.driver_service is not first.driver_service
+    assert manager.is_healthy(third.driver_service)
+    assert (manager.started, manager.restarted) == (2, 1)
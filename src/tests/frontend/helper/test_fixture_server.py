@@ -0,0 +1,47 @@
+import allure
+import pytest
+import requests
+
+from src.main.frontend.helper.fixture_server import FixtureServer
+
+
+@pytest.fixture
+def fixture_server(snapshots_dir):
+    server = FixtureServer("Admin", "admin123", snapshots_dir).start()
+    yield server
+    server.stop()
+
+
+def post_login(server, username, password):
+    page = requests.get(server.base_url, timeout=5).text
+    page = page.replace('name="username"', f'name="username" value="{username}"')
+    page = page.replace('name="password"', f'name="password" value="{password}"')
+    return requests.post(
+        f"{server.url}{FixtureServer.ACTION_PATH}login",
+        json={"url": server.base_url, "html": page},
+        timeout=5,
+    ).json()
+
+
+@allure.title("Snapshots are served with the fixture script")
+def test_serves_snapshots(fixture_server):
+    response = requests.get(fixture_server.base_url, timeout=5)
+    script = requests.get(f"{fixture_server.url}{FixtureServer.SCRIPT_PATH}", timeout=5)
+    missing = requests.get(f"{fixture_server.url}/web/index.php/unknown", timeout=5)
+
+    assert response.status_code == 200
+    assert "orangehrm-login-title" in response.text
+    assert FixtureServer.SCRIPT_PATH in response.text
+    assert script.headers["Content-Type"] == "application/javascript"
+    assert missing.status_code == 404
+
+
+@allure.title("Form actions answer with a navigation or the updated page")
+def test_runs_form_actions(fixture_server):
+    success = post_login(fixture_server, "Admin", "admin123")
+    failure = post_login(fixture_server, "Admin", "wrong")
+
+    assert success == {
+        "location": f"{fixture_server.url}/web/index.php/dashboard/index"
+    }
+    assert "Invalid credentials" in failure["html"]
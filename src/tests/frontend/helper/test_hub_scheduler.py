@@ -0,0 +1,199 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+from selenium.common.exceptions import (
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError
+
+from src.main.frontend.helper.hub_scheduler import Hub, HubScheduler
+
+
+class FakeSession:
+    def __init__(self, url):
+        self.url = url
+
+
+def create_session(url, options):
+    return FakeSession(url)
+
+
+@pytest.fixture
+def stand_in_hub():
+    """Starts a local HTTP server answering Selenoid's /status with the given load."""
+    servers = []
+
+    def start(used, total):
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps({"total": total, "used": used}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}/wd/hub"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+@allure.title("Sessions are routed to the least-loaded hub")
+def test_routes_to_least_loaded_hub():
+    scheduler = HubScheduler(
+        [
+            Hub("http://hub-1", {"chrome": {"latest": 2}}),
+            Hub("http://hub-2", {"chrome": {"latest": 4}}),
+        ],
+        session_factory=create_session,
+        live_status=False,
+    )
+    hubs = [scheduler.acquire("chrome", None, None)[1].url for _ in range(3)]
+
+    assert hubs.count("http://hub-1") == 1, f"Unexpected routing {hubs}"
+    assert hubs.count("http://hub-2") == 2, f"Unexpected routing {hubs}"
+
+
+@allure.title("Session creation is retried on another hub after SessionNotCreated")
+def test_retries_on_another_hub():
+    def factory(url, options):
+        if url == "http://broken":
+            raise SessionNotCreatedException("no browser image")
+        return FakeSession(url)
+
+    scheduler = HubScheduler(
+        [
+            Hub("http://broken", {"chrome": {"latest": 5}}),
+            Hub("http://healthy", {"chrome": {"latest": 1}}),
+        ],
+        session_factory=factory,
+        live_status=False,
+    )
+    session, hub = scheduler.acquire("chrome", None, None)
+
+    assert hub.url == "http://healthy"
+    report = scheduler.report()
+    assert report["http://broken"]["failures"] == 1
+    assert report["http://healthy"]["sessions"] == 1
+
+
+@allure.title("Unreachable hubs are failed over and never keep a slot reserved")
+def test_failed_sessions_release_their_slot():
+    errors = {
+        "http://refused": MaxRetryError(None, "/session", "connection refused"),
+        "http://crashing": WebDriverException("unknown error"),
+    }
+
+    def factory(url, options):
+        if url in errors:
+            raise errors[url]
+        if url == "http://interrupted":
+            raise KeyboardInterrupt
+        return FakeSession(url)
+
+    hubs = [
+        Hub("http://refused", {"chrome": {"latest": 5}}),
+        Hub("http://crashing", {"chrome": {"latest": 5}}),
+        Hub("http://healthy", {"chrome": {"latest": 1}}),
+    ]
+    scheduler = HubScheduler(hubs, session_factory=factory, live_status=False)
+
+    _, hub = scheduler.acquire("chrome", None, None)
+
+    assert hub.url == "http://healthy"
+    assert [hub.failures for hub in hubs] == [1, 1, 0]
+    assert [hub.free_slots("chrome", None) for hub in hubs] == [5, 5, 0]
+
+    interrupted = Hub("http://interrupted", {"chrome": {"latest": 1}})
+    scheduler = HubScheduler([interrupted], session_factory=factory, live_status=False)
+    with pytest.raises(KeyboardInterrupt):
+        scheduler.acquire("chrome", None, None)
+    assert interrupted.free_slots("chrome", None) == 1
+
+
+@allure.title("Capacity is counted for the selected browser and version only")
+def test_capacity_per_browser():
+    scheduler = HubScheduler(
+        [
+            Hub(
+                "http://hub-1",
+                {"chrome": {"latest": 2, "120": 1}, "firefox": {"latest": 3}},
+            ),
+            Hub("http://hub-2", {"chrome": {"latest": 4}}),
+        ]
+    )
+
+    assert scheduler.total_capacity == 10
+    assert scheduler.capacity("chrome", None) == 6
+    assert scheduler.capacity("chrome", "120") == 1
+    assert scheduler.capacity("firefox", "latest") == 3
+    assert scheduler.capacity("edge", None) == 0
+
+
+@allure.title("Requests are queued until a slot is released")
+def test_queues_until_slot_is_released():
+    scheduler = HubScheduler(
+        [Hub("http://hub-1", {"chrome": {"latest": 1}})],
+        session_factory=create_session,
+        queue_timeout=5,
+        live_status=False,
+    )
+    first, hub = scheduler.acquire("chrome", None, None)
+    threading.Timer(0.2, scheduler.finish, (first, hub, "chrome", None)).start()
+
+    second, _ = scheduler.acquire("chrome", None, None)
+
+    assert second.url == "http://hub-1"
+    assert scheduler.report()["http://hub-1"]["max_queue_wait_seconds"] >= 0.1
+
+
+@allure.title("A request times out when no hub frees a slot")
+def test_queue_timeout():
+    scheduler = HubScheduler(
+        [Hub("http://hub-1", {"chrome": {"latest": 1}})],
+        session_factory=create_session,
+        queue_timeout=0.1,
+        live_status=False,
+    )
+    scheduler.acquire("chrome", None, None)
+
+    with pytest.raises(TimeoutException):
+        scheduler.acquire("chrome", None, None)
+
+
+@allure.title("Unsupported browsers are rejected without queueing")
+def test_unsupported_browser():
+    scheduler = HubScheduler(
+        [Hub("http://hub-1", {"chrome": {"latest": 1}})],
+        session_factory=create_session,
+        live_status=False,
+    )
+
+    with pytest.raises(SessionNotCreatedException):
+        scheduler.acquire("firefox", None, None)
+
+
+@allure.title("Live load reported by the hubs breaks ties between equally used hubs")
+def test_live_status_breaks_ties(stand_in_hub):
+    busy = stand_in_hub(used=3, total=4)
+    idle = stand_in_hub(used=0, total=4)
+    scheduler = HubScheduler(
+        [Hub(busy, {"chrome": {"latest": 4}}), Hub(idle, {"chrome": {"latest": 4}})],
+        session_factory=create_session,
+    )
+
+    _, hub = scheduler.acquire("chrome", None, None)
+
+    assert hub.url == idle
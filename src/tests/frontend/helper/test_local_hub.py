@@ -0,0 +1,111 @@
+import json
+import sys
+import threading
+import time
+
+import allure
+import pytest
+import requests
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from src.main.frontend.helper.local_hub import LocalHub
+from src.main.frontend.helper.remote_options import RemoteOptions
+from src.tests.frontend.helper.test_driver_service_manager import FAKE_DRIVER
+
+
+@pytest.fixture
+def hub(tmp_path, monkeypatch):
+    driver_path = tmp_path / "chromedriver"
+    driver_path.write_text(f"#!{sys.executable}\n{FAKE_DRIVER}")
+    driver_path.chmod(0o755)
+    monkeypatch.setenv("SE_CHROMEDRIVER", str(driver_path))
+    hub = LocalHub({"chrome": 1}, warm=1, queue_timeout=10).start()
+    yield hub
+    hub.stop()
+
+
+@allure.title(
+    "The local hub hands out warm sessions and queues requests over its capacity"
+)
+def test_local_hub_queues_over_capacity(hub):
+    first = RemoteWebDriver(command_executor=hub.selenium_url, options=ChromeOptions())
+    status = requests.get(f"{hub.selenium_url}/status").json()
+    assert (status["used"], status["total"]) == (1, 1)
+
+    second = []
+    waiting = threading.Thread(
+        target=lambda: second.append(
+            RemoteWebDriver(command_executor=hub.selenium_url, options=ChromeOptions())
+        )
+    )
+    waiting.start()
+    waiting.join(0.5)
+    assert not second
+    assert requests.get(f"{hub.url}/status").json()["queued"] == 1
+
+    first.quit()
+    waiting.join(10)
+    assert second and second[0].session_id != first.session_id
+    second[0].quit()
+
+    report = requests.get(f"{hub.url}/metrics").json()
+    assert report["sessions"] == 2
+    assert report["warm_hits"] + report["cold_starts"] == 2
+    assert report["max_queue_wait_seconds"] > 0
+
+
+def wait_for_warm_sessions(hub, count):
+    deadline = time.monotonic() + 10
+    while hub.report()["warm_sessions"] != count:
+        assert time.monotonic() < deadline, hub.report()
+        time.sleep(0.05)
+
+
+@allure.title("Warm sessions match the tests' options and count against the capacity")
+def test_warm_sessions_match_and_count_against_capacity(hub):
+    wait_for_warm_sessions(hub, 1)
+
+    driver = RemoteWebDriver(
+        command_executor=hub.selenium_url,
+        options=RemoteOptions.create("chrome", test_name="test_login"),
+    )
+    assert (hub.warm_hits, hub.cold_starts) == (1, 0)
+    driver.quit()
+
+    wait_for_warm_sessions(hub, 1)
+    other = RemoteWebDriver(command_executor=hub.selenium_url, options=ChromeOptions())
+    assert (hub.warm_hits, hub.cold_starts) == (1, 1)
+    assert hub.report()["warm_sessions"] == 0
+    assert hub._occupied("chrome") == 1
+    other.quit()
+
+
+@allure.title("Warm sessions launched before the browser path was found still match")
+def test_warm_sessions_match_once_browser_path_is_found(hub, monkeypatch):
+    wait_for_warm_sessions(hub, 1)
+    # Selenium Manager reports the browser path once it started the first driver service
+    hub.services.browser_paths["chrome"] = "/opt/google/chrome/chrome"
+    launched = []
+    forward = hub._forward
+
+    def recording_forward(method, url, body=None):
+        if method == "POST" and url.endswith("/session"):
+            launched.append(json.loads(body)["capabilities"]["alwaysMatch"])
+        return forward(method, url, body)
+
+    monkeypatch.setattr(hub, "_forward", recording_forward)
+
+    driver = RemoteWebDriver(
+        command_executor=hub.selenium_url, options=RemoteOptions.create("chrome")
+    )
+    assert (hub.warm_hits, hub.cold_starts) == (1, 0)
+    driver.quit()
+
+    wait_for_warm_sessions(hub, 1)
+    assert launched[-1]["goog:chromeOptions"]["binary"] == "/opt/google/chrome/chrome"
+    driver = RemoteWebDriver(
+        command_executor=hub.selenium_url, options=RemoteOptions.create("chrome")
+    )
+    assert (hub.warm_hits, hub.cold_starts) == (2, 0)
+    driver.quit()
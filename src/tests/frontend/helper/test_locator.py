@@ -0,0 +1,55 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.main.frontend.helper.fake_webdriver import FakeWebDriver
+from src.main.frontend.pages.locator import Locator, LocatorStats
+from src.main.frontend.pages.login_page import LoginPage
+from src.main.frontend.pages.orm.pim_page import PimPage
+
+
+@allure.title("XPaths with an exact CSS equivalent are compiled, others are kept")
+@pytest.mark.parametrize(
+    "xpath, css",
+    [
+        ("//input[@name='username']", "input[name='username']"),
+        ("//div[@id='app']", "div#app"),
+        (
+            "//span[contains(@class, 'oxd-switch-input') and contains(@class, '--label-right')]",
+            "span[class*='oxd-switch-input'][class*='--label-right']",
+        ),
+        (
+            "//div[@class='orangehrm-dashboard-widget-name']/p",
+            "div[class='orangehrm-dashboard-widget-name'] > p",
+        ),
+        ("//a[starts-with(@href, '/web')]//span", "a[href^='/web'] span"),
+        ("//label[text()='Username']/ancestor::div//input", None),
+        ("//button[normalize-space(.)='Save']", None),
+        ("(//div)[1]", None),
+        ("///label", None),
+    ],
+)
+def test_compile_css(xpath, css):
+    assert Locator.compile_css(xpath) == css
+
+
+@allure.title("Page-object locators are named after their class attribute")
+def test_locator_names():
+    assert LoginPage.USERNAME_INPUT.name == "LoginPage.USERNAME_INPUT"
+    assert LoginPage.USERNAME_INPUT.by == (By.CSS_SELECTOR, "input[name='username']")
+    assert PimPage.EMPLOYEE_NAME_INPUT.by == (
+        By.XPATH,
+        PimPage.EMPLOYEE_NAME_INPUT.xpath,
+    )
+    assert LocatorStats.locators["PimPage.TABLE_ROWS"] is PimPage.TABLE_ROWS
+
+
+@allure.title("The compiled CSS selector finds the same element as the XPath")
+def test_css_finds_same_element(snapshots_dir):
+    driver = FakeWebDriver(snapshots_dir)
+    driver.get("/web/index.php/auth/login")
+
+    by_css = driver.find_element(*LoginPage.LOGIN_TITLE.by)
+    by_xpath = driver.find_element(By.XPATH, LoginPage.LOGIN_TITLE.xpath)
+
+    assert by_css.node is by_xpath.node
@@ -0,0 +1,57 @@
+import allure
+import pytest
+
+from src.main.frontend.helper.locator_scanner import LocatorScanner
+from src.main.frontend.pages.locator import Locator
+
+
+@pytest.fixture(scope="module")
+def scanner(snapshots_dir):
+    return LocatorScanner(snapshots_dir, repeat=1)
+
+
+@allure.title(
+    "Every page-object locator is valid and matches the snapshots of its page"
+)
+@pytest.mark.offline
+def test_page_locators_are_healthy(scanner):
+    reports = scanner.scan()
+    unhealthy = {r["name"]: r["problems"] for r in reports if r["problems"]}
+
+    assert reports, "No page-object locators were collected"
+    assert not unhealthy, f"Unhealthy locators: {unhealthy}"
+
+
+@allure.title("Invalid, unmatched and ambiguous locators are flagged")
+def test_flags_problems(scanner):
+    reports = {
+        r["name"]: r
+        for r in scanner.scan(
+            {
+                "PimPage.TYPO_INPUT": "///label[text()='Employee Name']",
+                "LoginPage.MISSING_INPUT": "//input[@name='missing']",
+                "PimPage.ANY_INPUT": "//input",
+            }
+        )
+    }
+
+    assert reports["PimPage.TYPO_INPUT"]["problems"] == [
+        "invalid XPath: '///' is not valid XPath 1.0"
+    ]
+    assert reports["LoginPage.MISSING_INPUT"]["problems"] == [
+        "matches nothing in any snapshot"
+    ]
+    assert reports["PimPage.ANY_INPUT"]["problems"][0].startswith("ambiguous")
+
+
+@allure.title("A CSS selector selecting other elements than its XPath is flagged")
+def test_flags_css_mismatch(scanner):
+    report = scanner.scan_locator(
+        "LoginPage.USERNAME_INPUT", Locator("//input[@name='username']", css="input")
+    )
+
+    assert report["problems"] == [
+        "CSS selector 'input' selects other elements than the XPath in login.html",
+        "CSS selector 'input' selects other elements than the XPath in login_invalid_credentials.html",
+        "CSS selector 'input' selects other elements than the XPath in login_required.html",
+    ]
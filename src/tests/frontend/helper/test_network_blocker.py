@@ -0,0 +1,89 @@
+import json
+
+import allure
+import pytest
+
+from src.main.frontend.helper.network_blocker import NetworkBlocker, NetworkBlockReport
+
+
+class PerformanceLogBrowser:
+    """Returns the given DevTools events as the performance log."""
+
+    def __init__(self, events):
+        self.entries = [
+            {"message": json.dumps({"message": event}), "level": "INFO"}
+            for event in events
+        ]
+
+    def get_log(self, log_type):
+        assert log_type == "performance"
+        return self.entries
+
+
+@allure.title("Asset categories and extra URLs are resolved to blocked URL patterns")
+def test_resolve_patterns():
+    patterns = NetworkBlocker.resolve_patterns(
+        " analytics, media ", "*cdn.example.com*, ,*.css"
+    )
+
+    assert patterns == (
+        NetworkBlocker.URL_PATTERNS["analytics"]
+        + NetworkBlocker.URL_PATTERNS["media"]
+        + ["*cdn.example.com*", "*.css"]
+    )
+    assert NetworkBlocker.resolve_patterns("", None) == []
+    with pytest.raises(ValueError, match="Unknown asset category 'videos'"):
+        NetworkBlocker.resolve_patterns("fonts,videos", "")
+
+
+@allure.title("Blocked requests and loaded bytes are read from the performance log")
+def test_collect_blocked_requests(tmp_path):
+    browser = PerformanceLogBrowser(
+        [
+            {
+                "method": "Network.requestWillBeSent",
+                "params": {
+                    "requestId": "1",
+                    "request": {"url": "https://a.test/app.js"},
+                },
+            },
+            {
+                "method": "Network.requestWillBeSent",
+                "params": {
+                    "requestId": "2",
+                    "request": {"url": "https://www.google-analytics.com/a.js"},
+                },
+            },
+            {
+                "method": "Network.loadingFinished",
+                "params": {"requestId": "1", "encodedDataLength": 1200},
+            },
+            {
+                "method": "Network.loadingFailed",
+                "params": {"requestId": "2", "blockedReason": "inspector"},
+            },
+            {
+                "method": "Network.loadingFailed",
+                "params": {"requestId": "3", "errorText": "net::ERR_ABORTED"},
+            },
+        ]
+    )
+
+    collected = NetworkBlocker(browser, "chrome", ["*google-analytics.com*"]).collect()
+
+    assert collected == {
+        "blocked": ["https://www.google-analytics.com/a.js"],
+        "bytes_loaded": 1200,
+    }
+
+    report = NetworkBlockReport(str(tmp_path / "blocked.json"))
+    report.add("test_a", collected)
+    report.add("test_b", collected)
+    report.write()
+    written = json.loads((tmp_path / "blocked.json").read_text())
+    assert written["blocked_requests"] == 2
+    assert written["bytes_loaded"] == 2400
+    assert written["bytes_saved"] is None
+    assert written["urls"] == [
+        {"url": "https://www.google-analytics.com/a.js", "count": 2, "bytes": None}
+    ]
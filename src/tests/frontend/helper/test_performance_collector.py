@@ -0,0 +1,69 @@
+import allure
+import pytest
+
+from src.main.frontend.helper.performance_collector import PerformanceCollector
+
+
+class MetricsBrowser:
+    """Answers the metrics script with the given results, one per call."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        assert script == PerformanceCollector.JS_COLLECT_METRICS
+        self.calls.append(args)
+        return dict(self.results.pop(0))
+
+
+def metrics(time_origin, resource_count, **values):
+    return {"time_origin": time_origin, "resource_count": resource_count, **values}
+
+
+@allure.title("Captured steps only count the resources loaded since the previous step")
+def test_capture_tracks_resources_per_page():
+    browser = MetricsBrowser(
+        metrics(1.0, 10, largest_contentful_paint=1200),
+        metrics(1.0, 14, largest_contentful_paint=1300),
+        metrics(2.0, 3, largest_contentful_paint=900),
+    )
+    collector = PerformanceCollector(browser)
+
+    first = collector.capture("Login page")
+    collector.capture("Login")
+    collector.capture("Dashboard")
+
+    assert browser.calls == [(0, None), (10, 1.0), (14, 1.0)]
+    assert first == {
+        "step": "Login page",
+        "resource_count": 10,
+        "largest_contentful_paint": 1200,
+    }
+    assert [step["step"] for step in collector.steps] == [
+        "Login page",
+        "Login",
+        "Dashboard",
+    ]
+
+
+@allure.title("Metrics over their threshold are reported, unknown metrics are rejected")
+def test_check_budget_thresholds():
+    collector = PerformanceCollector(
+        MetricsBrowser(
+            metrics(1.0, 5, largest_contentful_paint=4500, ttfb=None),
+            metrics(2.0, 5, largest_contentful_paint=3000, ttfb=900),
+        )
+    )
+    collector.capture("Login page")
+    collector.capture("Dashboard")
+
+    assert collector.check_budget(largest_contentful_paint=4000, ttfb=1000) == [
+        "largest_contentful_paint=4500 exceeds 4000 at step 'Login page'"
+    ]
+    assert collector.check_budget(step="Dashboard", ttfb=500) == [
+        "ttfb=900 exceeds 500 at step 'Dashboard'"
+    ]
+    assert collector.check_budget(step="Dashboard", largest_contentful_paint=4000) == []
+    with pytest.raises(ValueError, match="largest_contentfull_paint"):
+        collector.check_budget(largest_contentfull_paint=4000)
@@ -0,0 +1,45 @@
+import os
+
+import allure
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from src.main.frontend.helper.fake_webdriver import FakeWebDriver
+from src.main.frontend.helper.profile_template import ProfileTemplate
+
+
+@allure.title("Sessions start from copies of a profile template built once")
+def test_profile_template_is_built_once_and_cloned(tmp_path, snapshots_dir):
+    launched = []
+    stopped = []
+
+    def launch(browser_name, profile_dir):
+        launched.append(profile_dir)
+        os.makedirs(os.path.join(profile_dir, "Default", "Cache"))
+        with open(os.path.join(profile_dir, "Default", "Cache", "app.js"), "w") as f:
+            f.write("cached bundle")
+        with open(os.path.join(profile_dir, "SingletonLock"), "w") as f:
+            f.write("locked")
+        return FakeWebDriver(snapshots_dir)
+
+    template = ProfileTemplate(
+        str(tmp_path),
+        ["http://localhost/web/index.php/auth/login"],
+        launch,
+        stopped.append,
+    )
+    first = template.clone("chrome")
+    second = template.clone("chrome")
+
+    assert len(launched) == 1
+    assert len(stopped) == 1
+    assert first != second
+    for profile_dir in (first, second):
+        assert os.path.isfile(os.path.join(profile_dir, "Default", "Cache", "app.js"))
+        assert not os.path.exists(os.path.join(profile_dir, "SingletonLock"))
+
+    options = ProfileTemplate.apply(ChromeOptions(), "chrome", first)
+    assert f"--user-data-dir={first}" in options.arguments
+
+    ProfileTemplate.discard(first)
+    assert not os.path.exists(first)
+    assert os.path.isdir(template.template_dir("chrome"))
@@ -0,0 +1,94 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import allure
+
+from conftest import session_key
+from src.main.frontend.helper.session_prefetcher import SessionPrefetcher
+
+
+class FakeSessions:
+    """Records started and stopped sessions; starting a session takes `delay` seconds."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.started = []
+        self.stopped = []
+        self.lock = threading.Lock()
+
+    def start(self, key, test_name):
+        time.sleep(self.delay)
+        with self.lock:
+            self.started.append((key, test_name))
+        return (key, test_name)
+
+    def stop(self, session):
+        with self.lock:
+            self.stopped.append(session)
+
+
+@allure.title("A session prefetched for the next test is handed out to it")
+def test_prefetched_session_is_reused():
+    sessions = FakeSessions()
+    prefetcher = SessionPrefetcher(sessions.start, sessions.stop, depth=1)
+
+    first = prefetcher.acquire("chrome", "test_a")
+    prefetcher.prefetch([("chrome", "test_b")])
+    prefetcher.release(first)
+    second = prefetcher.acquire("chrome", "test_b")
+    prefetcher.close()
+
+    assert second == ("chrome", "test_b")
+    assert (prefetcher.hits, prefetcher.misses) == (1, 1)
+    assert sessions.stopped == [first]
+
+
+@allure.title("Session startup overlaps with the running test")
+def test_prefetch_overlaps_startup():
+    sessions = FakeSessions(delay=0.3)
+    prefetcher = SessionPrefetcher(sessions.start, sessions.stop, depth=1)
+    prefetcher.prefetch([("chrome", "test_a")])
+    time.sleep(0.3)
+
+    started_at = time.monotonic()
+    prefetcher.acquire("chrome", "test_a")
+    waited = time.monotonic() - started_at
+    prefetcher.close()
+
+    assert waited < 0.2, f"Acquiring a prefetched session took {waited:.2f}s"
+
+
+@allure.title("Prefetched sessions for another browser are discarded")
+def test_mismatched_session_is_discarded():
+    sessions = FakeSessions()
+    prefetcher = SessionPrefetcher(sessions.start, sessions.stop, depth=1)
+    prefetcher.prefetch([("firefox", "test_a")])
+
+    prefetcher.prefetch([("chrome", "test_b")])
+    session = prefetcher.acquire("chrome", "test_b")
+    prefetcher.close()
+
+    assert session == ("chrome", "test_b")
+    assert prefetcher.discarded == 1
+    assert ("firefox", "test_a") in sessions.stopped
+
+
+@allure.title("Sessions are keyed by every option they are started with")
+def test_session_key_covers_the_options():
+    def config(**options):
+        defaults = {"--bv": None, "--remote": True}
+        values = {**defaults, **options}
+        return SimpleNamespace(
+            getoption=values.get,
+            blocked_url_patterns=values.get("blocked"),
+            profile_template=None,
+        )
+
+    chrome = session_key(config(), "chrome")
+
+    assert chrome == session_key(config(), "chrome")
+    assert chrome != session_key(config(), "firefox")
+    assert chrome != session_key(config(**{"--bv": "120.0"}), "chrome")
+    assert chrome != session_key(config(**{"--remote": False}), "chrome")
+    assert chrome != session_key(config(blocked=["*.png"]), "chrome")
@@ -0,0 +1,76 @@
+import json
+from types import SimpleNamespace
+from typing import Optional
+
+import allure
+import pytest
+
+from src.main.frontend.helper.step_tracer import StepTracer
+
+
+class TracedPage:
+    def __init__(self, browser):
+        self.browser = browser
+
+    @StepTracer.traced()
+    def wait_for_element(self, xpath: str) -> Optional[str]:
+        return None if "missing" in xpath else "element"
+
+    @StepTracer.traced()
+    def input_value(self, locator: str, value: str) -> None:
+        self.wait_for_element(locator)
+
+    @StepTracer.traced("click")
+    def broken_click(self, locator: str) -> None:
+        raise RuntimeError("element is not interactable")
+
+
+@pytest.fixture
+def page():
+    browser = SimpleNamespace()
+    browser.step_tracer = StepTracer(browser, capacity=3)
+    return TracedPage(browser)
+
+
+@allure.title("Only the last steps are kept")
+def test_ring_buffer_keeps_last_steps(page):
+    for index in range(5):
+        page.wait_for_element(f"//div[{index}]")
+
+    trace = json.loads(page.browser.step_tracer.to_json("test"))
+
+    assert trace["recorded_steps"] == 5
+    assert [step["locator"] for step in trace["steps"]] == [
+        "//div[2]",
+        "//div[3]",
+        "//div[4]",
+    ]
+
+
+@allure.title("Steps record outcome, nesting and exceptions")
+def test_step_outcomes(page):
+    page.input_value("//input[@name='missing']", "value")
+    with pytest.raises(RuntimeError):
+        page.broken_click("//button")
+
+    nested, outer, click = page.browser.step_tracer.steps
+
+    assert (nested["action"], nested["outcome"], nested["depth"]) == (
+        "wait_for_element",
+        "failed",
+        1,
+    )
+    assert (outer["action"], outer["outcome"], outer["depth"]) == (
+        "input_value",
+        "ok",
+        0,
+    )
+    assert click["action"] == "click"
+    assert click["outcome"] == "RuntimeError: element is not interactable"
+
+
+@allure.title("Nothing is recorded without a tracer")
+def test_without_tracer():
+    page = TracedPage(SimpleNamespace())
+
+    assert page.wait_for_element("//div") == "element"
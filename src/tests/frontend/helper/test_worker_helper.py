@@ -0,0 +1,79 @@
+import os
+
+import allure
+import requests
+
+from src.main.frontend.helper.worker_helper import WorkerHelper
+
+
+class StatusResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        if isinstance(self.body, Exception):
+            raise self.body
+        return self.body
+
+
+@allure.title(
+    "Artifact paths get the xdist worker id, outside workers they are unchanged"
+)
+def test_worker_paths(tmp_path, monkeypatch):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert WorkerHelper.worker_path("reports/a.json") == "reports/a.json"
+    assert WorkerHelper.artifact_dir(str(tmp_path / "logs")) == str(tmp_path / "logs")
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert WorkerHelper.get_worker_id() == "gw3"
+    assert WorkerHelper.worker_path("reports/a.json") == "reports/a_gw3.json"
+    assert WorkerHelper.worker_path("reports/trace") == "reports/trace_gw3"
+    assert WorkerHelper.worker_path("") == ""
+    assert WorkerHelper.worker_path(None) is None
+    path = WorkerHelper.artifact_dir(str(tmp_path / "screenshots"))
+    assert path == os.path.join(str(tmp_path / "screenshots"), "gw3")
+    assert os.path.isdir(path)
+
+
+@allure.title("Unique values differ across workers and within a worker")
+def test_unique_values(monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+    first, second = WorkerHelper.unique("user"), WorkerHelper.unique("user")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    other_worker = WorkerHelper.unique("user")
+
+    assert first.startswith("usergw0") and second.startswith("usergw0")
+    assert other_worker.startswith("usergw1")
+    assert len({first, second, other_worker}) == 3
+
+
+@allure.title("Selenoid capacity is read from /status of the hub")
+def test_selenoid_capacity(monkeypatch):
+    calls = []
+
+    def answer(response):
+        def get(url, timeout):
+            calls.append((url, timeout))
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(requests, "get", get)
+        return WorkerHelper.selenoid_capacity("http://hub:4444/wd/hub")
+
+    assert answer(StatusResponse({"total": 8, "used": 2})) == 8
+    assert calls[0] == ("http://hub:4444/status", 5)
+
+    for response in (
+        StatusResponse({"used": 2}),
+        StatusResponse({"total": "many"}),
+        StatusResponse(ValueError("not JSON")),
+        StatusResponse({}, status_code=502),
+        requests.ConnectionError("down"),
+    ):
+        assert answer(response) is None
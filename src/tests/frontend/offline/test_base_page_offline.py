@@ -0,0 +1,194 @@
+import time
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from src.main.frontend.helper.command_recorder import CommandRecorder
+from src.main.frontend.helper.deadline import DeadlineExceededError
+from src.main.frontend.pages.locator import Locator
+from src.main.frontend.pages.login_page import LoginPage
+
+pytestmark = pytest.mark.offline
+
+
+def count_lookups(browser) -> list:
+    lookups = []
+    find_elements = browser.find_elements
+
+    def counting_find_elements(*args, **kwargs):
+        lookups.append(args)
+        return find_elements(*args, **kwargs)
+
+    browser.find_elements = counting_find_elements
+    return lookups
+
+
+@allure.title("Offline: a displayed element is reused without a new lookup")
+def test_element_cache_reuses_displayed_element(fake_browser):
+    login_page = LoginPage(fake_browser)
+    element = login_page.wait_for_element(LoginPage.USERNAME_INPUT)
+    lookups = count_lookups(fake_browser)
+
+    assert login_page.wait_for_element(LoginPage.USERNAME_INPUT) is element
+    assert lookups == []
+
+
+@allure.title("Offline: navigating invalidates the element cache")
+def test_element_cache_is_invalidated_by_navigation(fake_browser):
+    login_page = LoginPage(fake_browser)
+    element = login_page.wait_for_element(LoginPage.USERNAME_INPUT)
+
+    login_page.refresh_page()
+
+    assert login_page.wait_for_element(LoginPage.USERNAME_INPUT) is not element
+
+
+@allure.title("Offline: a cached element detached by a navigation is looked up again")
+def test_element_cache_drops_stale_elements(fake_browser):
+    login_page = LoginPage(fake_browser)
+    element = login_page.wait_for_element(LoginPage.USERNAME_INPUT)
+
+    login_page.forgot_password()
+
+    assert login_page.wait_for_element(LoginPage.USERNAME_INPUT) is not element
+
+
+@allure.title("Offline: a cached element that got hidden is not returned")
+def test_element_cache_drops_hidden_elements(fake_browser):
+    login_page = LoginPage(fake_browser)
+    element = login_page.wait_for_element(LoginPage.USERNAME_INPUT)
+
+    element.node.set("hidden", "")
+
+    assert login_page.wait_for_element(LoginPage.USERNAME_INPUT, timeout=0) is None
+
+
+@allure.title(
+    "Offline: waits are shortened to the test deadline and fail once it is used up"
+)
+@pytest.mark.deadline(0.3)
+def test_deadline_fails_fast(fake_browser):
+    login_page = LoginPage(fake_browser)
+    started = time.monotonic()
+
+    with pytest.raises(DeadlineExceededError, match="LoginPage.MISSING_TITLE"):
+        login_page.wait_for_element(
+            Locator("//h5[@id='missing']", name="LoginPage.MISSING_TITLE"), timeout=5
+        )
+    with pytest.raises(DeadlineExceededError):
+        login_page.fill_username("Admin")
+    fake_browser.performance_collector = SimpleNamespace(capture=lambda step: None)
+    with pytest.raises(DeadlineExceededError):
+        login_page.go_to_login_page()
+
+    assert time.monotonic() - started < 1
+
+
+@allure.title("Offline: absence is checked at once, disappearing waits for the element")
+def test_absence_and_disappearing(fake_browser):
+    login_page = LoginPage(fake_browser)
+    login_page.wait_for_element(LoginPage.LOGIN_TITLE).node.set("hidden", "")
+    missing = Locator("//h5[@id='missing']", name="LoginPage.MISSING_TITLE")
+    started = time.monotonic()
+
+    assert login_page.is_element_absent(missing)
+    assert login_page.is_element_absent(LoginPage.LOGIN_TITLE)
+    assert login_page.is_element_absent(LoginPage.FORGOT_PASSWORD_BUTTON) is False
+    assert login_page.wait_for_element_to_disappear(LoginPage.LOGIN_TITLE)
+    assert time.monotonic() - started < 1
+    assert not login_page.wait_for_element_to_disappear(missing, timeout=0.1)
+    assert not login_page.wait_for_element_to_disappear(
+        LoginPage.USERNAME_INPUT, timeout=0.1
+    )
+
+
+@allure.title("Offline: reads share a DOM snapshot until the next interaction")
+def test_dom_snapshot_is_reused_until_interaction(fake_browser):
+    login_page = LoginPage(fake_browser)
+    login_page.wait_for_element(LoginPage.LOGIN_TITLE)
+
+    snapshot = login_page.dom_snapshot()
+    assert login_page.get_items_elements(LoginPage.LOGIN_TITLE) == ["Login"]
+    assert login_page.dom_snapshot() is snapshot
+
+    login_page.fill_username("Admin")
+
+    assert login_page.dom_snapshot() is not snapshot
+    assert login_page.dom_snapshot().count(LoginPage.USERNAME_INPUT) == 1
+
+
+@allure.title("Offline: snapshot reads leave out text hidden by visibility or opacity")
+def test_dom_snapshot_leaves_out_invisible_text(fake_browser):
+    login_page = LoginPage(fake_browser)
+    title = login_page.wait_for_element(LoginPage.LOGIN_TITLE)
+
+    title.node.getparent().set("style", "visibility: hidden")
+    assert login_page.get_items_elements(LoginPage.LOGIN_TITLE) == []
+
+    title.node.getparent().attrib.pop("style")
+    title.node.set("style", "opacity: 0")
+    login_page.invalidate_dom_snapshot()
+    assert login_page.get_items_elements(LoginPage.LOGIN_TITLE) == []
+
+    title.node.set("style", "opacity: 0.5")
+    login_page.invalidate_dom_snapshot()
+    assert login_page.get_items_elements(LoginPage.LOGIN_TITLE) == ["Login"]
+
+
+@allure.title("Offline: reads after a wait see changes made without an interaction")
+def test_dom_snapshot_is_refreshed_after_a_wait(fake_browser):
+    login_page = LoginPage(fake_browser)
+    title = login_page.wait_for_element(LoginPage.LOGIN_TITLE)
+    assert login_page.get_items_elements(LoginPage.LOGIN_TITLE) == ["Login"]
+
+    # Like a response of an XHR updating the page after the last command
+    title.node.text = "Sign in"
+
+    assert login_page.get_items_elements(LoginPage.LOGIN_TITLE) == ["Login"]
+    assert login_page.wait_for_element(LoginPage.LOGIN_TITLE) is not None
+    assert login_page.get_items_elements(LoginPage.LOGIN_TITLE) == ["Sign in"]
+    assert login_page.wait_for_element(LoginPage.USERNAME_INPUT) is not None
+    snapshot = login_page.dom_snapshot()
+    assert login_page.wait_for_url_to_contain("/auth/login")
+    assert login_page.dom_snapshot() is not snapshot
+
+
+@allure.title("Offline: fill_form reports the fields that never appeared")
+def test_fill_form_reports_missing_fields(fake_browser):
+    login_page = LoginPage(fake_browser)
+    missing_locator = Locator("//input[@name='missing']")
+
+    missing = login_page.fill_form(
+        {
+            LoginPage.USERNAME_INPUT: "Admin",
+            missing_locator: "value",
+            LoginPage.PASSWORD_INPUT: "secret",
+        },
+        timeout=0.2,
+    )
+
+    assert missing == [missing_locator]
+    assert (
+        fake_browser.find_element("xpath", LoginPage.USERNAME_INPUT).get_attribute(
+            "value"
+        )
+        == "Admin"
+    )
+
+
+@allure.title("Offline: batched fill_form waits once and sets all fields in one script")
+def test_fill_form_batches_commands(fake_browser):
+    login_page = LoginPage(fake_browser)
+    login_page.go_to_login_page()
+    fields = {LoginPage.USERNAME_INPUT: "Admin", LoginPage.PASSWORD_INPUT: "secret"}
+    recorder = CommandRecorder(fake_browser).install()
+
+    assert login_page.fill_form(fields) == []
+    batched = recorder.total_commands
+    login_page.invalidate_element_cache()
+    assert login_page.fill_form(fields, keystrokes=True) == []
+
+    # One wait for the first field (URL, readyState, lookup, visibility), then the script
+    assert batched == 5
+    assert recorder.total_commands - batched > batched
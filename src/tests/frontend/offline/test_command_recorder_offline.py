@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from conftest import check_budgets
+from src.main.frontend.helper.command_recorder import CommandRecorder
+from src.main.frontend.helper.config_helper import ConfigHelper
+from src.main.frontend.pages.login_page import LoginPage
+
+pytestmark = pytest.mark.offline
+
+
+def budget_item(browser, **budget):
+    marker = pytest.mark.webdriver_budget(**budget).mark
+    return SimpleNamespace(
+        funcargs={"browser": browser},
+        get_closest_marker=lambda name: marker if name == "webdriver_budget" else None,
+    )
+
+
+@allure.title("Offline: commands are counted per command, page method and helper")
+def test_commands_are_attributed_to_callers(fake_browser):
+    recorder = CommandRecorder(fake_browser).install()
+    LoginPage(fake_browser).login_to_admin_panel(
+        ConfigHelper.get_key("ADMIN_LOGIN"), ConfigHelper.get_key("ADMIN_PASSWORD")
+    )
+    fake_browser.get(fake_browser.base_url)
+
+    summary = recorder.summary("test")
+
+    assert summary["commands"] == recorder.total_commands > 0
+    assert summary["by_command"]["get"]["count"] == 2
+    assert {"clickElement", "sendKeysToElement"} <= set(summary["by_command"])
+    assert "LoginPage.login_to_admin_panel" in summary["by_page_method"]
+    assert "BasePage._wait_for_locator" in summary["by_helper"]
+    assert summary["by_page_method"]["<test>"]["count"] == 1
+    assert summary["by_helper"]["<direct>"]["count"] >= 1
+
+
+@allure.title("Offline: a test over its WebDriver budget is failed in makereport")
+def test_webdriver_budget_fails_the_report(fake_browser):
+    fake_browser.command_recorder = CommandRecorder(fake_browser).install()
+    LoginPage(fake_browser).go_to_login_page()
+    fake_browser.find_element("xpath", LoginPage.USERNAME_INPUT)
+    commands = fake_browser.command_recorder.total_commands
+
+    within = SimpleNamespace(outcome="passed", longrepr=None)
+    check_budgets(budget_item(fake_browser, commands=commands), within)
+    assert within.outcome == "passed"
+
+    over = SimpleNamespace(outcome="passed", longrepr=None)
+    check_budgets(budget_item(fake_browser, commands=commands - 1), over)
+    assert over.outcome == "failed"
+    assert over.longrepr == (
+        f"WebDriver budget exceeded: {commands} WebDriver commands sent, "
+        f"budget is {commands - 1}"
+    )
@@ -0,0 +1,67 @@
+import allure
+import pytest
+
+from src.main.frontend.helper.config_helper import ConfigHelper
+from src.main.frontend.model.login_model import LoginModel
+from src.main.frontend.pages.alert_element import AlertErrorElement
+from src.main.frontend.pages.login_page import LoginPage
+from src.main.frontend.pages.orm.dashboard_page import DashboardPage
+from src.main.frontend.pages.password_reset_page import PasswordResetPage
+
+pytestmark = pytest.mark.offline
+
+
+@allure.title("Offline: login to the admin panel shows the dashboards")
+def test_login(fake_browser):
+    login_page = LoginPage(fake_browser)
+    login_page.login_to_admin_panel(
+        ConfigHelper.get_key("ADMIN_LOGIN"), ConfigHelper.get_key("ADMIN_PASSWORD")
+    )
+    dashboard_list = DashboardPage(fake_browser).get_list_available_dashboards()
+
+    assert "Time at Work" in dashboard_list
+    assert "Employee Distribution by Location" in dashboard_list
+
+
+@allure.title("Offline: login with a wrong password shows a failure alert")
+def test_login_with_wrong_password(fake_browser):
+    login_page = LoginPage(fake_browser)
+
+    login_page.login_to_admin_panel(ConfigHelper.get_key("ADMIN_LOGIN"), "qwerty123")
+
+    alert = AlertErrorElement(fake_browser)
+    assert alert.get_failure_text_alert() == "Invalid credentials"
+    assert alert.is_input_field_alert_absent()
+
+
+@allure.title("Offline: login without mandatory fields shows 'Required'")
+@pytest.mark.parametrize(
+    "post_request", [LoginModel(username="test"), LoginModel(password="test")]
+)
+def test_login_without_mandatory_fields(fake_browser, post_request):
+    login_page = LoginPage(fake_browser)
+    if post_request.username is not None:
+        login_page.fill_username(post_request.username)
+    if post_request.password is not None:
+        login_page.fill_password(post_request.password)
+
+    login_page.click_for_login()
+
+    alert = AlertErrorElement(fake_browser)
+    assert alert.get_input_field_text_alert() == "Required"
+    assert alert.get_input_field_text_alerts() == ["Required"]
+    assert alert.is_failure_alert_absent()
+
+
+@allure.title("Offline: resetting a password and cancelling the reset")
+def test_reset_and_cancel_reset_password(fake_browser):
+    login_page = LoginPage(fake_browser)
+    login_page.forgot_password()
+    PasswordResetPage(fake_browser).click_cancel()
+    assert login_page.get_login_title_text() == "Login"
+
+    login_page.forgot_password()
+    password_reset_page = PasswordResetPage(fake_browser).reset_password("test")
+
+    text = password_reset_page.get_reset_password_confirmation()
+    assert text == "Reset Password link sent successfully"
@@ -0,0 +1,100 @@
+import allure
+import pytest
+
+from src.main.frontend.helper.config_helper import ConfigHelper
+from src.main.frontend.model.pim_employee_model import PimEmployeeModel
+from src.main.frontend.pages.alert_element import AlertErrorElement
+from src.main.frontend.pages.login_page import LoginPage
+from src.main.frontend.pages.orm.pim_page import PimPage
+
+pytestmark = pytest.mark.offline
+
+
+@pytest.fixture
+def pim_page(fake_browser):
+    LoginPage(fake_browser).login_to_admin_panel(
+        ConfigHelper.get_key("ADMIN_LOGIN"), ConfigHelper.get_key("ADMIN_PASSWORD")
+    )
+    return PimPage(fake_browser)
+
+
+@allure.title("Offline: searching employees by employment status")
+def test_search_by_employment_status(pim_page):
+    pim_page.select_employment_status("Full-Time Permanent")
+    pim_page.click_search()
+
+    rows = pim_page.get_list_available_pim_records()
+
+    assert len(rows) == 2, f"Expected 2 matching rows, but found {rows}"
+    assert all("Full-Time Permanent" in row for row in rows)
+
+
+@allure.title("Offline: adding an employee with login details")
+@pytest.mark.parametrize("keystrokes", [False, True])
+def test_add_employee_with_login_details(pim_page, keystrokes):
+    pim_page.click_add_button()
+    pim_page.fill_personal_details(first="Ada", last="Lovelace", keystrokes=keystrokes)
+    pim_page.click_create_login_details_button()
+    pim_page.fill_login_details(
+        "ada.lovelace", "qwerty123", "qwerty123", keystrokes=keystrokes
+    )
+    pim_page.personal_info.click_save()
+
+    assert pim_page.get_pim_title() == "Personal Details"
+
+
+@allure.title("Offline: validation of invalid login details")
+@pytest.mark.parametrize(
+    "login_data, error_message",
+    [
+        (
+            PimEmployeeModel(
+                username="ada.lovelace",
+                password="qwerty12",
+                confirm_password="qwerty123",
+            ),
+            "Passwords do not match",
+        ),
+        (
+            PimEmployeeModel(
+                username="abc", password="qwerty123", confirm_password="qwerty123"
+            ),
+            "Should be at least 5 characters",
+        ),
+        (
+            PimEmployeeModel(
+                username="ada.lovelace", password="qwerty", confirm_password="qwerty"
+            ),
+            "Should have at least 7 characters",
+        ),
+    ],
+)
+def test_add_employee_with_invalid_login_details(pim_page, login_data, error_message):
+    pim_page.click_add_button()
+    pim_page.fill_personal_details(first="Ada", last="Lovelace")
+    pim_page.click_create_login_details_button()
+    pim_page.fill_login_details(
+        login_data.username, login_data.password, login_data.confirm_password
+    )
+    pim_page.personal_info.click_save()
+
+    actual_text = AlertErrorElement(pim_page.browser).get_input_field_text_alert()
+    assert actual_text == error_message
+
+
+@allure.title("Offline: page objects navigate on their first action only")
+def test_page_objects_navigate_lazily(fake_browser):
+    login_page = LoginPage(fake_browser)
+    pim_page = PimPage(fake_browser)
+    assert fake_browser.history == []
+
+    login_page.login_to_admin_panel(
+        ConfigHelper.get_key("ADMIN_LOGIN"), ConfigHelper.get_key("ADMIN_PASSWORD")
+    )
+    assert len(fake_browser.history) == 2
+
+    pim_page.click_add_button()
+    visited = len(fake_browser.history)
+    PimPage(fake_browser).fill_personal_details(first="Ada", last="Lovelace")
+
+    assert len(fake_browser.history) == visited
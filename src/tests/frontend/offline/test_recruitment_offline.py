@@ -0,0 +1,55 @@
+import allure
+import pytest
+
+from src.main.frontend.helper.config_helper import ConfigHelper
+from src.main.frontend.model.candidate_model import CandidateModel
+from src.main.frontend.pages.alert_element import AlertErrorElement
+from src.main.frontend.pages.login_page import LoginPage
+from src.main.frontend.pages.orm.recruitment_page import RecruitmentPage
+
+pytestmark = pytest.mark.offline
+
+
+@pytest.fixture
+def recruitment_page(fake_browser):
+    LoginPage(fake_browser).login_to_admin_panel(
+        ConfigHelper.get_key("ADMIN_LOGIN"), ConfigHelper.get_key("ADMIN_PASSWORD")
+    )
+    return RecruitmentPage(fake_browser)
+
+
+@allure.title("Offline: adding a candidate")
+def test_add_candidate_success(recruitment_page):
+    recruitment_page.click_add_candidate()
+    recruitment_page.select_candidate("Junior Account Assistant")
+    recruitment_page.fill_candidate_details(
+        CandidateModel(first_name="Ada", last_name="Lovelace", email="ada@example.com")
+    )
+    recruitment_page.fill_application_date("2025-01-02")
+    recruitment_page.click_consent_checkbox()
+    recruitment_page.personal_info.click_save()
+
+    assert recruitment_page.get_application_stage_title() == "Application Stage"
+
+
+@allure.title("Offline: validation of candidate fields")
+@pytest.mark.parametrize(
+    "candidate_data, error_message",
+    [
+        (CandidateModel(first_name="test", email="email@email.com"), "Required"),
+        (CandidateModel(first_name="test", last_name="test"), "Required"),
+        (
+            CandidateModel(first_name="test", last_name="test", email="test@"),
+            "Expected format: admin@example.com",
+        ),
+    ],
+)
+def test_candidate_validation(recruitment_page, candidate_data, error_message):
+    recruitment_page.click_add_candidate()
+    recruitment_page.fill_candidate_details(candidate_data)
+    recruitment_page.personal_info.click_save()
+
+    actual_text = AlertErrorElement(
+        recruitment_page.browser
+    ).get_input_field_text_alert()
+    assert actual_text == error_message
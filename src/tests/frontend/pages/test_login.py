@@ -41,6 +41,7 @@ def test_login_with_wrong_password(browser):
     text = alert.get_failure_text_alert()
     expected_text = "Invalid credentials"
     assert text == expected_text, f"Expected text is {expected_text}, but got {text}"
+    assert alert.is_input_field_alert_absent(), "Unexpected input field alert shown"
 
 
 @allure.title(
@@ -71,6 +72,7 @@ def test_login_without_mandatory_fields(browser, post_request):
     assert text == expected_alert_text, (
         f"Expected '{expected_alert_text}', but got '{text}'"
     )
+    assert alert.is_failure_alert_absent(), "Unexpected failure alert shown"
 
 
 @allure.title("Check the option of resetting password")
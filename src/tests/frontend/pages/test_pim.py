@@ -3,6 +3,7 @@ import pytest
 from faker import Faker
 
 from src.main.frontend.helper.config_helper import ConfigHelper
+from src.main.frontend.helper.worker_helper import WorkerHelper
 from src.main.frontend.model.pim_employee_model import PimEmployeeModel
 from src.main.frontend.pages.alert_element import AlertErrorElement
 from src.main.frontend.pages.login_page import LoginPage
@@ -38,8 +39,7 @@ def test_count_of_records(browser, login_as_admin, employment_status):
 def test_add_employee_without_creating_login_details(browser, login_as_admin):
     pim_page = login_as_admin
     pim_page.click_add_button()
-    pim_page.fill_personal_details(first=fake.first_name())
-    pim_page.fill_personal_details(last=fake.last_name())
+    pim_page.fill_personal_details(first=fake.first_name(), last=fake.last_name())
     pim_page.personal_info.click_save()
 
     actual_text = pim_page.get_pim_title()
@@ -49,15 +49,28 @@ def test_add_employee_without_creating_login_details(browser, login_as_admin):
     )
 
 
+@allure.title("Personal details of an employee seeded through the API")
+def test_view_seeded_employee(browser, login_as_admin, data_seeder):
+    pim_page = login_as_admin
+    employee = data_seeder.employee()
+
+    pim_page.open_personal_details(employee["empNumber"])
+
+    expected_name = f"{employee['firstName']} {employee['lastName']}"
+    assert pim_page.get_employee_full_name() == expected_name
+    assert pim_page.get_pim_title() == "Personal Details"
+
+
 @allure.title("Add employee to pim with creating login details")
 def test_add_employee_with_creating_login_details(browser, login_as_admin):
     pim_page = login_as_admin
     pim_page.click_add_button()
-    pim_page.fill_personal_details(first=fake.first_name())
-    pim_page.fill_personal_details(last=fake.last_name())
+    pim_page.fill_personal_details(first=fake.first_name(), last=fake.last_name())
     pim_page.click_create_login_details_button()
     password = fake.password()
-    pim_page.fill_login_details(fake.user_name(), password, password)
+    pim_page.fill_login_details(
+        WorkerHelper.unique(fake.user_name()), password, password
+    )
     pim_page.personal_info.click_save()
 
     actual_text = pim_page.get_pim_title()
@@ -26,23 +26,20 @@ def fill_candidate_details(recruitment_page, candidate_data: CandidateModel = No
     Fill candidate details using the provided candidate_data or Faker data if not provided.
     """
     if candidate_data:
-        if candidate_data.first_name:
-            recruitment_page.fill_personal_details(first=candidate_data.first_name)
-        else:
-            recruitment_page.fill_personal_details(first=fake.first_name())
-        if candidate_data.last_name:
-            recruitment_page.fill_personal_details(first=candidate_data.last_name)
-        else:
-            recruitment_page.fill_personal_details(last=fake.last_name())
-        if candidate_data.email:
-            recruitment_page.fill_personal_details(email=candidate_data.email)
-        else:
-            recruitment_page.fill_personal_details(email=fake.email())
+        candidate = CandidateModel(
+            first_name=candidate_data.first_name or fake.first_name(),
+            last_name=candidate_data.last_name or fake.last_name(),
+            email=candidate_data.email or fake.email(),
+        )
     else:
-        recruitment_page.fill_personal_details(first=fake.first_name())
-        recruitment_page.fill_personal_details(middle=fake.name())
-        recruitment_page.fill_personal_details(last=fake.last_name())
-        recruitment_page.fill_personal_details(email=fake.email())
+        candidate = CandidateModel(
+            first_name=fake.first_name(),
+            middle_name=fake.name(),
+            last_name=fake.last_name(),
+            email=fake.email(),
+        )
+    recruitment_page.fill_candidate_details(candidate)
+    if not candidate_data:
         recruitment_page.fill_application_date(fake.date())
 
 
@@ -54,6 +51,9 @@ def test_add_candidate_success(browser, login_as_admin):
     recruitment_page.select_candidate(role_name)
     fill_candidate_details(recruitment_page)
     recruitment_page.click_consent_checkbox()
+    assert AlertErrorElement(browser).is_input_field_alert_absent(), (
+        "Unexpected input field alert shown before saving"
+    )
     recruitment_page.personal_info.click_save()
 
     actual_text = recruitment_page.get_application_stage_title()
@@ -80,12 +80,7 @@ def test_candidate_creation_without_mandatory_fields(
     recruitment_page = login_as_admin
     recruitment_page.click_add_candidate()
 
-    if candidate_data.first_name:
-        recruitment_page.fill_personal_details(first=candidate_data.first_name)
-    if candidate_data.last_name:
-        recruitment_page.fill_personal_details(last=candidate_data.last_name)
-    if candidate_data.email:
-        recruitment_page.fill_personal_details(email=candidate_data.email)
+    recruitment_page.fill_candidate_details(candidate_data)
 
     recruitment_page.personal_info.click_save()
     alert = AlertErrorElement(browser)
@@ -102,8 +97,9 @@ def test_candidate_with_wrong_email_format(browser, login_as_admin):
     recruitment_page = login_as_admin
     recruitment_page.click_add_candidate()
 
-    recruitment_page.fill_personal_details(first=fake.first_name())
-    recruitment_page.fill_personal_details(last=fake.last_name())
+    recruitment_page.fill_personal_details(
+        first=fake.first_name(), last=fake.last_name()
+    )
     role_name = "Junior Account Assistant"
     recruitment_page.select_candidate(role_name)
     recruitment_page.fill_personal_details(email="test@")
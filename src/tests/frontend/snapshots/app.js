@@ -0,0 +1,87 @@
+// Minimal behaviour of the OrangeHRM snapshots served by the local fixture server.
+// Transitions are declared on the elements (data-href, data-show, data-hide, data-select),
+// form actions are run by the server on the current DOM, which answers with a new page or URL.
+(() => {
+    const nodes = (xpath) => {
+        if (!xpath) {
+            return [];
+        }
+        const result = document.evaluate(
+            xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        return Array.from({ length: result.snapshotLength }, (_, i) => result.snapshotItem(i));
+    };
+
+    const serialize = () => {
+        for (const input of document.querySelectorAll("input")) {
+            if (input.type === "checkbox") {
+                input.toggleAttribute("checked", input.checked);
+            } else {
+                input.setAttribute("value", input.value);
+            }
+        }
+        return document.documentElement.outerHTML;
+    };
+
+    const submit = async (form) => {
+        const response = await fetch(`/__fixture/action/${form.dataset.action}`, {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify({ url: location.href, html: serialize() }),
+        });
+        const result = await response.json();
+        if (result.location) {
+            location.assign(result.location);
+            return;
+        }
+        const page = new DOMParser().parseFromString(result.html, "text/html");
+        document.body.replaceWith(document.adoptNode(page.body));
+    };
+
+    const runTransitions = (node, event) => {
+        let handled = false;
+        for (const target of nodes(node.dataset.select)) {
+            target.textContent = node.textContent.trim();
+            handled = true;
+        }
+        for (const target of nodes(node.dataset.show)) {
+            target.hidden = false;
+            handled = true;
+        }
+        for (const target of nodes(node.dataset.hide)) {
+            target.hidden = true;
+            handled = true;
+        }
+        if (node.dataset.href) {
+            location.assign(node.dataset.href);
+            return true;
+        }
+        if (node.tagName === "A" && node.getAttribute("href")) {
+            return true;
+        }
+        if (node.tagName === "BUTTON" && node.type === "submit") {
+            const form = node.closest("form");
+            if (form && form.dataset.action) {
+                event.preventDefault();
+                submit(form);
+            }
+            return true;
+        }
+        return handled;
+    };
+
+    document.addEventListener("click", (event) => {
+        for (let node = event.target; node instanceof HTMLElement; node = node.parentElement) {
+            if (runTransitions(node, event)) {
+                return;
+            }
+        }
+    });
+    document.addEventListener("submit", (event) => {
+        event.preventDefault();
+        const form = event.target;
+        if (form.dataset.action) {
+            submit(form);
+        }
+    });
+})();